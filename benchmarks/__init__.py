@@ -0,0 +1,17 @@
+"""
+Benchmarks for the game's hot paths.
+
+Run a benchmark module from the game directory, for example:
+
+    python -m benchmarks.colors
+
+Importing this package sets up Django with the game's settings, so the
+benchmarks can import game modules that need them.
+"""
+
+import os
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "server.conf.settings")
+django.setup()
@@ -0,0 +1,41 @@
+"""
+Microbenchmark for hex/xterm colour conversion.
+
+Converts messages with a growing number of colour codes and reports the time
+per code. The conversion is a single pass, so the time per code should stay
+flat as messages grow; a quadratic conversion shows it growing with them.
+
+    python -m benchmarks.colors
+"""
+
+import timeit
+
+from utils import colors
+
+SIZES = (10, 100, 1000, 5000)
+_CHUNK = "|#ff8000fire |[#202020smoke |n"
+
+
+def _time(func, message, number):
+    return min(timeit.repeat(lambda: func(message), number=number, repeat=5))
+
+
+def run():
+    """Print the cost per colour code of an uncached conversion."""
+    print(f"{'codes':>8} {'hex_to_xterm':>16} {'xterm_to_hex':>16}")
+    for size in SIZES:
+        hex_message = _CHUNK * size
+        xterm_message = colors._hex_to_xterm(hex_message)
+        codes = size * 2
+        number = max(1, 20000 // size)
+        hex_ns = _time(colors._hex_to_xterm, hex_message, number)
+        xterm_ns = _time(colors._xterm_to_hex, xterm_message, number)
+        print(
+            f"{codes:>8} "
+            f"{hex_ns / number / codes * 1e9:>11.1f} ns/op "
+            f"{xterm_ns / number / codes * 1e9:>11.1f} ns/op"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,48 @@
+"""
+Text corpora for the benchmarks.
+
+Each corpus is a tuple of messages shaped like what the game sends: long
+room descriptions, short bursts of combat spam full of actor-stance calls,
+and descriptions dense with colour.
+"""
+
+ROOM_DESCRIPTIONS = (
+    "The road narrows as it climbs between two shoulders of black basalt. "
+    "Heat shimmers off the stone, and the air tastes of ash and iron. To the "
+    "north, a rope bridge sways over a ravine of smoldering vents, while the "
+    "path to the south winds back down towards the |ggreen|n terraces of "
+    "the lowland farms. Scorched banners hang from a ruined watchtower.",
+    "Rows of shelves sag beneath the weight of forgotten ledgers, their "
+    "spines cracked and faded. Dust drifts through a shaft of pale light "
+    "falling from a high window, settling on a reading desk where a candle "
+    "has burned down to a puddle of wax. A faint draft stirs the pages of "
+    "an open book, as if someone had only just stepped away.|/|/"
+    "A narrow staircase spirals down into darkness.",
+    "Waves crash against the hull of the |#3060a0Nautilus|n, spraying the "
+    "deck with cold brine. Ropes creak in the rigging overhead and gulls "
+    "wheel about the mainmast, crying out over the roar of the sea. Crates "
+    "lashed to the railings shift with every swell.",
+)
+
+COMBAT_SPAM = (
+    "$You() $conj(cleave) $you(target) with a fierce arc of $pron(your,pa) "
+    "battle axe.",
+    "$You() $conj(dodge) aside as $you(target) $conj(lunge) forward.",
+    "$You() $conj(stagger) back, clutching $pron(your,pa) wounded arm!",
+    "$You() $conj(parry) the blow and $conj(riposte) with a quick thrust.",
+    "$You() $conj(miss) $you(target) completely.",
+)
+
+HEAVY_COLOUR = (
+    "|#ff4500T|#ff6a00h|#ff8c00e |#ffa500f|#ffc200l|#ffd700a|#ffe135m"
+    "|#fff44fe|#e6ff4fs |#b3ff4fr|#80ff4fo|#4fff4fa|#4fff80r |#4fffb3u"
+    "|#4fffe6p|#4fe6ffw|#4fb3ffa|#4f80ffr|#4f4fffd|#804fffs|n, "
+    "|[#202020|#c0c0c0licking at the |#808080smoke-stained|n "
+    "|[#101010|#ffd700ceiling|n.",
+    "|r|[#300000Blood|n |Rpools|n |#8b0000beneath|n |#a52a2athe|n "
+    "|#b22222altar|n, |#dc143cglistening|n |#ff0000in|n |#ff6347the|n "
+    "|#ff7f50torchlight|n.",
+    "|#7fffd4S|#76eec6h|#66cdaaa|#5f9ea0r|#4682b4d|#4169e1s |#0000ffo"
+    "|#0000cdf |#00008bi|#191970c|#483d8be|n |#6a5acdglimmer|n "
+    "|#7b68eein|n |#9370dbthe|n |#8a2be2dark|n.",
+)
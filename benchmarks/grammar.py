@@ -0,0 +1,31 @@
+"""
+Benchmark for grammarize on typical chat lines.
+
+    python -m benchmarks.grammar
+"""
+
+import timeit
+
+from utils.text import grammarize
+
+CHAT_LINES = (
+    "i dont think thats a good idea , do you ?",
+    "hello there. how are you doing today",
+    "im going to the market to buy a apple and a orange",
+    "Wait... what was that",
+    "cant stop now  , theyre right behind us !",
+    "ok",
+)
+
+
+def run(number=20000):
+    """Print the cost of grammarizing each chat line."""
+    for line in CHAT_LINES:
+        seconds = min(
+            timeit.repeat(lambda: grammarize(line), number=number, repeat=5)
+        )
+        print(f"{seconds / number * 1e9:>10.0f} ns/op  {line!r}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,185 @@
+"""
+Text pipeline benchmark suite.
+
+Pushes the corpora in `benchmarks.corpora` through each stage of the output
+path and through the full chain, and reports the cost of each in ns/op (one
+op being one message through the stage). Caches are bypassed, so the numbers
+are the cost of doing the work rather than of looking it up.
+
+    python -m benchmarks.pipeline            # report
+    python -m benchmarks.pipeline --check    # compare with thresholds.json
+    python -m benchmarks.pipeline --update   # rewrite thresholds.json
+
+The thresholds are machine-dependent. Record them on the machine you compare
+on, then run `--check` after a change to catch stages that got slower.
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+from typeclasses.objects import PARSER
+from utils import colors, text
+
+from .corpora import COMBAT_SPAM, HEAVY_COLOUR, ROOM_DESCRIPTIONS
+
+THRESHOLDS_FILE = Path(__file__).with_name("thresholds.json")
+
+# allowed slowdown over a threshold before --check fails
+TOLERANCE = 0.25
+
+# headroom given to measured timings when writing new thresholds
+HEADROOM = 1.5
+
+NUMBER = 200
+REPEAT = 5
+
+
+class Actor:
+    """A bare actor for actor-stance calls, with no database behind it."""
+
+    def __init__(self, key, gender="neutral"):
+        self.key = key
+        self.gender = gender
+
+    def get_display_name(self, looker=None, **kwargs):
+        return self.key
+
+
+CALLER = Actor("Aria", "female")
+RECEIVER = Actor("Brom", "male")
+MAPPING = {"target": RECEIVER}
+
+
+def parse(message):
+    return PARSER.parse(
+        message,
+        caller=CALLER,
+        receiver=RECEIVER,
+        mapping=MAPPING,
+        return_string=True,
+    )
+
+
+def wrap(message):
+    return text._wrap(message, 80, "", "l", 0, 0)
+
+
+def chain(message):
+    """The path of a message from Object.msg to a telnet client."""
+    return colors._hex_to_xterm(wrap(text.grammarize(parse(message))))
+
+
+def web_chain(message):
+    """The path of a message from Object.msg to the webclient."""
+    return colors.ev_to_html(wrap(text.grammarize(parse(message))))
+
+
+STAGES = (
+    ("funcparser", parse),
+    ("grammarize", text.grammarize),
+    ("wrap", wrap),
+    ("extract_color_codes", text.extract_color_codes),
+    ("hex_to_xterm", colors._hex_to_xterm),
+    ("ev_to_html", colors.ev_to_html),
+    ("chain", chain),
+    ("web_chain", web_chain),
+)
+
+CORPORA = (
+    ("rooms", ROOM_DESCRIPTIONS),
+    ("combat", COMBAT_SPAM),
+    ("colour", HEAVY_COLOUR),
+)
+
+
+def measure(func, corpus, number=NUMBER, repeat=REPEAT):
+    """
+    Time a stage over a corpus.
+
+    Returns:
+        float: The best time per message, in nanoseconds.
+    """
+
+    def run():
+        for message in corpus:
+            func(message)
+
+    best = min(timeit.repeat(run, number=number, repeat=repeat))
+    return best / number / len(corpus) * 1e9
+
+
+def run_all(number=NUMBER, repeat=REPEAT):
+    """
+    Time every stage over every corpus.
+
+    Returns:
+        dict: ns/op keyed by "stage/corpus".
+    """
+    return {
+        f"{stage}/{corpus}": measure(func, messages, number, repeat)
+        for stage, func in STAGES
+        for corpus, messages in CORPORA
+    }
+
+
+def load_thresholds(path=THRESHOLDS_FILE):
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def check(results, thresholds, tolerance=TOLERANCE):
+    """
+    Compare results with their thresholds.
+
+    Returns:
+        list: The (name, ns/op, threshold) of every regression.
+    """
+    return [
+        (name, value, thresholds[name])
+        for name, value in results.items()
+        if name in thresholds and value > thresholds[name] * (1 + tolerance)
+    ]
+
+
+def main(argv=None):
+    args = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    args.add_argument("--check", action="store_true")
+    args.add_argument("--update", action="store_true")
+    args.add_argument("--number", type=int, default=NUMBER)
+    args = args.parse_args(argv)
+
+    results = run_all(number=args.number)
+    thresholds = load_thresholds()
+    for name, value in results.items():
+        limit = thresholds.get(name)
+        limit = f"{limit:>12.0f}" if limit else f"{'-':>12}"
+        print(f"{name:<32} {value:>12.0f} ns/op {limit}")
+
+    if args.update:
+        THRESHOLDS_FILE.write_text(
+            json.dumps(
+                {
+                    name: round(value * HEADROOM, -1)
+                    for name, value in results.items()
+                },
+                indent=4,
+            )
+            + "\n"
+        )
+        print(f"Wrote {THRESHOLDS_FILE}")
+
+    if args.check:
+        if regressions := check(results, thresholds):
+            for name, value, limit in regressions:
+                print(f"REGRESSION {name}: {value:.0f} ns/op > {limit:.0f}")
+            return 1
+        print("No regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
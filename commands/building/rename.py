@@ -103,6 +103,14 @@ class CmdRename(ObjManipCommand):
             if obj.destination:
                 obj.flush_from_cache(force=True)
 
+            # a worn item's new name must show up in its wearer's appearance
+            if obj.location and (
+                invalidate := getattr(
+                    obj.location.appearance, "invalidate_worn_cache", None
+                )
+            ):
+                invalidate()
+
             type = obj.typeclass_path.split(".")[-1] or "Object"
             caller.msg(f"{type} {obj_name} renamed to {new_name}{astring}.")
             obj.msg(f"You've been renamed to {new_name}{astring}.")
@@ -80,6 +80,7 @@ class CmdCover(Command):
 
         obj.covered_by.append(cover)
         cover.covering.append(obj)
+        caller.appearance.invalidate_worn_cache()
         caller.location.msg_contents(
             f"$You() $conj(cover) {obj.get_display_name(caller)} with {cover.get_display_name(caller)}.",
             from_obj=caller,
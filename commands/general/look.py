@@ -18,6 +18,8 @@ class CmdLook(general.CmdLook):
             look in <container>
 
     Observes your location or objects in your vicinity.
+
+    Builders may use look/debug to see render statistics.
     """
 
     rhs_split = (" in ",)
@@ -64,7 +66,10 @@ class CmdLook(general.CmdLook):
             target = caller.search(self.args, return_type=SearchReturnType.ONE)
             if not target:
                 return
-        desc = caller.at_look(target)
+        debug = "debug" in self.switches and caller.check_permstring(
+            "Builder"
+        )
+        desc = caller.at_look(target, debug=debug)
         # add the type=look to the outputfunc to make it
         # easy to separate this output in client.
         self.msg(text=(desc, {"type": "look"}), options=None)
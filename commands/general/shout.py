@@ -1,10 +1,9 @@
-from evennia.utils.funcparser import ACTOR_STANCE_CALLABLES, FuncParser
-
 from commands.command import Command
-from typeclasses.characters import Character
+from handlers.online import ONLINE
+from typeclasses.objects import compile_message
 from utils.text import wrap
 
-PARSER = FuncParser(ACTOR_STANCE_CALLABLES)
+SHOUT_PREFIX = compile_message('$You() $conj(shout), "')
 
 
 class CmdShout(Command):
@@ -27,10 +26,7 @@ class CmdShout(Command):
         if not args:
             return caller.msg("Shout what?")
 
-        chars = [char for char in Character.objects.all() if char.is_connected]
-        for char in chars:
-            pre_text = PARSER.parse(
-                '$You() $conj(shout), "', caller=caller, receiver=char
-            )
+        for char in ONLINE.all():
+            pre_text = SHOUT_PREFIX.render(caller=caller, receiver=char)
             message = "|r" + wrap(args + '"', pre_text=pre_text)
             char.msg(message)
@@ -36,6 +36,7 @@ class CmdUncover(Command):
         for cover in obj.covered_by:
             cover.covering.remove(obj)
             obj.covered_by.remove(cover)
+            caller.appearance.invalidate_worn_cache()
 
             caller.location.msg_contents(
                 f"$You() $conj(uncover) {obj.get_display_name(caller)} from beneath {cover.get_display_name(caller)}.",
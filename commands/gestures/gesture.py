@@ -1,5 +1,9 @@
 from commands.command import Command
-from commands.gestures.gestures import _GESTURES, GESTURE
+from commands.gestures.gestures import (
+    _COMPILED_GESTURES,
+    _GESTURES,
+    GESTURE,
+)
 
 
 class CmdGesture(Command):
@@ -36,7 +40,7 @@ class CmdGesture(Command):
                 return
 
         caller.location.msg_contents(
-            _GESTURES[self.cmdstring][gesture_type],
+            _COMPILED_GESTURES[self.cmdstring][gesture_type],
             from_obj=caller,
             mapping={"target": target}
             if gesture_type == GESTURE.TARGET
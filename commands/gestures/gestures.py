@@ -1,6 +1,7 @@
 from enum import Enum
 
 from commands.command import Command
+from typeclasses.objects import compile_message
 
 
 class GESTURE(Enum):
@@ -193,6 +194,16 @@ _GESTURES = {
 }
 
 
+# Compiled once at import, so performing a gesture doesn't parse its template.
+_COMPILED_GESTURES = {
+    gesture: {
+        gesture_type: compile_message(template)
+        for gesture_type, template in templates.items()
+    }
+    for gesture, templates in _GESTURES.items()
+}
+
+
 class CmdGestures(Command):
     """
     This command displays a list of available gestures to the caller.
@@ -0,0 +1,152 @@
+"""
+Ambient room messages.
+
+Rooms may have a list of `room_messages` that are echoed at random every
+`room_message_rate` seconds. Rather than one ticker per room, a single
+scheduler keeps a heap of due times for the rooms that currently hold a
+puppeted character. Empty rooms are never scheduled, so a zone of thousands
+of rooms costs nothing until someone walks into it.
+
+The scheduler is told about occupancy by the room hooks `at_object_receive`
+and `at_object_leave` and by the puppet hooks on objects. It is rebuilt from
+the "puppeted" tags when the server starts.
+"""
+
+import heapq
+import random
+
+from evennia.utils.search import search_tag
+from twisted.internet import reactor
+
+# Each interval is randomly stretched or shrunk by up to this fraction, so
+# rooms sharing a rate don't all speak in the same instant.
+AMBIENT_JITTER = 0.25
+
+
+class AmbientScheduler:
+    """
+    Schedules ambient broadcasts for occupied rooms.
+
+    Args:
+        clock (IReactorTime, optional): The clock to schedule on. Defaults to
+            the twisted reactor; tests may pass a `twisted.internet.task.Clock`.
+        rng (random.Random, optional): Source of jitter.
+
+    Attributes:
+        stats (dict): Counters of broadcasts sent and stale entries dropped.
+    """
+
+    def __init__(self, clock=None, rng=None):
+        self.clock = clock or reactor
+        self.rng = rng or random.Random()
+        self.stats = {"broadcasts": 0, "dropped": 0}
+        self._heap = []
+        self._occupied = {}
+        self._scheduled = set()
+        self._call = None
+
+    # === Occupancy ===
+    def update(self, room, exclude=None):
+        """
+        Recheck whether anyone is present to hear a room.
+
+        Args:
+            room (Room): The room to check.
+            exclude (Object, optional): An object to ignore, such as one that
+                is in the middle of leaving.
+        """
+        if any(
+            obj.has_account for obj in room.contents if obj != exclude
+        ):
+            self.add(room)
+        else:
+            self.discard(room)
+
+    def add(self, room):
+        """Mark a room as occupied, scheduling its next broadcast."""
+        self._occupied[room.id] = room
+        self._schedule(room)
+
+    def discard(self, room):
+        """
+        Mark a room as empty. Its pending heap entry is dropped when due.
+        """
+        self._occupied.pop(room.id, None)
+
+    def is_occupied(self, room):
+        """Whether the scheduler considers a room occupied."""
+        return room.id in self._occupied
+
+    def occupied(self):
+        """Get a list of the rooms currently considered occupied."""
+        return list(self._occupied.values())
+
+    def rebuild(self):
+        """
+        Rebuild occupancy from all characters tagged as puppeted.
+
+        Notes:
+            Sessions aren't synced back yet when the server starts after a
+            reload, so the puppeted tags are trusted over `has_account`, as
+            in `OnlineIndex.rebuild`.
+        """
+        self._occupied.clear()
+        for character in search_tag("puppeted", category="account"):
+            if character.location:
+                self.add(character.location)
+
+    # === Scheduling ===
+    def _interval(self, rate):
+        """Get a jittered interval around the given rate."""
+        return rate * self.rng.uniform(1 - AMBIENT_JITTER, 1 + AMBIENT_JITTER)
+
+    def _schedule(self, room):
+        """Push the room's next broadcast onto the heap, if it has any."""
+        if room.id in self._scheduled:
+            return
+
+        appearance = room.appearance
+        rate = getattr(appearance, "room_message_rate", 0)
+        if not (rate and getattr(appearance, "room_messages", None)):
+            return
+
+        when = self.clock.seconds() + self._interval(rate)
+        heapq.heappush(self._heap, (when, room.id))
+        self._scheduled.add(room.id)
+        self._wake()
+
+    def _wake(self):
+        """Make sure the timer fires for the earliest entry on the heap."""
+        if not self._heap:
+            return
+
+        when = self._heap[0][0]
+        if self._call and self._call.active():
+            if self._call.getTime() <= when:
+                return
+            self._call.cancel()
+
+        delay = max(0, when - self.clock.seconds())
+        self._call = self.clock.callLater(delay, self._fire)
+
+    def _fire(self):
+        """Broadcast in every due room and reschedule those still occupied."""
+        self._call = None
+        now = self.clock.seconds()
+        while self._heap and self._heap[0][0] <= now:
+            _, room_id = heapq.heappop(self._heap)
+            self._scheduled.discard(room_id)
+
+            room = self._occupied.get(room_id)
+            if room is None:
+                self.stats["dropped"] += 1
+                continue
+
+            room.appearance.broadcast_message()
+            self.stats["broadcasts"] += 1
+            self._schedule(room)
+
+        self._wake()
+
+
+AMBIENT = AmbientScheduler()
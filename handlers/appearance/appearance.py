@@ -3,12 +3,7 @@ from collections import defaultdict
 from evennia.utils import dbserialize
 from evennia.utils.utils import compress_whitespace, iter_to_str
 
-from utils.text import (
-    _INFLECT,
-    extract_color_codes,
-    extract_id_suffix,
-    reapply_color_codes,
-)
+from utils.text import extract_id_suffix, numbered_names
 
 APPEARANCE_TEMPLATE = "{desc}\n\n{characters}\n{things}"
 
@@ -227,34 +222,15 @@ class AppearanceHandler:
             - Handles special cases like "pairs of X"
             - Preserves color codes in the formatted string
             - Can override the base key via the 'key' kwarg
+            - Name forms are memoized by `utils.text.numbered_names`
         """
         key = kwargs.get("key", self.get_display_name(looker))
         key, id_suffix = extract_id_suffix(key)
-        clean_key, colors = extract_color_codes(key)
-        no_article = kwargs.get("no_article", False)
-
-        is_pair = bool(_INFLECT.singular_noun(clean_key))
-
-        if is_pair:
-            clean_singular = clean_key
-            prefix = f"{_INFLECT.number_to_words(count)} pairs of "
-            clean_plural = prefix + clean_key
-        else:
-            clean_singular = (
-                _INFLECT.an(clean_key) if not no_article else clean_key
-            )
-            prefix = f"{_INFLECT.number_to_words(count)} "
-            clean_plural = prefix + _INFLECT.plural(clean_key, count)
-
-        singular = (
-            reapply_color_codes(
-                clean_singular, colors, len(clean_singular) - len(clean_key)
-            )
-            + id_suffix
-        )
-        plural = (
-            reapply_color_codes(clean_plural, colors, len(prefix)) + id_suffix
+        singular, plural = numbered_names(
+            key, count, kwargs.get("no_article", False)
         )
+        singular += id_suffix
+        plural += id_suffix
 
         return (
             (singular, plural)
@@ -15,6 +15,9 @@ EQUIPMENT_HEADER = "|wEquipment:|n"
 CLOTHING_HEADER = "|wClothing:|n"
 HIDDEN_SUFFIX = " |x(hidden)|n"
 
+# view locks that let everyone see an item, so it looks the same to all
+OPEN_VIEW_LOCKS = ("", "view:all()")
+
 CONDITION_MAP = {
     0: "They are |xlifeless|n.",
     1: "They are |#ff0000barely clinging to life|n.",
@@ -48,6 +51,11 @@ class LivingAppearanceHandler(AppearanceHandler):
     rules where certain items may be hidden by others or not visible to certain
     observers.
 
+    Rendered equipment and clothing blocks are cached per permission view and
+    must be invalidated (see `invalidate_worn_cache`) whenever what is worn,
+    what covers what, or a worn item's name changes. While any worn item has
+    a view lock of its own, the blocks are rendered for every look instead.
+
     Attributes:
         obj (Object): The game object this handler is attached to
 
@@ -56,6 +64,53 @@ class LivingAppearanceHandler(AppearanceHandler):
             appearance = entity.appearance.return_appearance(observer)
     """
 
+    def __init__(self, obj, *args, **kwargs):
+        super().__init__(obj, *args, **kwargs)
+        self._worn_cache = {}
+
+    def invalidate_worn_cache(self):
+        """Forget all cached equipment and clothing blocks."""
+        self._worn_cache.clear()
+
+    def _get_worn_view(self, looker):
+        """Get the cache key for what the looker is allowed to see.
+
+        Args:
+            looker (Object): The entity observing the items
+
+        Returns:
+            bool: Whether the looker is a builder, who sees item #ids.
+        """
+        return bool(
+            looker and self.obj.locks.check_lockstring(looker, "perm(Builder)")
+        )
+
+    def _has_view_locks(self):
+        """Whether any worn item has a view lock that may hide it from some."""
+        return any(
+            item.locks.get("view") not in OPEN_VIEW_LOCKS
+            for item in (*self.obj.equipment.all(), *self.obj.clothing.all())
+        )
+
+    def _get_cached_block(self, block, looker, render):
+        """Get a rendered worn-item block, rendering it on a cache miss.
+
+        Args:
+            block (str): The block name, "equipment" or "clothing"
+            looker (Object): The entity observing the items
+            render (callable): Renders the block when it is not cached
+
+        Returns:
+            str: The rendered block
+        """
+        if self._has_view_locks():
+            return render()
+
+        key = (block, self._get_worn_view(looker))
+        if key not in self._worn_cache:
+            self._worn_cache[key] = render()
+        return self._worn_cache[key]
+
     def get_display_condition(self, looker, **kwargs):
         """Get the display text for the entity's current health condition.
 
@@ -118,9 +173,12 @@ class LivingAppearanceHandler(AppearanceHandler):
         Returns:
             str: Formatted string showing all visible equipment
         """
-        equipment = self._filter_visible(looker, self.obj.equipment.all())
-        result = self._format_worn_items(looker, equipment, EQUIPMENT_HEADER)
-        return f"{result}" if result else ""
+
+        def render():
+            equipment = self._filter_visible(looker, self.obj.equipment.all())
+            return self._format_worn_items(looker, equipment, EQUIPMENT_HEADER)
+
+        return self._get_cached_block("equipment", looker, render)
 
     def get_display_clothing(self, looker, **kwargs):
         """Get the display text for all visible clothing worn by the entity.
@@ -132,11 +190,15 @@ class LivingAppearanceHandler(AppearanceHandler):
         Returns:
             str: Formatted string showing all visible clothing
         """
-        clothing = self._filter_visible(looker, self.obj.clothing.all())
-        result = self._format_worn_items(looker, clothing, CLOTHING_HEADER)
-        has_equipment = bool(self.obj.equipment.all())
-        prefix = "\n\n" if has_equipment else ""
-        return f"{prefix}{result}" if result else ""
+
+        def render():
+            clothing = self._filter_visible(looker, self.obj.clothing.all())
+            result = self._format_worn_items(looker, clothing, CLOTHING_HEADER)
+            has_equipment = bool(self.obj.equipment.all())
+            prefix = "\n\n" if has_equipment else ""
+            return f"{prefix}{result}" if result else ""
+
+        return self._get_cached_block("clothing", looker, render)
 
     def return_appearance(self, looker, **kwargs):
         """Return the complete appearance description of the entity.
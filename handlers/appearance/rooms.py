@@ -1,13 +1,18 @@
-import datetime
 import random
 import re
 from collections import defaultdict, deque
 
-from evennia import FuncParser, gametime
+from django.conf import settings
+from evennia import FuncParser
 from evennia.utils import dbserialize
-from evennia.utils.utils import dedent, iter_to_str, repeat
+from evennia.utils.utils import dedent, iter_to_str
 
+from handlers.ambient import AMBIENT
 from handlers.appearance.appearance import AppearanceHandler
+from handlers.gameclock import GAME_CLOCK, SEASONS, TIMES_OF_DAY
+from handlers.zones import ZONE_STATES, get_zone
+from utils.funcparser import compile_template
+from utils.prefetch import prefetch
 
 ROOM_APPEARANCE_TEMPLATE = dedent(
     """
@@ -21,6 +26,12 @@ ROOM_APPEARANCE_TEMPLATE = dedent(
     """
 )
 
+# Maximum number of rendered (name, desc) headers kept per room.
+RENDER_CACHE_SIZE = 32
+
+# Content types sorted into their own bucket when classifying room contents.
+CONTENT_BUCKETS = ("exit", "character", "mob", "object")
+
 ROOM_DARK_APPEARANCE_TEMPLATE = dedent(
     """
     {name}
@@ -30,6 +41,54 @@ ROOM_DARK_APPEARANCE_TEMPLATE = dedent(
 )
 
 
+def func_state(roomstate, *args, looker=None, room=None, **kwargs):
+    """
+    Usage: $state(roomstate, text)
+
+    Funcparser callable for room descriptions. This is called by the FuncParser
+    when it returns the description of the room. Use 'default' for a default
+    text when no other states are set.
+
+    Args:
+        roomstate (str): A roomstate, like "morning", "raining". This is case insensitive.
+        *args: All these will be combined into one string separated by commas.
+
+    Keyword Args:
+        looker (Object): The object looking at the room. Unused by default.
+        room (RoomAppearanceHandler): The appearance of the room being looked at.
+
+    Example:
+        $state(morning, It is a beautiful morning!)
+    """
+    roomstate = str(roomstate).lower()
+    text = ", ".join(args)
+    # make sure we have a room and a caller and not something parsed from the string
+    if (
+        not (roomstate and looker and room)
+        or isinstance(looker, str)
+        or isinstance(room, str)
+    ):
+        return ""
+
+    try:
+        if (
+            roomstate in room.active_states
+            or roomstate == room.get_time_of_day()
+        ):
+            return text
+        if roomstate == "default" and not room.active_states:
+            # return this if no roomstate is set
+            return text
+    except AttributeError:
+        # maybe used on a non-room appearance?
+        pass
+    return ""
+
+
+# Shared by all rooms; looker and room are passed at render time.
+STATE_PARSER = FuncParser({"state": func_state})
+
+
 class RoomAppearanceHandler(AppearanceHandler):
     """
     A comprehensive handler for managing room appearances in Evennia.
@@ -45,6 +104,7 @@ class RoomAppearanceHandler(AppearanceHandler):
     - Automated room messages (periodic broadcasts)
     - Object grouping (for displaying multiple similar items)
     - Coordinate display for builders
+    - A per-room cache of the rendered name and description
 
     The handler supports:
     - State-based descriptions using $state() markup
@@ -74,31 +134,19 @@ class RoomAppearanceHandler(AppearanceHandler):
     def __init__(self, obj):
         super().__init__(obj)
 
-        # Time constants
-        self._months_per_year = 12
-        self._hours_per_day = 24
-
-        # Time period mappings using integer ranges for efficiency
-        self._seasons_per_year = {
-            "spring": (3, 6),
-            "summer": (6, 9),
-            "autumn": (9, 12),
-            "winter": (12, 3),
-        }
-
-        self._times_of_day = {
-            "night": (0, 6),
-            "morning": (6, 12),
-            "afternoon": (12, 18),
-            "evening": (18, 24),
-        }
+        # Time period mappings, shared with the game clock
+        self._seasons_per_year = SEASONS
+        self._times_of_day = TIMES_OF_DAY
 
         # Initialize room state
         self.details = {}
         self.room_messages = []
         self.room_message_rate = 0
-        self.broadcast_repeat_task = None
         self.room_states = []
+        self._render_cache = {}
+        self._render_generation = GAME_CLOCK.generation
+        self._contents_buckets = None
+        self.render_stats = {}
 
         self._load()
 
@@ -112,11 +160,11 @@ class RoomAppearanceHandler(AppearanceHandler):
             self.details = data.get("details", {})
             self.room_messages = data.get("room_messages", [])
             self.room_message_rate = data.get("room_message_rate", 0)
-            self.broadcast_repeat_task = data.get("broadcast_repeat_task", None)
             self.room_states = data.get("room_states", [])
             self.senses = data.get("senses", {})
 
     def _save(self):
+        self.invalidate_render_cache()
         self.obj.attributes.add(
             self._db_attribute,
             {
@@ -124,7 +172,6 @@ class RoomAppearanceHandler(AppearanceHandler):
                 "details": self.details,
                 "room_messages": self.room_messages,
                 "room_message_rate": self.room_message_rate,
-                "broadcast_repeat_task": self.broadcast_repeat_task,
                 "senses": self.senses,
             },
             category=self._db_category,
@@ -152,18 +199,39 @@ class RoomAppearanceHandler(AppearanceHandler):
     @property
     def is_dark(self):
         """Whether the room is in darkness."""
-        return bool(self.obj.tags.get("dark", category="room_state"))
+        return bool(
+            self.obj.tags.get("dark", category="room_state")
+            or "dark" in self.zone_states
+        )
 
     @property
     def is_magical_dark(self):
         """Whether the room is in magical darkness."""
-        return bool(self.obj.tags.get("magical_dark", category="room_state"))
+        return bool(
+            self.obj.tags.get("magical_dark", category="room_state")
+            or "magical_dark" in self.zone_states
+        )
 
     @property
     def states(self):
         """List of current room states."""
         return self.room_states.copy()
 
+    @property
+    def zone_states(self):
+        """States applied to the room's whole zone."""
+        return ZONE_STATES.get(get_zone(self.obj))
+
+    @property
+    def active_states(self):
+        """The room's own states followed by any further zone states."""
+        zone_states = self.zone_states
+        if not zone_states:
+            return self.room_states
+        return self.room_states + [
+            state for state in zone_states if state not in self.room_states
+        ]
+
     @property
     def messages(self):
         """List of room broadcast messages."""
@@ -215,14 +283,14 @@ class RoomAppearanceHandler(AppearanceHandler):
             str: The room's current description text.
 
         Notes:
-            Description priority order:
+            Zone states count as room states here. Description priority order:
             1. Active non-seasonal room states
             2. Active seasonal states
             3. Current season
             4. Default description
             5. Fallback description ("You see nothing special.")
         """
-        room_states = self.room_states
+        room_states = self.active_states
         seasons = self._seasons_per_year.keys()
         seasonal_states = []
 
@@ -290,15 +358,10 @@ class RoomAppearanceHandler(AppearanceHandler):
                 "afternoon" (12-18), or "evening" (18-24)
 
         Notes:
-            Uses server's game time configuration for calculations.
+            Read from the shared game clock, which recomputes it at most
+            once per game-minute.
         """
-        timestamp = gametime.gametime(absolute=True)
-        hour = datetime.datetime.fromtimestamp(timestamp).hour
-
-        for time_of_day, (start, end) in self._times_of_day.items():
-            if start < end and start <= hour < end:
-                return time_of_day
-        return time_of_day
+        return GAME_CLOCK.time_of_day
 
     def get_season(self):
         """
@@ -309,15 +372,10 @@ class RoomAppearanceHandler(AppearanceHandler):
                 "autumn" (9-12), or "winter" (12-3)
 
         Notes:
-            Uses server's game time configuration for calculations.
+            Read from the shared game clock, which recomputes it at most
+            once per game-minute.
         """
-        timestamp = gametime.gametime(absolute=True)
-        month = datetime.datetime.fromtimestamp(timestamp).month
-
-        for season, (start, end) in self._seasons_per_year.items():
-            if start < end and start <= month < end:
-                return season
-        return season
+        return GAME_CLOCK.season
 
     def replace_legacy_time_of_day_markup(self, desc):
         """
@@ -424,7 +482,9 @@ class RoomAppearanceHandler(AppearanceHandler):
             else:
                 return None
 
-        return self._get_funcparser(looker).parse(detail) if detail else None
+        return (
+            self._parse_state_markup(detail, looker) if detail else None
+        )
 
     # === Message Broadcasting ===
     def start_broadcast_messages(self, rate=None):
@@ -436,24 +496,16 @@ class RoomAppearanceHandler(AppearanceHandler):
                 Uses existing rate if None.
 
         Notes:
-            - Only starts if messages exist and no broadcast is running
             - Saves the new rate if provided
+            - Broadcasts are run by the shared ambient scheduler, and only
+              while a puppeted character is in the room to hear them
             - Messages are chosen randomly from the message list
         """
         if rate:
             self.room_message_rate = rate
 
-        if (
-            self.room_message_rate
-            and self.room_messages
-            and not self.broadcast_repeat_task
-        ):
-            self.broadcast_repeat_task = repeat(
-                self.room_message_rate,
-                self.broadcast_message,
-                persistent=False,
-            )
         self._save()
+        AMBIENT.update(self.obj)
 
     def broadcast_message(self):
         """Broadcast a random room message"""
@@ -461,54 +513,10 @@ class RoomAppearanceHandler(AppearanceHandler):
             self.obj.msg_contents(random.choice(self.room_messages))
 
     # === Display Formatting Helpers ===
-    def _func_state(self, roomstate, *args, looker=None, room=None, **kwargs):
-        """
-        Usage: $state(roomstate, text)
-
-        Funcparser callable for ExtendedRoom. This is called by the FuncParser when it
-        returns the description of the room. Use 'default' for a default text when no
-        other states are set.
-
-        Args:
-            roomstate (str): A roomstate, like "morning", "raining". This is case insensitive.
-            *args: All these will be combined into one string separated by commas.
-
-        Keyword Args:
-            looker (Object): The object looking at the room. Unused by default.
-            room (ExtendedRoom): The room being looked at.
-
-        Example:
-            $state(morning, It is a beautiful morning!)
-        """
-        roomstate = str(roomstate).lower()
-        text = ", ".join(args)
-        # make sure we have a room and a caller and not something parsed from the string
-        if (
-            not (roomstate and looker and room)
-            or isinstance(looker, str)
-            or isinstance(room, str)
-        ):
-            return ""
-
-        try:
-            if (
-                roomstate in room.room_states
-                or roomstate == room.get_time_of_day()
-            ):
-                return text
-            if roomstate == "default" and not room.room_states:
-                # return this if no roomstate is set
-                return text
-        except AttributeError:
-            # maybe used on a non-ExtendedRoom?
-            pass
-        return ""
-
-    def _get_funcparser(self, looker):
-        return FuncParser(
-            {"state": self._func_state},
-            looker=looker,
-            room=self.obj,
+    def _parse_state_markup(self, text, looker, **kwargs):
+        """Render $state() markup in text through the shared, compiled parser."""
+        return compile_template(text, STATE_PARSER).render(
+            looker=looker, room=self, **kwargs
         )
 
     def _filter_visible(self, looker, obj_list):
@@ -519,6 +527,48 @@ class RoomAppearanceHandler(AppearanceHandler):
             if obj != looker and obj.access(looker, "view")
         ]
 
+    def _classify_contents(self, looker):
+        """
+        Sort the room's contents into visible exits, characters, mobs and
+        objects in a single pass, checking each view lock only once.
+
+        Args:
+            looker (Object): The object viewing the room
+
+        Returns:
+            tuple: A dict mapping each of CONTENT_BUCKETS to the visible
+                objects of that type, and the set of types present in the
+                room at all (excluding the looker, ignoring visibility).
+
+        Notes:
+            While `return_appearance` runs, the result is memoized for the
+            looker, so every component shares the same pass.
+        """
+        if self._contents_buckets and self._contents_buckets[0] is looker:
+            return self._contents_buckets[1:]
+
+        buckets = {content_type: [] for content_type in CONTENT_BUCKETS}
+        present = set()
+        lock_checks = 0
+        for obj in self.obj.contents:
+            if obj == looker:
+                continue
+            content_types = [
+                content_type
+                for content_type in getattr(obj, "_content_types", ())
+                if content_type in buckets
+            ]
+            if not content_types:
+                continue
+            present.update(content_types)
+            lock_checks += 1
+            if obj.access(looker, "view"):
+                for content_type in content_types:
+                    buckets[content_type].append(obj)
+
+        self.render_stats = {"lock_checks": lock_checks}
+        return buckets, present
+
     def _group_objects(self, objects, looker, **kwargs):
         """Group objects by their display name and count occurrences."""
         grouped = defaultdict(list)
@@ -538,6 +588,71 @@ class RoomAppearanceHandler(AppearanceHandler):
             names.append(singular if count == 1 else plural)
         return "\n".join(names)
 
+    # === Render Cache ===
+    def invalidate_render_cache(self):
+        """Drop all cached room headers, forcing the next look to re-render."""
+        self._render_cache.clear()
+
+    def _get_client_width(self, looker, **kwargs):
+        """Get the screen width of the looker's client."""
+        if width := kwargs.get("width"):
+            return width
+        sessions = looker.sessions.all() if looker else None
+        if sessions:
+            return sessions[0].get_client_size()[0]
+        return settings.CLIENT_DEFAULT_WIDTH
+
+    def get_display_header(self, looker, **kwargs):
+        """
+        Get the rendered name and description of the room, using the cache.
+
+        Args:
+            looker (Object): The object viewing the room
+            **kwargs: Additional parameters passed through
+
+        Returns:
+            tuple: The (name, desc) display strings.
+
+        Notes:
+            - Cached per (room and zone states, builder view, client
+              width, display name and, for builders, coordinates), so the
+              FuncParser only runs when one changes
+            - The cache is cleared whenever the handler saves (description,
+              detail and state edits) and when the game clock's time of day
+              or season flips
+        """
+        GAME_CLOCK.refresh()
+        if self._render_generation != GAME_CLOCK.generation:
+            self.invalidate_render_cache()
+            self._render_generation = GAME_CLOCK.generation
+
+        is_builder = bool(
+            looker and self.obj.locks.check_lockstring(looker, "perm(Builder)")
+        )
+        key = (
+            tuple(self.active_states),
+            is_builder,
+            self._get_client_width(looker, **kwargs),
+            self.display_name,
+            self._get_coordinates() if is_builder else None,
+        )
+        if (header := self._render_cache.get(key)) is None:
+            if len(self._render_cache) >= RENDER_CACHE_SIZE:
+                self._render_cache.clear()
+            header = self._render_cache[key] = (
+                self.get_display_name(looker, **kwargs),
+                self.get_display_desc(looker, **kwargs),
+            )
+        return header
+
+    def _get_coordinates(self):
+        """Get the room's (x, y, z) coordinate tags, None where unset."""
+        return (
+            self.obj.tags.get(category="room_x_coordinate"),
+            self.obj.tags.get(category="room_y_coordinate"),
+            self.obj.tags.get(category="room_z_coordinate"),
+        )
+
     # === Component Display Methods ===
     def get_display_name(self, looker, **kwargs):
         """
@@ -554,9 +669,7 @@ class RoomAppearanceHandler(AppearanceHandler):
             This function can be extended to change how object names appear to users in character,
             but it does not change an object's keys or aliases when searching.
         """
-        x = self.obj.tags.get(category="room_x_coordinate")
-        y = self.obj.tags.get(category="room_y_coordinate")
-        z = self.obj.tags.get(category="room_z_coordinate")
+        x, y, z = self._get_coordinates()
         xyz = f"[{x},{y},{z}]" if x and y and z else ""
         if looker and self.obj.locks.check_lockstring(looker, "perm(Builder)"):
             return f"{self.display_name}{xyz}(#{self.obj.id})"
@@ -576,7 +689,7 @@ class RoomAppearanceHandler(AppearanceHandler):
         """
         desc = self.get_desc()
         desc = self.replace_legacy_time_of_day_markup(desc)
-        desc = self._get_funcparser(looker).parse(desc, **kwargs)
+        desc = self._parse_state_markup(desc, looker, **kwargs)
         desc = (
             desc.replace("\n\n", "\n\n    ")
             .replace("|/|/", "|/|/    ")
@@ -620,12 +733,8 @@ class RoomAppearanceHandler(AppearanceHandler):
             except ValueError:
                 return len(ordered_exits)
 
-        exits = sorted(
-            self._filter_visible(
-                looker, self.obj.contents_get(content_type="exit")
-            ),
-            key=exit_sort_key,
-        )
+        buckets, _ = self._classify_contents(looker)
+        exits = sorted(buckets["exit"], key=exit_sort_key)
         exit_names = iter_to_str(exit.display_name for exit in exits)
 
         return (
@@ -645,41 +754,34 @@ class RoomAppearanceHandler(AppearanceHandler):
             str: The character display data.
 
         """
-        characters = self._filter_visible(
-            looker, self.obj.contents_get(content_type="character")
-        )
+        buckets, _ = self._classify_contents(looker)
         character_names = iter_to_str(
-            char.get_display_name(looker, **kwargs) for char in characters
+            char.get_display_name(looker, **kwargs)
+            for char in buckets["character"]
         )
 
         return f"{character_names}\n" if character_names else ""
 
     def get_display_mobs(self, looker, **kwargs):
         """Get formatted mob display string."""
-        mobs = self._filter_visible(
-            looker, self.obj.contents_get(content_type="mob")
-        )
-        grouped_mobs = self._group_objects(mobs, looker, **kwargs)
+        buckets, _ = self._classify_contents(looker)
+        grouped_mobs = self._group_objects(buckets["mob"], looker, **kwargs)
         mob_names = self._format_grouped_objects(grouped_mobs, looker, **kwargs)
         return f"{mob_names}\n" if mob_names else ""
 
     def get_display_things(self, looker, **kwargs):
         """Get formatted object display string."""
-        things = self._filter_visible(
-            looker, self.obj.contents_get(content_type="object")
+        buckets, present = self._classify_contents(looker)
+        grouped_things = self._group_objects(
+            buckets["object"], looker, **kwargs
         )
-        grouped_things = self._group_objects(things, looker, **kwargs)
         thing_names = self._format_grouped_objects(
             grouped_things, looker, **kwargs
         )
 
         # Add spacing if there are characters or mobs
-        has_characters = bool(
-            self.obj.contents_get(exclude=looker, content_type="character")
-        )
-        has_mobs = bool(
-            self.obj.contents_get(exclude=looker, content_type="mob")
-        )
+        has_characters = "character" in present
+        has_mobs = "mob" in present
         prefix = "\n" if has_characters or has_mobs and thing_names else ""
         return f"{prefix}{thing_names}" if thing_names else ""
 
@@ -700,16 +802,38 @@ class RoomAppearanceHandler(AppearanceHandler):
             - Includes name, description, exits, and contents
             - Contents are grouped by type (chars, mobs, objects)
             - Respects room states and time-based descriptions
+            - Name and description come from the render cache; exits and
+              contents are always rendered live
+            - Contents' attributes and tags are bulk-loaded before rendering,
+              see `utils.prefetch`
+            - Contents are classified once per look, see `_classify_contents`
+            - With `debug=True`, render statistics are appended
         """
         if not looker or not self.obj.access(looker, "appearance"):
             return ""
 
-        # Return normal appearance
-        return ROOM_APPEARANCE_TEMPLATE.format(
-            name=self.get_display_name(looker, **kwargs),
-            desc=self.get_display_desc(looker, **kwargs),
-            exits=self.get_display_exits(looker, **kwargs),
-            characters=self.get_display_characters(looker, **kwargs),
-            mobs=self.get_display_mobs(looker, **kwargs),
-            things=self.get_display_things(looker, **kwargs),
-        ).strip()
+        name, desc = self.get_display_header(looker, **kwargs)
+
+        prefetched = prefetch(self.obj.contents)
+        self._contents_buckets = (looker, *self._classify_contents(looker))
+        self.render_stats["prefetched"] = prefetched
+        try:
+            # Return normal appearance
+            appearance = ROOM_APPEARANCE_TEMPLATE.format(
+                name=name,
+                desc=desc,
+                exits=self.get_display_exits(looker, **kwargs),
+                characters=self.get_display_characters(looker, **kwargs),
+                mobs=self.get_display_mobs(looker, **kwargs),
+                things=self.get_display_things(looker, **kwargs),
+            ).strip()
+        finally:
+            self._contents_buckets = None
+
+        if kwargs.get("debug"):
+            stats = self.render_stats
+            appearance += (
+                f"\n|x[debug] view lock checks: {stats.get('lock_checks', 0)}, "
+                f"objects prefetched: {stats.get('prefetched', 0)}|n"
+            )
+        return appearance
@@ -96,6 +96,14 @@ class ClothingHandler:
             self._clothing,
             category=self._db_category,
         )
+        self._invalidate_appearance()
+
+    def _invalidate_appearance(self):
+        """Drop the wearer's cached worn-item descriptions."""
+        if invalidate := getattr(
+            self.obj.appearance, "invalidate_worn_cache", None
+        ):
+            invalidate()
 
     # Query/Getter Methods
     def all(self, exclude_covered=False):
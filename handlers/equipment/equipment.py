@@ -80,6 +80,14 @@ class EquipmentHandler:
         self.obj.attributes.add(
             self._db_attribute, self._equipment, category=self._db_category
         )
+        self._invalidate_appearance()
+
+    def _invalidate_appearance(self):
+        """Drop the wearer's cached worn-item descriptions."""
+        if invalidate := getattr(
+            self.obj.appearance, "invalidate_worn_cache", None
+        ):
+            invalidate()
 
     def _display_action_message(self, item, action):
         is_weapon = item.equipment_type == EquipmentType.WEAPON
@@ -0,0 +1,152 @@
+"""
+Game clock.
+
+Works out the current time of day and season from the game time, caching
+the result for a game-minute so looks and descriptions don't each have to
+build a datetime. When the time of day or the season changes, a signal is
+sent so rooms and scripts can react to dawn breaking instead of noticing it
+on the next look:
+
+    from handlers.gameclock import SIGNAL_TIME_OF_DAY_CHANGED
+
+    def at_dawn(sender, old, new, **kwargs):
+        if new == "morning":
+            ...
+
+    SIGNAL_TIME_OF_DAY_CHANGED.connect(at_dawn)
+
+Signals are sent with `old` and `new` period names. A running server ticks
+the clock every game-minute (see `GameClock.start`), so transitions fire
+even when nobody is looking at anything.
+"""
+
+import datetime
+
+from django.conf import settings
+from django.dispatch import Signal
+from evennia import gametime
+from twisted.internet import reactor
+
+# Month ranges of each season. Ranges that wrap the year end (winter) are
+# the fallback when no other range matches.
+SEASONS = {
+    "spring": (3, 6),
+    "summer": (6, 9),
+    "autumn": (9, 12),
+    "winter": (12, 3),
+}
+
+# Hour ranges of each time of day.
+TIMES_OF_DAY = {
+    "night": (0, 6),
+    "morning": (6, 12),
+    "afternoon": (12, 18),
+    "evening": (18, 24),
+}
+
+# Sent as (sender=clock, old=str, new=str).
+SIGNAL_TIME_OF_DAY_CHANGED = Signal()
+SIGNAL_SEASON_CHANGED = Signal()
+
+
+def _get_period(value, ranges):
+    """Find the named range holding value, falling back to the last one."""
+    for period, (start, end) in ranges.items():
+        if start < end and start <= value < end:
+            return period
+    return period
+
+
+class GameClock:
+    """
+    Caches the time of day and season, announcing when either changes.
+
+    Args:
+        time_func (callable, optional): Returns the absolute game time in
+            seconds. Defaults to `gametime.gametime(absolute=True)`; tests
+            can pass a fake clock instead.
+
+    Attributes:
+        generation (int): Incremented every time the time of day or season
+            changes. Caches keyed on the period can compare against it to
+            know when they are stale.
+    """
+
+    def __init__(self, time_func=None):
+        self.time_func = time_func or (
+            lambda: gametime.gametime(absolute=True)
+        )
+        self.generation = 0
+        self._minute = None
+        self._time_of_day = None
+        self._season = None
+        self._call = None
+
+    def refresh(self):
+        """
+        Recompute the periods if a game-minute has passed, sending signals
+        for any that changed.
+        """
+        timestamp = self.time_func()
+        minute = int(timestamp // 60)
+        if minute == self._minute:
+            return
+        self._minute = minute
+
+        now = datetime.datetime.fromtimestamp(timestamp)
+        time_of_day = _get_period(now.hour, TIMES_OF_DAY)
+        season = _get_period(now.month, SEASONS)
+
+        old_time_of_day, self._time_of_day = self._time_of_day, time_of_day
+        old_season, self._season = self._season, season
+        if old_time_of_day == time_of_day and old_season == season:
+            return
+
+        self.generation += 1
+        # the first computation is not a transition
+        if old_time_of_day and old_time_of_day != time_of_day:
+            SIGNAL_TIME_OF_DAY_CHANGED.send(
+                sender=self, old=old_time_of_day, new=time_of_day
+            )
+        if old_season and old_season != season:
+            SIGNAL_SEASON_CHANGED.send(sender=self, old=old_season, new=season)
+
+    @property
+    def time_of_day(self):
+        """The current time of day: night, morning, afternoon or evening."""
+        self.refresh()
+        return self._time_of_day
+
+    @property
+    def season(self):
+        """The current season: spring, summer, autumn or winter."""
+        self.refresh()
+        return self._season
+
+    def start(self, clock=None):
+        """
+        Tick the clock every game-minute so transitions are announced on
+        time.
+
+        Args:
+            clock (IReactorTime, optional): The clock to schedule on.
+                Defaults to the twisted reactor.
+        """
+        self.stop()
+        clock = clock or reactor
+        interval = 60 / settings.TIME_FACTOR
+
+        def tick():
+            self.refresh()
+            self._call = clock.callLater(interval, tick)
+
+        tick()
+
+    def stop(self):
+        """Stop ticking."""
+        if self._call and self._call.active():
+            self._call.cancel()
+        self._call = None
+
+
+GAME_CLOCK = GameClock()
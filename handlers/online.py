@@ -0,0 +1,124 @@
+"""
+Online characters.
+
+An in-memory index of the characters currently puppeted by an account,
+grouped by the zone they stand in. Shouts, zone announcements and global
+events read it instead of loading every character from the database to
+check which ones are connected.
+
+The index is kept up to date by the puppet hooks on objects and by
+`Room.at_object_receive` as characters move between zones. It is rebuilt
+from the "puppeted" tags when the server starts.
+"""
+
+from collections import defaultdict
+
+from evennia.utils.search import search_tag
+
+from handlers.zones import get_zone
+
+
+class OnlineIndex:
+    """
+    Keeps the puppeted characters, by zone.
+
+    Characters outside of any zone (or nowhere at all) are indexed under the
+    zone None.
+    """
+
+    def __init__(self):
+        self._characters = {}
+        self._zones = {}
+        self._by_zone = defaultdict(dict)
+
+    def __len__(self):
+        return len(self._characters)
+
+    def __contains__(self, character):
+        return character.id in self._characters
+
+    def add(self, character):
+        """Index a character that was just puppeted."""
+        self._characters[character.id] = character
+        self.relocate(character)
+
+    def discard(self, character):
+        """Remove a character that was unpuppeted. Ignores unknown ones."""
+        if self._characters.pop(character.id, None) is None:
+            return
+        zone = self._zones.pop(character.id, None)
+        self._remove_from_zone(character.id, zone)
+
+    def relocate(self, character):
+        """
+        Reindex a character under the zone of its current location.
+
+        Args:
+            character (Character): The character, which is ignored if it isn't
+                online.
+        """
+        if character.id not in self._characters:
+            return
+
+        location = character.location
+        zone = get_zone(location) if location else None
+        old_zone = self._zones.get(character.id, zone)
+        if old_zone != zone:
+            self._remove_from_zone(character.id, old_zone)
+        self._zones[character.id] = zone
+        self._by_zone[zone][character.id] = character
+
+    def _remove_from_zone(self, character_id, zone):
+        characters = self._by_zone.get(zone)
+        if characters is None:
+            return
+        characters.pop(character_id, None)
+        if not characters:
+            del self._by_zone[zone]
+
+    def all(self):
+        """Get a list of every online character."""
+        return list(self._characters.values())
+
+    def in_zone(self, zone):
+        """
+        Get the online characters in a zone.
+
+        Args:
+            zone (str or None): The zone name, as given by `get_zone`.
+
+        Returns:
+            list: The characters.
+        """
+        if zone:
+            zone = zone.lower()
+        return list(self._by_zone.get(zone, {}).values())
+
+    def rooms_in_zone(self, zone):
+        """Get the rooms of a zone that hold at least one online character."""
+        return list(
+            {
+                character.location.id: character.location
+                for character in self.in_zone(zone)
+                if character.location
+            }.values()
+        )
+
+    def rebuild(self):
+        """
+        Rebuild the index from all characters tagged as puppeted.
+
+        Notes:
+            This runs from `at_server_start`, before the portal has synced
+            the sessions back after a reload, so no character has a session
+            yet and `has_account` can't be trusted. Link-dead puppets are
+            unpuppeted, and so discarded, by the server's maintenance task.
+        """
+        self._characters.clear()
+        self._zones.clear()
+        self._by_zone.clear()
+        for character in search_tag("puppeted", category="account"):
+            self.add(character)
+
+
+ONLINE = OnlineIndex()
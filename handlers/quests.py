@@ -1,10 +1,14 @@
 from copy import copy
 from enum import Enum
 
+from evennia.server.models import ServerConfig
 from evennia.utils import dbserialize
 
 from handlers.handler import Handler
 
+QUEST_TAG_CATEGORY = "quest"
+QUEST_TAGS_CONFIG_KEY = "quest_tags_indexed"
+
 
 class QuestProgress(Enum):
     """
@@ -23,6 +27,54 @@ class QuestProgress(Enum):
     FAILED = 3
 
 
+def quest_tag(quest, status=None, objective=None):
+    """
+    Build the tag key used to index a quest's state on its quester.
+
+    Args:
+        quest (str): The quest key.
+        status (QuestProgress or str, optional): The quest or objective status.
+            If omitted, the tag only marks that the quest is held.
+        objective (Enum or str, optional): The objective the status applies to.
+
+    Returns:
+        str: A tag key such as `arrival`, `arrival:in_progress` or
+            `arrival:meet_aeum:completed`.
+    """
+    parts = [quest]
+    if objective is not None:
+        parts.append(
+            objective.name if isinstance(objective, Enum) else objective
+        )
+    if status is not None:
+        parts.append(status.name if isinstance(status, Enum) else status)
+    return ":".join(str(part) for part in parts).lower()
+
+
+def backfill_quest_tags():
+    """
+    Tag the characters whose quest data was saved before quests were indexed.
+
+    Quest tags are only written when a quester's quests are saved, so this
+    reindexes every character holding quest data once, then records in the
+    server config that it has run.
+
+    Returns:
+        int: The number of characters reindexed.
+    """
+    if ServerConfig.objects.conf(QUEST_TAGS_CONFIG_KEY):
+        return 0
+
+    # characters use the QuestHandler, so import them late
+    from typeclasses.characters import Character
+
+    characters = Character.objects.get_by_attribute(key="quests")
+    for character in characters:
+        character.quests.reindex()
+    ServerConfig.objects.conf(QUEST_TAGS_CONFIG_KEY, value=True)
+    return len(characters)
+
+
 class QuestHandler(Handler):
     """
     Handler for managing quests on a game object. Supports adding, updating,
@@ -47,6 +99,11 @@ class QuestHandler(Handler):
     - set_status(quest_name, new_status): Sets the status of a quest.
     - remove_quest(quest_name): Removes a quest from the handler.
     - clear_quests(): Removes all quests.
+    - reindex(): Rebuilds the quest tags on the quester.
+
+    Every save mirrors each quest's key, status and objective statuses into
+    tags of category `quest` (see `quest_tag`), so questers can be found with
+    an indexed tag query instead of unpickling every `quests` attribute.
     """
 
     def __init__(
@@ -54,6 +111,35 @@ class QuestHandler(Handler):
     ):
         super().__init__(obj, db_attribute, db_category, default_data)
 
+    def _save(self):
+        super()._save()
+        self.reindex()
+
+    def reindex(self):
+        """
+        Synchronizes the quester's quest tags with the stored quest data.
+
+        Only tags that changed are added or removed, so calling this on an
+        up-to-date quester is cheap.
+        """
+        wanted = set()
+        for quest in self._data.values():
+            wanted.add(quest_tag(quest.key))
+            wanted.add(quest_tag(quest.key, quest.status))
+            for objective, data in quest.objectives.items():
+                if status := data.get("status"):
+                    wanted.add(quest_tag(quest.key, status, objective))
+
+        current = set(
+            self.obj.tags.get(category=QUEST_TAG_CATEGORY, return_list=True)
+        )
+        for tag in current - wanted:
+            self.obj.tags.remove(tag, category=QUEST_TAG_CATEGORY)
+        if added := wanted - current:
+            self.obj.tags.batch_add(
+                *((tag, QUEST_TAG_CATEGORY) for tag in added)
+            )
+
     def all(self):
         return [self.get(quest) for quest in self._data]
 
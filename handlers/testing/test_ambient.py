@@ -0,0 +1,57 @@
+from unittest.mock import MagicMock, patch
+
+from evennia.utils.test_resources import EvenniaTest
+from twisted.internet.task import Clock
+
+from typeclasses.characters import Character
+from typeclasses.rooms import Room
+
+from ..ambient import AmbientScheduler
+
+
+class TestAmbientScheduler(EvenniaTest):
+    character_typeclass = Character
+    room_typeclass = Room
+
+    def setUp(self):
+        super().setUp()
+        self.clock = Clock()
+        self.scheduler = AmbientScheduler(clock=self.clock)
+        for module in ("typeclasses.objects", "typeclasses.rooms"):
+            patcher = patch(f"{module}.AMBIENT", self.scheduler)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.room1.appearance.room_messages = ["A breeze stirs."]
+        self.room1.appearance.room_message_rate = 10
+        self.room1.msg_contents = MagicMock()
+
+    def test_broadcasts_in_occupied_rooms(self):
+        self.scheduler.add(self.room1)
+        self.clock.advance(20)
+        self.assertEqual(self.scheduler.stats["broadcasts"], 1)
+        self.room1.msg_contents.assert_called_once_with("A breeze stirs.")
+
+    def test_drops_empty_rooms_when_due(self):
+        self.scheduler.add(self.room1)
+        self.scheduler.discard(self.room1)
+        self.clock.advance(20)
+        self.assertEqual(self.scheduler.stats["broadcasts"], 0)
+        self.assertEqual(self.scheduler.stats["dropped"], 1)
+        self.assertEqual(self.clock.getDelayedCalls(), [])
+
+    def test_puppeting_occupies_room(self):
+        self.account.puppet_object(self.session, self.char1)
+        self.assertTrue(self.scheduler.is_occupied(self.room1))
+
+    def test_logout_empties_room(self):
+        self.account.puppet_object(self.session, self.char1)
+        self.account.unpuppet_object(self.session)
+        self.assertIsNone(self.char1.location)
+        self.assertFalse(self.scheduler.is_occupied(self.room1))
+
+    def test_rebuilds_before_sessions_are_synced(self):
+        # after a reload, at_server_start runs before sessions reattach
+        self.char1.tags.add("puppeted", category="account")
+        self.assertEqual(self.char1.sessions.count(), 0)
+        self.scheduler.rebuild()
+        self.assertEqual(self.scheduler.occupied(), [self.room1])
@@ -0,0 +1,82 @@
+import datetime
+
+from evennia.utils.test_resources import BaseEvenniaTestCase
+
+from ..gameclock import (
+    SIGNAL_SEASON_CHANGED,
+    SIGNAL_TIME_OF_DAY_CHANGED,
+    GameClock,
+)
+
+
+class FakeTime:
+    """A settable stand-in for the game time."""
+
+    def __init__(self, *args):
+        self.set(*args)
+
+    def set(self, *args):
+        self.timestamp = datetime.datetime(*args).timestamp()
+
+    def advance(self, seconds):
+        self.timestamp += seconds
+
+    def __call__(self):
+        return self.timestamp
+
+
+class TestGameClock(BaseEvenniaTestCase):
+    def setUp(self):
+        super().setUp()
+        self.time = FakeTime(2024, 4, 1, 5, 58)
+        self.clock = GameClock(time_func=self.time)
+        self.events = []
+
+        def record(sender, old, new, **kwargs):
+            if sender is self.clock:
+                self.events.append((old, new))
+
+        self.record = record
+        SIGNAL_TIME_OF_DAY_CHANGED.connect(record)
+        SIGNAL_SEASON_CHANGED.connect(record)
+
+    def tearDown(self):
+        SIGNAL_TIME_OF_DAY_CHANGED.disconnect(self.record)
+        SIGNAL_SEASON_CHANGED.disconnect(self.record)
+        super().tearDown()
+
+    def test_periods(self):
+        self.assertEqual(self.clock.time_of_day, "night")
+        self.assertEqual(self.clock.season, "spring")
+
+        self.time.set(2024, 12, 24, 19, 0)
+        self.assertEqual(self.clock.time_of_day, "evening")
+        self.assertEqual(self.clock.season, "winter")
+
+    def test_cached_within_minute(self):
+        self.assertEqual(self.clock.time_of_day, "night")
+        generation = self.clock.generation
+
+        # still in the same game-minute: no recomputation
+        self.time.advance(1)
+        self.clock.refresh()
+        self.assertEqual(self.clock.generation, generation)
+
+    def test_transition_signals(self):
+        self.clock.refresh()
+        self.assertEqual(self.events, [])
+        generation = self.clock.generation
+
+        self.time.advance(60)
+        self.clock.refresh()
+        self.assertEqual(self.events, [])
+        self.assertEqual(self.clock.generation, generation)
+
+        self.time.advance(60)
+        self.assertEqual(self.clock.time_of_day, "morning")
+        self.assertEqual(self.events, [("night", "morning")])
+        self.assertEqual(self.clock.generation, generation + 1)
+
+        self.time.set(2024, 6, 1, 6, 0)
+        self.clock.refresh()
+        self.assertEqual(self.events[-1], ("spring", "summer"))
@@ -0,0 +1,56 @@
+from evennia.utils import create
+from evennia.utils.test_resources import EvenniaTest
+
+from handlers.clothing.clothing_types import ClothingType
+from typeclasses.characters import Character
+from typeclasses.clothing import Clothing
+from typeclasses.rooms import Room
+
+
+class TestWornCache(EvenniaTest):
+    character_typeclass = Character
+    room_typeclass = Room
+
+    def setUp(self):
+        super().setUp()
+        self.shirt = self.wear("shirt", ClothingType.TOP)
+        self.helper = create.create_object(
+            Character, key="Helper", location=self.room1
+        )
+        self.helper.permissions.add("Helper")
+        self.stranger = create.create_object(
+            Character, key="Stranger", location=self.room1
+        )
+
+    def wear(self, key, clothing_type):
+        item = create.create_object(Clothing, key=key, location=self.char2)
+        item.clothing_type = clothing_type
+        self.char2.clothing.wear(item)
+        return item
+
+    def clothing(self, looker):
+        return self.char2.appearance.get_display_clothing(looker)
+
+    def test_reuses_block_for_same_view(self):
+        block = self.clothing(self.helper)
+        self.assertIn("shirt", block)
+        self.assertIs(self.clothing(self.stranger), block)
+
+    def test_wearing_clears_cache(self):
+        self.clothing(self.stranger)
+        self.wear("hat", ClothingType.HEADWEAR)
+        self.assertIn("hat", self.clothing(self.stranger))
+
+    def test_view_locked_items_depend_on_looker(self):
+        ring = self.wear("ring", ClothingType.RING)
+        ring.locks.add("view:perm(Helper)")
+        self.assertIn("ring", self.clothing(self.helper))
+        self.assertNotIn("ring", self.clothing(self.stranger))
+        self.assertIn("ring", self.clothing(self.helper))
+
+    def test_covered_items_look_the_same_to_wearer(self):
+        self.wear("coat", ClothingType.OUTERWEAR)
+        stranger_view = self.clothing(self.stranger)
+        self.assertNotIn("shirt", stranger_view)
+        self.assertIn("coat", stranger_view)
+        self.assertEqual(self.clothing(self.char2), stranger_view)
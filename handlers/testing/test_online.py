@@ -0,0 +1,50 @@
+from evennia.utils.test_resources import EvenniaTest
+
+from handlers.zones import ZONE_TAG_CATEGORY
+
+from ..online import OnlineIndex
+
+
+class TestOnlineIndex(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        self.room1.tags.add("Emberlyn", category=ZONE_TAG_CATEGORY)
+        self.room2.tags.add("nautilus", category=ZONE_TAG_CATEGORY)
+        self.index = OnlineIndex()
+
+    def test_indexes_characters_by_zone(self):
+        self.index.add(self.char1)
+        self.index.add(self.char2)
+        self.assertEqual(len(self.index), 2)
+        self.assertIn(self.char1, self.index)
+        self.assertEqual(
+            set(self.index.in_zone("emberlyn")), {self.char1, self.char2}
+        )
+        self.assertEqual(self.index.rooms_in_zone("emberlyn"), [self.room1])
+        self.assertEqual(self.index.in_zone("nautilus"), [])
+
+    def test_relocates_characters_between_zones(self):
+        self.index.add(self.char1)
+        self.char1.location = self.room2
+        self.index.relocate(self.char1)
+        self.assertEqual(self.index.in_zone("emberlyn"), [])
+        self.assertEqual(self.index.in_zone("Nautilus"), [self.char1])
+
+    def test_ignores_offline_characters(self):
+        self.index.relocate(self.char1)
+        self.index.discard(self.char1)
+        self.assertEqual(self.index.all(), [])
+
+    def test_discards_characters(self):
+        self.index.add(self.char1)
+        self.index.discard(self.char1)
+        self.assertEqual(self.index.all(), [])
+        self.assertEqual(self.index.in_zone("emberlyn"), [])
+
+    def test_rebuilds_before_sessions_are_synced(self):
+        # after a reload, at_server_start runs before sessions reattach
+        self.char1.tags.add("puppeted", category="account")
+        self.assertEqual(self.char1.sessions.count(), 0)
+        self.index.rebuild()
+        self.assertEqual(self.index.in_zone("emberlyn"), [self.char1])
+        self.assertNotIn(self.char2, self.index)
@@ -2,7 +2,12 @@ from enum import Enum
 
 from evennia.utils.test_resources import EvenniaTest
 
-from ..quests import Quest, QuestProgress
+from ..quests import (
+    QUEST_TAG_CATEGORY,
+    Quest,
+    QuestProgress,
+    backfill_quest_tags,
+)
 
 
 class TestDetail(Enum):
@@ -61,7 +66,10 @@ class TestQuestHandler(EvenniaTest):
     def test_set_objective(self):
         self.char1.quests.add(TestQuest)
         self.char1.quests.set_objective(
-            "TestQuest", TestObjective.TEST_OBJECTIVE, "status", QuestProgress.COMPLETED
+            "TestQuest",
+            TestObjective.TEST_OBJECTIVE,
+            "status",
+            QuestProgress.COMPLETED,
         )
         objective = self.char1.quests.get_objective(
             "TestQuest", TestObjective.TEST_OBJECTIVE
@@ -120,3 +128,55 @@ class TestQuestHandler(EvenniaTest):
         self.char1.quests.get("TestQuest").is_complete()
         status = self.char1.quests.get_status("TestQuest")
         self.assertEqual(status, QuestProgress.COMPLETED)
+
+    def test_quest_tags(self):
+        self.char1.quests.add(TestQuest)
+        self.assertTrue(self.char1.tags.has("testquest", category="quest"))
+        self.assertTrue(
+            self.char1.tags.has("testquest:in_progress", category="quest")
+        )
+        self.char1.quests.set_status("TestQuest", QuestProgress.COMPLETED)
+        self.assertFalse(
+            self.char1.tags.has("testquest:in_progress", category="quest")
+        )
+        self.assertTrue(
+            self.char1.tags.has("testquest:completed", category="quest")
+        )
+        self.char1.quests.remove("TestQuest")
+        self.assertFalse(self.char1.tags.has("testquest", category="quest"))
+
+    def test_get_by_quest(self):
+        self.char1.quests.add(TestQuest)
+        self.char1.quests.set_objective(
+            "TestQuest",
+            TestObjective.TEST_OBJECTIVE,
+            "status",
+            QuestProgress.COMPLETED,
+        )
+        manager = type(self.char1).objects
+        self.assertIn(self.char1, manager.get_by_quest("TestQuest"))
+        self.assertIn(
+            self.char1,
+            manager.get_by_quest(
+                "TestQuest",
+                QuestProgress.COMPLETED,
+                TestObjective.TEST_OBJECTIVE,
+            ),
+        )
+        self.assertNotIn(self.char2, manager.get_by_quest("TestQuest"))
+        self.assertIn(
+            self.char2, manager.get_quest_eligible("TestQuest", online=False)
+        )
+
+    def test_backfill_quest_tags(self):
+        self.char1.quests.add(TestQuest)
+        # quest data saved before quests were tagged
+        self.char1.tags.clear(category=QUEST_TAG_CATEGORY)
+        manager = type(self.char1).objects
+        self.assertNotIn(self.char1, manager.get_by_quest("TestQuest"))
+        self.assertEqual(backfill_quest_tags(), 1)
+        self.assertIn(self.char1, manager.get_by_quest("TestQuest"))
+        self.assertNotIn(
+            self.char1, manager.get_quest_eligible("TestQuest", online=False)
+        )
+        self.assertEqual(backfill_quest_tags(), 0)
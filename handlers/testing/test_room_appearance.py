@@ -0,0 +1,112 @@
+from unittest.mock import patch
+
+from evennia.utils import create
+from evennia.utils.test_resources import EvenniaTest
+
+from handlers.gameclock import GAME_CLOCK
+from typeclasses.characters import Character
+from typeclasses.exits import Exit
+from typeclasses.mobs import Mob
+from typeclasses.objects import Object
+from typeclasses.rooms import Room
+
+
+class TestRoomRenderCache(EvenniaTest):
+    character_typeclass = Character
+    room_typeclass = Room
+
+    def setUp(self):
+        super().setUp()
+        self.appearance = self.room1.appearance
+        self.appearance.add_desc("A plain hall.", "dark")
+        patcher = patch.object(
+            self.appearance,
+            "get_display_desc",
+            wraps=self.appearance.get_display_desc,
+        )
+        self.get_display_desc = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def header(self, looker):
+        return self.appearance.get_display_header(looker)
+
+    def test_reuses_rendered_header(self):
+        first = self.header(self.char2)
+        self.assertIs(self.header(self.char2), first)
+        self.assertEqual(self.get_display_desc.call_count, 1)
+
+    def test_caches_builder_view_separately(self):
+        self.assertEqual(self.header(self.char2)[0], "Room")
+        self.assertEqual(self.header(self.char1)[0], f"Room(#{self.room1.id})")
+        self.assertEqual(self.get_display_desc.call_count, 2)
+
+    def test_description_edit_clears_cache(self):
+        self.header(self.char2)
+        self.appearance.add_desc("A grand hall.", "dark")
+        self.assertEqual(self.header(self.char2)[1], "A grand hall.")
+
+    def test_rename_changes_header(self):
+        self.header(self.char2)
+        self.room1.key = "Great Hall"
+        self.assertEqual(self.header(self.char2)[0], "Great Hall")
+
+    def test_coordinate_tags_change_builder_header(self):
+        self.header(self.char1)
+        for category, value in zip("xyz", "123"):
+            self.room1.tags.add(value, category=f"room_{category}_coordinate")
+        self.assertEqual(
+            self.header(self.char1)[0], f"Room[1,2,3](#{self.room1.id})"
+        )
+        self.assertEqual(self.header(self.char2)[0], "Room")
+
+    def test_clock_flip_clears_cache(self):
+        self.header(self.char2)
+        with patch.object(GAME_CLOCK, "refresh"), patch.object(
+            GAME_CLOCK, "generation", GAME_CLOCK.generation + 1
+        ):
+            self.header(self.char2)
+        self.assertEqual(self.get_display_desc.call_count, 2)
+
+
+class TestRoomContents(EvenniaTest):
+    character_typeclass = Character
+    object_typeclass = Object
+    room_typeclass = Room
+    exit_typeclass = Exit
+
+    def setUp(self):
+        super().setUp()
+        self.appearance = self.room1.appearance
+        self.wolf = create.create_object(Mob, key="wolf", location=self.room1)
+        self.ghost = create.create_object(
+            Object, key="ghost", location=self.room1
+        )
+        self.ghost.locks.add("view:false()")
+
+    def test_classifies_visible_contents(self):
+        buckets, present = self.appearance._classify_contents(self.char2)
+        self.assertEqual(buckets["exit"], [self.exit])
+        self.assertEqual(buckets["character"], [self.char1])
+        self.assertEqual(buckets["mob"], [self.wolf])
+        self.assertEqual(buckets["object"], [self.obj1, self.obj2])
+        self.assertEqual(present, {"exit", "character", "mob", "object"})
+
+    def test_hidden_types_still_count_as_present(self):
+        self.obj1.location = self.obj2.location = self.room2
+        buckets, present = self.appearance._classify_contents(self.char2)
+        self.assertEqual(buckets["object"], [])
+        self.assertIn("object", present)
+
+    def test_checks_each_view_lock_once_per_look(self):
+        classified = [
+            obj
+            for obj in self.room1.contents
+            if obj != self.char2 and getattr(obj, "_content_types", ())
+        ]
+        appearance = self.appearance.return_appearance(self.char2, debug=True)
+        self.assertEqual(
+            self.appearance.render_stats["lock_checks"], len(classified)
+        )
+        self.assertIn(f"view lock checks: {len(classified)}", appearance)
+        self.assertIn("wolf", appearance)
+        self.assertNotIn("ghost", appearance)
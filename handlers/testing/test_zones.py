@@ -0,0 +1,92 @@
+from unittest.mock import patch
+
+from evennia.server.models import ServerConfig
+from evennia.utils.test_resources import EvenniaTest
+
+from handlers.zones import (
+    ZONE_STATES_CONFIG_KEY,
+    ZONE_TAG_CATEGORY,
+    ZoneStateHandler,
+    get_zone,
+)
+from typeclasses.characters import Character
+from typeclasses.rooms import Room
+
+
+class TestZoneStates(EvenniaTest):
+    character_typeclass = Character
+    room_typeclass = Room
+
+    def setUp(self):
+        super().setUp()
+        self.room1.tags.add("Emberlyn", category=ZONE_TAG_CATEGORY)
+        self.zones = ZoneStateHandler()
+        patcher = patch("handlers.appearance.rooms.ZONE_STATES", self.zones)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_zone(self):
+        self.assertEqual(get_zone(self.room1), "emberlyn")
+        self.assertIsNone(get_zone(self.room2))
+
+    def test_add_and_remove_states(self):
+        self.zones.add("Emberlyn", "Raining", "dark")
+        self.zones.add("emberlyn", "raining")
+        self.assertEqual(self.zones.get("EMBERLYN"), ("raining", "dark"))
+        self.zones.remove("emberlyn", "raining", "snowing")
+        self.assertEqual(self.zones.get("emberlyn"), ("dark",))
+        self.zones.remove("emberlyn", "dark")
+        self.assertEqual(self.zones.all(), {})
+        self.assertEqual(self.zones.get(None), ())
+
+    def test_states_persist_to_server_config(self):
+        self.zones.add("emberlyn", "raining")
+        self.zones.add("nautilus", "foggy")
+        self.assertEqual(
+            ServerConfig.objects.conf(ZONE_STATES_CONFIG_KEY),
+            {"emberlyn": ["raining"], "nautilus": ["foggy"]},
+        )
+        reloaded = ZoneStateHandler()
+        self.assertEqual(reloaded.get("emberlyn"), ("raining",))
+        self.zones.clear("nautilus")
+        self.assertEqual(ZoneStateHandler().all(), {"emberlyn": ("raining",)})
+
+    def test_unchanged_states_skip_save(self):
+        self.zones.add("emberlyn", "raining")
+        with patch.object(self.zones, "_save") as save:
+            self.zones.add("emberlyn", "raining")
+            self.zones.remove("emberlyn", "snowing")
+            self.zones.clear("nautilus")
+        save.assert_not_called()
+
+    def test_rooms_see_zone_states(self):
+        appearance = self.room1.appearance
+        appearance.add_room_state("raining")
+        self.zones.add("emberlyn", "raining", "foggy", "magical_dark")
+        self.assertEqual(
+            appearance.zone_states, ("raining", "foggy", "magical_dark")
+        )
+        self.assertEqual(
+            appearance.active_states,
+            appearance.states + ["foggy", "magical_dark"],
+        )
+        self.assertTrue(appearance.is_magical_dark)
+        self.assertEqual(self.room2.appearance.zone_states, ())
+
+    def test_zone_state_change_rerenders_rooms(self):
+        appearance = self.room1.appearance
+        appearance.add_desc(
+            "A plain hall.$state(raining, Rain hammers the roof.)", "dark"
+        )
+        self.assertNotIn("Rain", appearance.get_display_desc(self.char2))
+        self.zones.add("emberlyn", "raining")
+        self.assertIn("Rain", appearance.get_display_desc(self.char2))
+
+    def test_announces_to_occupied_rooms(self):
+        with patch("handlers.online.ONLINE.rooms_in_zone") as rooms_in_zone:
+            rooms_in_zone.return_value = [self.room1]
+            with patch.object(self.room1, "msg_contents") as msg_contents:
+                self.zones.add("emberlyn", "raining", message="It rains.")
+                self.zones.remove("emberlyn", "raining")
+        rooms_in_zone.assert_called_once_with("emberlyn")
+        msg_contents.assert_called_once_with("It rains.")
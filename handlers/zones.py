@@ -0,0 +1,137 @@
+"""
+Zone states.
+
+A zone state is a room state (like "raining" or "dark") applied to every room
+of a zone at once. Rather than writing the state to each room, zone states
+are kept in one in-memory overlay, persisted as a single server config
+entry, which room renders consult alongside their own states. Setting a
+storm over a zone of 2,000 rooms is then one write instead of 2,000 saves.
+
+Rooms belong to the zone named by their Z coordinate tag (the XYZ map name).
+
+Example:
+    ZONE_STATES.add("emberlyn", "raining", message="It starts to rain.")
+    ZONE_STATES.remove("emberlyn", "raining")
+"""
+
+from evennia.server.models import ServerConfig
+
+ZONE_TAG_CATEGORY = "room_z_coordinate"
+ZONE_STATES_CONFIG_KEY = "zone_states"
+
+
+def get_zone(room):
+    """
+    Get the name of the zone a room belongs to.
+
+    Args:
+        room (Room): The room.
+
+    Returns:
+        str or None: The lowercase zone name, if the room has one.
+    """
+    zone = room.tags.get(category=ZONE_TAG_CATEGORY)
+    if isinstance(zone, list):
+        zone = zone[0]
+    return zone.lower() if zone else None
+
+
+class ZoneStateHandler:
+    """
+    Keeps the states applied to whole zones.
+
+    States are loaded from the server config on first use and saved back on
+    every change. Zone and state names are case-insensitive.
+    """
+
+    def __init__(self):
+        self._states = None
+
+    def _load(self):
+        if self._states is None:
+            stored = ServerConfig.objects.conf(ZONE_STATES_CONFIG_KEY) or {}
+            self._states = {
+                zone: tuple(states) for zone, states in stored.items()
+            }
+        return self._states
+
+    def _save(self):
+        ServerConfig.objects.conf(
+            ZONE_STATES_CONFIG_KEY,
+            value={zone: list(states) for zone, states in self._states.items()},
+        )
+
+    def get(self, zone):
+        """
+        Get the states applied to a zone.
+
+        Args:
+            zone (str): The zone name.
+
+        Returns:
+            tuple: The zone's states, in the order they were added.
+        """
+        if not zone:
+            return ()
+        return self._load().get(zone.lower(), ())
+
+    def all(self):
+        """Get a dict of every zone with states and its states."""
+        return dict(self._load())
+
+    def add(self, zone, *states, message=None):
+        """
+        Apply one or more states to every room in a zone.
+
+        Args:
+            zone (str): The zone name.
+            *states (str): The states to add.
+            message (str, optional): Echoed to every occupied room in the zone.
+        """
+        zone = zone.lower()
+        current = self.get(zone)
+        new = tuple(s.lower() for s in states if s.lower() not in current)
+        if new:
+            self._states[zone] = current + new
+            self._save()
+        self._announce(zone, message)
+
+    def remove(self, zone, *states, message=None):
+        """
+        Remove one or more states from a zone.
+
+        Args:
+            zone (str): The zone name.
+            *states (str): The states to remove. Silently ignores states the
+                zone doesn't have.
+            message (str, optional): Echoed to every occupied room in the zone.
+        """
+        zone = zone.lower()
+        removed = {s.lower() for s in states}
+        current = self.get(zone)
+        remaining = tuple(s for s in current if s not in removed)
+        if remaining != current:
+            if remaining:
+                self._states[zone] = remaining
+            else:
+                self._states.pop(zone, None)
+            self._save()
+        self._announce(zone, message)
+
+    def clear(self, zone):
+        """Remove all states from a zone."""
+        if self._load().pop(zone.lower(), None) is not None:
+            self._save()
+
+    def _announce(self, zone, message):
+        """Echo a message to the occupied rooms of a zone."""
+        if not message:
+            return
+        # the online index groups characters with get_zone, so imports us
+        from handlers.online import ONLINE
+
+        for room in ONLINE.rooms_in_zone(zone):
+            room.msg_contents(message)
+
+
+ZONE_STATES = ZoneStateHandler()
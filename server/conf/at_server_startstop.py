@@ -17,6 +17,12 @@ at_server_cold_stop()
 
 """
 
+from handlers.ambient import AMBIENT
+from handlers.gameclock import GAME_CLOCK
+from handlers.online import ONLINE
+from handlers.quests import backfill_quest_tags
+from server.conf import logger
+from server.conf.serversession import flush_all_output
 from world.xyzgrid.xyzgrid import get_xyzgrid
 
 
@@ -32,7 +38,10 @@ def at_server_start():
     This is called every time the server starts up, regardless of
     how it was shut down.
     """
-    pass
+    AMBIENT.rebuild()
+    ONLINE.rebuild()
+    GAME_CLOCK.start()
+    backfill_quest_tags()
 
 
 def at_server_stop():
@@ -40,7 +49,10 @@ def at_server_stop():
     This is called just before the server is shut down, regardless
     of it is for a reload, reset or shutdown.
     """
-    pass
+    GAME_CLOCK.stop()
+    logger.flush_mudinfo()
+    flush_all_output()
+    logger.LOG_WRITER.stop()
 
 
 def at_server_reload_start():
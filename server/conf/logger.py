@@ -14,14 +14,19 @@ log_typemsg(). This is for historical, back-compatible reasons.
 """
 
 import os
+import queue
+import threading
 import time
+from collections import Counter, defaultdict
 from datetime import datetime
 from traceback import format_exc
 
 from django.conf import settings
+from django.db.models.signals import post_delete, post_save
 from twisted import logger as twisted_logger
+from twisted.internet import reactor
 from twisted.internet.threads import deferToThread
-from twisted.python import logfile
+from twisted.python import logfile, threadable
 from utils.text import wrap
 
 from evennia.comms.models import ChannelDB
@@ -36,6 +41,21 @@ _CHANNEL_LOG_NUM_TAIL_LINES = None
 
 _TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# mudinfo messages are queued and sent as one channel message per interval
+MUDINFO_FLUSH_INTERVAL = 1.0
+# most lines sent per flush; the rest are summarized in a count
+MUDINFO_MAX_LINES = 20
+# events of one kind (such as logins) are summarized on one line once a
+# flush has this many of them
+MUDINFO_GROUP_SIZE = 3
+# most subjects named in an event summary
+MUDINFO_GROUP_NAMES = 10
+
+_MUDINFO_CHANNEL = None
+_MUDINFO_MISSING = object()
+_MUDINFO_QUEUE = []
+_MUDINFO_CALL = None
+
 
 def _log(msg, logfunc, prefix="", color="", **kwargs):
     try:
@@ -185,23 +205,140 @@ def log_server(msg, **kwargs):
     _log(msg, log.info, prefix="Server", color="|#28A745", **kwargs)
 
 
-def send_mudinfo(message):
+def _get_mudinfo_channel():
+    """
+    Get the mudinfo channel, looking it up only the first time. Returns None
+    if there is no such channel.
+    """
+    global _MUDINFO_CHANNEL
+    if _MUDINFO_CHANNEL is None:
+        try:
+            _MUDINFO_CHANNEL = ChannelDB.objects.get(
+                db_key=settings.CHANNEL_MUDINFO["key"]
+            )
+        except ChannelDB.DoesNotExist:
+            _MUDINFO_CHANNEL = _MUDINFO_MISSING
+            evennia_logger.log_trace()
+    return None if _MUDINFO_CHANNEL is _MUDINFO_MISSING else _MUDINFO_CHANNEL
+
+
+def _reset_mudinfo_channel(sender, instance, **kwargs):
+    """Forget the cached channel when any channel is created or deleted."""
+    global _MUDINFO_CHANNEL
+    if isinstance(instance, ChannelDB):
+        _MUDINFO_CHANNEL = None
+
+
+# channel typeclasses are proxy models, so listen for every sender
+post_save.connect(_reset_mudinfo_channel, dispatch_uid="mudinfo_channel_save")
+post_delete.connect(
+    _reset_mudinfo_channel, dispatch_uid="mudinfo_channel_delete"
+)
+
+
+def send_mudinfo(message, event=None, subject=None):
     """
     Helper method for loading and sending to the comm channel dedicated to
     connection messages. This will also be sent to the mudinfo channel.
 
+    Messages are queued and sent together every MUDINFO_FLUSH_INTERVAL
+    seconds, so a storm of logins is one channel message rather than one per
+    login. When a batch holds MUDINFO_GROUP_SIZE or more messages of the same
+    event, they are replaced by one line such as "12 logins in the last 1s:
+    ...", naming their subjects.
+
     Args:
         message (str): A message to send to the connect channel.
+        event (str, optional): The kind of event, as a plural noun such as
+            "logins", for grouping.
+        subject (str, optional): Who or what the event is about, named in
+            the summary of a group.
+    """
+    global _MUDINFO_CALL
+    if not settings.CHANNEL_MUDINFO:
+        return
+
+    _MUDINFO_QUEUE.append((message, event, subject))
+    if _MUDINFO_CALL is None:
+        _MUDINFO_CALL = True
+        if threadable.isInIOThread():
+            _schedule_mudinfo()
+        else:
+            reactor.callFromThread(_schedule_mudinfo)
+
+
+def _schedule_mudinfo():
+    global _MUDINFO_CALL
+    _MUDINFO_CALL = reactor.callLater(MUDINFO_FLUSH_INTERVAL, flush_mudinfo)
+
+
+def _summarize_event(event, subjects):
+    """Get the one-line summary of a group of events."""
+    names = [str(subject) for subject in dict.fromkeys(subjects) if subject]
+    if len(names) > MUDINFO_GROUP_NAMES:
+        more = len(names) - MUDINFO_GROUP_NAMES
+        names = names[:MUDINFO_GROUP_NAMES] + [f"and {more} more"]
+    summary = (
+        f"{len(subjects)} {event} in the last {MUDINFO_FLUSH_INTERVAL:g}s"
+    )
+    return f"{summary}: {', '.join(names)}" if names else f"{summary}."
+
+
+def _coalesce_mudinfo(entries):
     """
-    if settings.CHANNEL_MUDINFO:
-        try:
-            channel = ChannelDB.objects.get(db_key=settings.CHANNEL_MUDINFO["key"])
-        except ChannelDB.DoesNotExist:
-            return evennia_logger.log_trace()
+    Merge a batch of (message, event, subject) entries into lines: large
+    groups of an event are summarized, repeats are counted instead of
+    repeated, and lines past MUDINFO_MAX_LINES are summarized.
+    """
+    subjects = defaultdict(list)
+    for _, event, subject in entries:
+        if event:
+            subjects[event].append(subject)
+
+    # each line, in order of first appearance, with the messages it stands for
+    counts = Counter()
+    for message, event, _ in entries:
+        if event and len(subjects[event]) >= MUDINFO_GROUP_SIZE:
+            counts[(event, None)] += 1
+        else:
+            counts[(None, message)] += 1
+
+    lines = []
+    for (event, message), count in counts.items():
+        if event:
+            lines.append(_summarize_event(event, subjects[event]))
+        elif count > 1:
+            lines.append(f"{message} (x{count})")
+        else:
+            lines.append(message)
+
+    if len(lines) > MUDINFO_MAX_LINES:
+        hidden = sum(list(counts.values())[MUDINFO_MAX_LINES - 1 :])
+        lines = lines[: MUDINFO_MAX_LINES - 1]
+        lines.append(
+            f"... and {hidden} more message{'s' if hidden != 1 else ''} "
+            f"in the last {MUDINFO_FLUSH_INTERVAL:g}s."
+        )
+    return lines
+
 
-        message = wrap(message, hang=10)
+def flush_mudinfo():
+    """Send all queued mudinfo messages to the channel now."""
+    global _MUDINFO_CALL
+    if _MUDINFO_CALL not in (None, True) and _MUDINFO_CALL.active():
+        _MUDINFO_CALL.cancel()
+    _MUDINFO_CALL = None
 
-        channel.msg(f"{message}")
+    entries = _MUDINFO_QUEUE[:]
+    del _MUDINFO_QUEUE[: len(entries)]
+    if not entries or not (channel := _get_mudinfo_channel()):
+        return
+
+    channel.msg(
+        "\n".join(
+            wrap(line, hang=10) for line in _coalesce_mudinfo(entries)
+        )
+    )
 
 
 class GetLogObserver:
@@ -433,6 +570,16 @@ class EvenniaLogFile(logfile.LogFile):
         for line in lines:
             self.write(line)
 
+    def writelines(self, lines):
+        """
+        Write several lines in one write, rotating first if needed.
+
+        Args:
+            lines (list): The strings to write.
+
+        """
+        self.write("".join(lines))
+
     def seek(self, *args, **kwargs):
         """
         Convenience method for accessing our _file attribute's seek method,
@@ -473,6 +620,9 @@ class EvenniaLogFile(logfile.LogFile):
 _LOG_FILE_HANDLES = {}  # holds open log handles
 _LOG_FILE_HANDLE_COUNTS = {}
 _LOG_FILE_HANDLE_RESET = 500
+# held while opening or using a cached handle, which the log writer thread
+# shares with callers in the reactor
+_LOG_FILE_LOCK = threading.RLock()
 
 
 def _open_log_file(filename):
@@ -485,6 +635,9 @@ def _open_log_file(filename):
     _LOG_FILE_HANDLE_RESET accesses. This may help resolve issues for very
     long uptimes and heavy log use.
 
+    Hold _LOG_FILE_LOCK for as long as the returned handle is used, so it
+    isn't closed by another thread in the meantime.
+
     """
     # we delay import of settings to keep logger module as free
     # from django as possible.
@@ -496,31 +649,173 @@ def _open_log_file(filename):
         _LOG_ROTATE_SIZE = max(1000, settings.CHANNEL_LOG_ROTATE_SIZE)
 
     filename = os.path.join(_LOGDIR, filename)
-    if filename in _LOG_FILE_HANDLES:
-        _LOG_FILE_HANDLE_COUNTS[filename] += 1
-        if _LOG_FILE_HANDLE_COUNTS[filename] > _LOG_FILE_HANDLE_RESET:
-            # close/refresh handle
-            _LOG_FILE_HANDLES[filename].close()
-            del _LOG_FILE_HANDLES[filename]
-        else:
-            # return cached handle
-            return _LOG_FILE_HANDLES[filename]
-    try:
-        filehandle = EvenniaLogFile.fromFullPath(
-            filename, rotateLength=_LOG_ROTATE_SIZE
-        )
-        # filehandle = open(filename, "a+")  # append mode + reading
-        _LOG_FILE_HANDLES[filename] = filehandle
-        _LOG_FILE_HANDLE_COUNTS[filename] = 0
-        return filehandle
-    except IOError:
-        log_trace()
+    with _LOG_FILE_LOCK:
+        if filename in _LOG_FILE_HANDLES:
+            _LOG_FILE_HANDLE_COUNTS[filename] += 1
+            if _LOG_FILE_HANDLE_COUNTS[filename] > _LOG_FILE_HANDLE_RESET:
+                # close/refresh handle
+                _LOG_FILE_HANDLES[filename].close()
+                del _LOG_FILE_HANDLES[filename]
+            else:
+                # return cached handle
+                return _LOG_FILE_HANDLES[filename]
+        try:
+            filehandle = EvenniaLogFile.fromFullPath(
+                filename, rotateLength=_LOG_ROTATE_SIZE
+            )
+            # filehandle = open(filename, "a+")  # append mode + reading
+            _LOG_FILE_HANDLES[filename] = filehandle
+            _LOG_FILE_HANDLE_COUNTS[filename] = 0
+            return filehandle
+        except IOError:
+            log_trace()
     return None
 
 
+# bounded, so a stuck disk can't eat all memory
+LOG_QUEUE_SIZE = 10000
+# most lines taken off the queue before they are written and flushed
+LOG_BATCH_SIZE = 500
+# how long log_file waits for room in a full queue before dropping the line
+LOG_QUEUE_TIMEOUT = 0.5
+
+_LOG_WRITER_STOP = object()
+
+
+class LogWriter:
+    """
+    Writes log_file lines from a single background thread.
+
+    Lines are queued with their time. The writer takes them off the queue in
+    batches, groups them per file and writes each file's lines with one
+    `writelines` and one flush. When the queue is full, a line logged from
+    the reactor thread is dropped at once, so a stuck disk can't freeze the
+    game. Other threads wait up to LOG_QUEUE_TIMEOUT for room before their
+    line is dropped.
+
+    Attributes:
+        stats (dict): Counters of lines queued, written and dropped, batches
+            written, puts that had to wait for room, and the deepest the
+            queue has been.
+    """
+
+    def __init__(self, maxsize=LOG_QUEUE_SIZE, batch_size=LOG_BATCH_SIZE):
+        self.batch_size = batch_size
+        self.stats = {
+            "queued": 0,
+            "written": 0,
+            "dropped": 0,
+            "batches": 0,
+            "blocked": 0,
+            "high_water": 0,
+        }
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start the writer thread, if it isn't running."""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="LogWriter", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout=10):
+        """
+        Write everything queued so far, then stop the writer thread.
+
+        Args:
+            timeout (float, optional): Most seconds to wait for the queue to
+                drain, including waiting for room to ask the writer to stop.
+
+        """
+        thread = self._thread
+        if not (thread and thread.is_alive()):
+            return
+        deadline = time.monotonic() + timeout
+        try:
+            self._queue.put(_LOG_WRITER_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        thread.join(max(0, deadline - time.monotonic()))
+
+    def put(self, filename, msg):
+        """
+        Queue a line for a log file.
+
+        Args:
+            filename (str): The log file, within the log dir.
+            msg (str): The line, without its timestamp.
+
+        """
+        self.start()
+        item = (filename, time.time(), msg)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            if threadable.isInIOThread():
+                self.stats["dropped"] += 1
+                return
+            self.stats["blocked"] += 1
+            try:
+                self._queue.put(item, timeout=LOG_QUEUE_TIMEOUT)
+            except queue.Full:
+                self.stats["dropped"] += 1
+                return
+        self.stats["queued"] += 1
+        self.stats["high_water"] = max(
+            self.stats["high_water"], self._queue.qsize()
+        )
+
+    def _run(self):
+        while True:
+            stop = False
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if _LOG_WRITER_STOP in batch:
+                stop = True
+                batch = [item for item in batch if item is not _LOG_WRITER_STOP]
+
+            self._write(batch)
+            if stop:
+                return
+
+    def _write(self, batch):
+        """Write a batch of lines, grouped per file."""
+        lines = defaultdict(list)
+        for filename, when, msg in batch:
+            lines[filename].append(f"\n{timeformat(when)} [-] {msg.strip()}")
+
+        for filename, file_lines in lines.items():
+            try:
+                with _LOG_FILE_LOCK:
+                    filehandle = _open_log_file(filename)
+                    if not filehandle:
+                        continue
+                    filehandle.writelines(file_lines)
+                    # since we don't close the handle, we need to flush
+                    # manually or log file won't be written to until the
+                    # write buffer is full.
+                    filehandle.flush()
+                self.stats["written"] += len(file_lines)
+            except Exception:
+                log_trace()
+        self.stats["batches"] += 1
+
+
+LOG_WRITER = LogWriter()
+
+
 def log_file(msg, filename="game.log"):
     """
-    Arbitrary file logger using threads.
+    Arbitrary file logger using a background writer thread.
 
     Args:
         msg (str): String to append to logfile.
@@ -529,24 +824,7 @@ def log_file(msg, filename="game.log"):
             on new lines following datetime info.
 
     """
-
-    def callback(filehandle, msg):
-        """Writing to file and flushing result"""
-        msg = "\n%s [-] %s" % (timeformat(), msg.strip())
-        filehandle.write(msg)
-        # since we don't close the handle, we need to flush
-        # manually or log file won't be written to until the
-        # write buffer is full.
-        filehandle.flush()
-
-    def errback(failure):
-        """Catching errors to normal log"""
-        log_trace()
-
-    # save to server/logs/ directory
-    filehandle = _open_log_file(filename)
-    if filehandle:
-        deferToThread(callback, filehandle, msg).addErrback(errback)
+    LOG_WRITER.put(filename, msg)
 
 
 def log_file_exists(filename="game.log"):
@@ -582,9 +860,10 @@ def rotate_log_file(filename="game.log", num_lines_to_append=None):
 
     """
     if log_file_exists(filename):
-        file_handle = _open_log_file(filename)
-        if file_handle:
-            file_handle.rotate(num_lines_to_append=num_lines_to_append)
+        with _LOG_FILE_LOCK:
+            file_handle = _open_log_file(filename)
+            if file_handle:
+                file_handle.rotate(num_lines_to_append=num_lines_to_append)
 
 
 def delete_log_file(filename):
@@ -632,17 +911,23 @@ def tail_log_file(filename, offset, nlines, callback=None):
         lines_found = []
         buffer_size = 4098
         block_count = -1
-        while len(lines_found) < (offset + nlines):
-            try:
-                # scan backwards in file, starting from the end
-                filehandle.seek(block_count * buffer_size, os.SEEK_END)
-            except IOError:
-                # file too small for this seek, take what we've got
-                filehandle.seek(0)
+        with _LOG_FILE_LOCK:
+            if filehandle.closed:
+                # reset by another thread since we got it
+                filehandle = _open_log_file(filename)
+                if not filehandle:
+                    return None
+            while len(lines_found) < (offset + nlines):
+                try:
+                    # scan backwards in file, starting from the end
+                    filehandle.seek(block_count * buffer_size, os.SEEK_END)
+                except IOError:
+                    # file too small for this seek, take what we've got
+                    filehandle.seek(0)
+                    lines_found = filehandle.readlines()
+                    break
                 lines_found = filehandle.readlines()
-                break
-            lines_found = filehandle.readlines()
-            block_count -= 1
+                block_count -= 1
         # return the right number of lines
         lines_found = lines_found[-nlines - offset : -offset if offset else None]
         if callback:
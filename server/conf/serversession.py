@@ -21,9 +21,73 @@ settings file:
 
 """
 
+from django.conf import settings
 from evennia.server.serversession import ServerSession as BaseServerSession
+from twisted.internet import reactor
+
 from utils.colors import hex_to_xterm
 
+# Colour capability profiles. The portal does the final rendering for each
+# protocol; the server only downgrades hex colours, which every profile that
+# shows colour needs, and can skip the work for clients that show none.
+PROFILE_NONE = "none"
+PROFILE_HTML = "html"
+PROFILE_TRUECOLOR = "truecolor"
+PROFILE_XTERM256 = "xterm256"
+PROFILE_ANSI = "ansi"
+
+_WEBCLIENT_PROTOCOLS = ("websocket", "ajax/comet", "webclient")
+
+# the conversion each profile needs, None for none at all. hex_to_xterm
+# caches whole messages, so a broadcast is only converted once.
+_CONVERTERS = {
+    PROFILE_NONE: None,
+    PROFILE_HTML: hex_to_xterm,
+    PROFILE_TRUECOLOR: hex_to_xterm,
+    PROFILE_XTERM256: hex_to_xterm,
+    PROFILE_ANSI: hex_to_xterm,
+}
+
+_COALESCE_OUTPUT = settings.SESSION_OUTPUT_COALESCING
+_COALESCE_MAX_SIZE = settings.SESSION_OUTPUT_COALESCING_MAX_SIZE
+
+
+def get_color_profile(session, options=None):
+    """
+    Get the colour capability profile of a session.
+
+    Args:
+        session (ServerSession): The session.
+        options (dict, optional): The per-message options, which can turn
+            colour off for one message.
+
+    Returns:
+        str: One of the PROFILE_* constants.
+    """
+    flags = session.protocol_flags
+    if not isinstance(options, dict):
+        options = {}
+    if options.get("nocolor", flags.get("NOCOLOR")) or options.get(
+        "screenreader", flags.get("SCREENREADER")
+    ):
+        return PROFILE_NONE
+    if session.protocol_key in _WEBCLIENT_PROTOCOLS:
+        return PROFILE_HTML
+    if flags.get("TRUECOLOR"):
+        return PROFILE_TRUECOLOR
+    if flags.get("XTERM256"):
+        return PROFILE_XTERM256
+    return PROFILE_ANSI
+
+
+def flush_all_output():
+    """Send the buffered output of every session, such as before a reload."""
+    from evennia.server.sessionhandler import SESSIONS
+
+    for session in SESSIONS.values():
+        if isinstance(session, ServerSession):
+            session.flush_output()
+
 
 class ServerSession(BaseServerSession):
     """
@@ -35,6 +99,18 @@ class ServerSession(BaseServerSession):
     through their session(s).
     """
 
+    # text buffered for the end of the tick, see SESSION_OUTPUT_COALESCING
+    _output_buffer = None
+    _output_key = None
+    _output_size = 0
+    _output_call = None
+
+    def at_disconnect(self, reason=None):
+        """Send any buffered output before the session goes away."""
+        super().at_disconnect(reason=reason)
+        # after the disconnect hooks, which may still message the session
+        self.flush_output()
+
     def data_out(self, **kwargs):
         """
         Sending data from Evennia->Client
@@ -46,15 +122,81 @@ class ServerSession(BaseServerSession):
                 for the protocol(s).
 
         """
-        try:
-            kwargs["text"] = (
-                hex_to_xterm(kwargs["text"][0])
-                if type(kwargs["text"]) == tuple
-                else hex_to_xterm(kwargs["text"])
-            )
-        except KeyError:
-            pass
+        text = kwargs.get("text")
+        convert = (
+            _CONVERTERS[get_color_profile(self, kwargs.get("options"))]
+            if text is not None
+            else None
+        )
+        if convert:
+            if isinstance(text, tuple):
+                if text and isinstance(text[0], str):
+                    kwargs["text"] = (convert(text[0]),) + text[1:]
+            elif isinstance(text, str):
+                kwargs["text"] = convert(text)
 
+        if _COALESCE_OUTPUT and self._buffer_output(kwargs):
+            return
+
+        # anything that can't be buffered goes out after what already is
+        self.flush_output()
         self.sessionhandler.data_out(self, **kwargs)
 
-    pass
+    def _buffer_output(self, kwargs):
+        """
+        Buffer a plain text message until the end of the tick.
+
+        Messages are merged only with ones that have the same text kwargs
+        and options. Prompts and any other send-commands are not buffered.
+
+        Returns:
+            bool: Whether the message was buffered.
+        """
+        if kwargs.keys() - {"options"} != {"text"}:
+            return False
+        options = kwargs.get("options")
+        if options and options.get("send_prompt"):
+            return False
+
+        text = kwargs["text"]
+        text, extra = (
+            (text[0], text[1:]) if isinstance(text, tuple) else (text, ())
+        )
+        if not isinstance(text, str):
+            return False
+
+        key = (extra, options)
+        if self._output_buffer and key != self._output_key:
+            self.flush_output()
+        if not self._output_buffer:
+            self._output_buffer = []
+            self._output_key = key
+            self._output_size = 0
+
+        self._output_buffer.append(text)
+        self._output_size += len(text)
+        if self._output_size >= _COALESCE_MAX_SIZE:
+            self.flush_output()
+        elif self._output_call is None:
+            self._output_call = reactor.callLater(0, self.flush_output)
+        return True
+
+    def flush_output(self):
+        """Send the buffered text output as one message."""
+        if self._output_call is not None:
+            if self._output_call.active():
+                self._output_call.cancel()
+            self._output_call = None
+        if not self._output_buffer:
+            return
+
+        text = "\n".join(self._output_buffer)
+        extra, options = self._output_key
+        self._output_buffer = None
+        self._output_key = None
+        self._output_size = 0
+
+        kwargs = {"text": (text, *extra) if extra else text}
+        if options is not None:
+            kwargs["options"] = options
+        self.sessionhandler.data_out(self, **kwargs)
@@ -258,6 +258,12 @@ TELNET_PROTOCOL_CLASS = "server.conf.telnet.TelnetProtocol"
 # Server-side session class used. This will inherit from BASE_SESSION_CLASS.
 # This one isn't as dangerous to replace.
 SERVER_SESSION_CLASS = "server.conf.serversession.ServerSession"
+# Buffer the text sent to each session during one reactor tick and send it as
+# one message at the end of the tick, or as soon as it grows past the max size
+# (in characters). Prompts and OOB messages flush the buffer first, so output
+# keeps its order.
+SESSION_OUTPUT_COALESCING = False
+SESSION_OUTPUT_COALESCING_MAX_SIZE = 16384
 
 # The Server SessionHandler manages all ServerSessions, handling logins,
 # ensuring the login process happens smoothly, handling expected and
@@ -0,0 +1,93 @@
+import os
+import shutil
+import tempfile
+import threading
+from unittest.mock import patch
+
+from evennia.utils.test_resources import BaseEvenniaTestCase
+
+from server.conf import logger
+
+
+class TestLogWriter(BaseEvenniaTestCase):
+    def setUp(self):
+        super().setUp()
+        self.logdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.logdir, ignore_errors=True)
+        patcher = patch.object(logger, "_LOGDIR", self.logdir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.close_handles)
+        self.writer = logger.LogWriter(maxsize=10, batch_size=4)
+        self.addCleanup(self.writer.stop)
+
+    def close_handles(self):
+        for filename in list(logger._LOG_FILE_HANDLES):
+            if filename.startswith(self.logdir):
+                logger._LOG_FILE_HANDLES.pop(filename).close()
+                logger._LOG_FILE_HANDLE_COUNTS.pop(filename, None)
+
+    def read(self, filename):
+        with open(os.path.join(self.logdir, filename)) as logfile:
+            return [
+                line.split(" [-] ")[1]
+                for line in logfile.read().split("\n")[1:]
+            ]
+
+    def stall(self):
+        """Keep the writer from taking anything more off the queue."""
+        release = threading.Event()
+        self.addCleanup(release.set)
+        self.writer._write = lambda batch: release.wait()
+        return release
+
+    def test_stop_drains_queue_in_order(self):
+        for i in range(30):
+            self.writer.put("a.log" if i % 3 else "b.log", f"line {i}")
+        self.writer.stop()
+        self.assertEqual(
+            self.read("a.log"), [f"line {i}" for i in range(30) if i % 3]
+        )
+        self.assertEqual(
+            self.read("b.log"), [f"line {i}" for i in range(0, 30, 3)]
+        )
+        self.assertEqual(self.writer.stats["queued"], 30)
+        self.assertEqual(self.writer.stats["written"], 30)
+        self.assertEqual(self.writer.stats["dropped"], 0)
+        self.assertLessEqual(self.writer.stats["high_water"], 10)
+
+    def test_restarts_after_stop(self):
+        self.writer.put("a.log", "first")
+        self.writer.stop()
+        self.writer.put("a.log", "second")
+        self.writer.stop()
+        self.assertEqual(self.read("a.log"), ["first", "second"])
+
+    @patch.object(logger.threadable, "isInIOThread", lambda: True)
+    @patch.object(logger, "LOG_QUEUE_TIMEOUT", 60)
+    def test_drops_at_once_in_reactor_when_full(self):
+        self.stall()
+        for i in range(20):
+            self.writer.put("a.log", f"line {i}")
+        self.assertGreater(self.writer.stats["dropped"], 0)
+        self.assertEqual(self.writer.stats["blocked"], 0)
+
+    @patch.object(logger.threadable, "isInIOThread", lambda: False)
+    @patch.object(logger, "LOG_QUEUE_TIMEOUT", 0.01)
+    def test_waits_for_room_in_other_threads(self):
+        self.stall()
+        for i in range(20):
+            self.writer.put("a.log", f"line {i}")
+        self.assertGreater(self.writer.stats["dropped"], 0)
+        self.assertGreaterEqual(
+            self.writer.stats["blocked"], self.writer.stats["dropped"]
+        )
+
+    @patch.object(logger, "LOG_QUEUE_TIMEOUT", 0.01)
+    def test_stop_gives_up_after_timeout(self):
+        release = self.stall()
+        for i in range(20):
+            self.writer.put("a.log", f"line {i}")
+        self.writer.stop(timeout=0.05)
+        self.assertTrue(self.writer._thread.is_alive())
+        release.set()
@@ -0,0 +1,159 @@
+import os
+import shutil
+import tempfile
+import threading
+from unittest.mock import patch
+
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from evennia.utils import create
+from evennia.utils import logger as evennia_logger
+from evennia.utils.test_resources import EvenniaTest
+from twisted.internet.task import Clock
+
+from server.conf import logger
+
+
+class FakeReactor(Clock):
+    """A clock that also runs calls handed over from other threads."""
+
+    def __init__(self):
+        super().__init__()
+        self.from_threads = []
+
+    def callFromThread(self, func, *args, **kwargs):
+        self.from_threads.append(threading.current_thread())
+        func(*args, **kwargs)
+
+
+class TestMudinfo(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        self.reactor = FakeReactor()
+        for name, value in (
+            ("reactor", self.reactor),
+            ("_MUDINFO_CHANNEL", None),
+            ("_MUDINFO_CALL", None),
+            ("_MUDINFO_QUEUE", []),
+        ):
+            patcher = patch.object(logger, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = patch.object(
+            logger.threadable,
+            "isInIOThread",
+            lambda: threading.current_thread() is threading.main_thread(),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # creating a channel rotates its log, so keep it out of server/logs
+        self.logdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.logdir, ignore_errors=True)
+        patcher = patch.object(evennia_logger, "_LOGDIR", self.logdir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.close_handles)
+
+        self.channel = self.create_channel()
+        self.sent = []
+
+    def close_handles(self):
+        for filename in list(evennia_logger._LOG_FILE_HANDLES):
+            if filename.startswith(self.logdir):
+                evennia_logger._LOG_FILE_HANDLES.pop(filename).close()
+                evennia_logger._LOG_FILE_HANDLE_COUNTS.pop(filename, None)
+
+    def create_channel(self):
+        channel = create.create_channel(settings.CHANNEL_MUDINFO["key"])
+        patcher = patch.object(
+            channel,
+            "msg",
+            # wrap closes every line with |n
+            lambda message, **kwargs: self.sent.append(
+                message.replace("|n", "")
+            ),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return channel
+
+    def test_sends_batch_after_interval(self):
+        logger.send_mudinfo("one")
+        logger.send_mudinfo("two")
+        self.assertEqual(self.sent, [])
+        self.reactor.advance(logger.MUDINFO_FLUSH_INTERVAL)
+        self.assertEqual(self.sent, ["one\ntwo"])
+        self.assertEqual(self.reactor.getDelayedCalls(), [])
+
+    def test_counts_repeats(self):
+        for _ in range(3):
+            logger.send_mudinfo("Server restarted.")
+        logger.flush_mudinfo()
+        self.assertEqual(self.sent, ["Server restarted. (x3)"])
+
+    def test_summarizes_login_storm(self):
+        logger.send_mudinfo("Reloading.")
+        for i in range(12):
+            logger.send_mudinfo(
+                f"Logged in: user{i}", event="logins", subject=f"user{i}"
+            )
+        logger.send_mudinfo("Logged out: bob", event="logouts", subject="bob")
+        logger.flush_mudinfo()
+        names = ", ".join(f"user{i}" for i in range(10))
+        lines = self.sent[0].split("\n")
+        self.assertEqual(lines[0], "Reloading.")
+        # the summary is wrapped over several lines
+        self.assertEqual(
+            " ".join(" ".join(lines[1:-1]).split()),
+            f"12 logins in the last 1s: {names}, and 2 more",
+        )
+        self.assertEqual(lines[-1], "Logged out: bob")
+
+    def test_caps_lines(self):
+        for i in range(30):
+            logger.send_mudinfo(f"line {i}")
+        logger.flush_mudinfo()
+        lines = self.sent[0].split("\n")
+        self.assertEqual(len(lines), logger.MUDINFO_MAX_LINES)
+        self.assertEqual(lines[-1], "... and 11 more messages in the last 1s.")
+
+    def test_caches_channel(self):
+        logger.send_mudinfo("one")
+        logger.flush_mudinfo()
+        logger.send_mudinfo("two")
+        with CaptureQueriesContext(connection) as queries:
+            logger.flush_mudinfo()
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(self.sent, ["one", "two"])
+
+    def test_finds_recreated_channel(self):
+        logger.send_mudinfo("one")
+        logger.flush_mudinfo()
+        self.channel.delete()
+        logger.send_mudinfo("lost")
+        logger.flush_mudinfo()
+        self.create_channel()
+        logger.send_mudinfo("two")
+        logger.flush_mudinfo()
+        self.assertEqual(self.sent, ["one", "two"])
+
+    def test_keeps_channel_logs_out_of_log_dir(self):
+        logfile = self.channel.get_log_filename()
+        open(os.path.join(self.logdir, logfile), "w").close()
+        before = os.listdir(settings.LOG_DIR)
+        self.channel.delete()
+        self.create_channel()
+        self.assertIn(logfile + ".1", os.listdir(self.logdir))
+        self.assertEqual(os.listdir(settings.LOG_DIR), before)
+
+    def test_queues_from_other_threads(self):
+        thread = threading.Thread(target=logger.send_mudinfo, args=("one",))
+        thread.start()
+        thread.join()
+        logger.send_mudinfo("two")
+        self.assertEqual(self.reactor.from_threads, [thread])
+        self.assertEqual(len(self.reactor.getDelayedCalls()), 1)
+        self.reactor.advance(logger.MUDINFO_FLUSH_INTERVAL)
+        self.assertEqual(self.sent, ["one\ntwo"])
@@ -0,0 +1,142 @@
+from unittest.mock import MagicMock, patch
+
+from evennia.utils.test_resources import BaseEvenniaTestCase
+from twisted.internet.task import Clock
+
+from server.conf import serversession
+from utils import colors
+
+
+def make_session(**flags):
+    """Get a telnet session that records what it sends."""
+    session = serversession.ServerSession()
+    session.protocol_key = "telnet"
+    session.protocol_flags = {"XTERM256": True, **flags}
+    session.sent = []
+    session.sessionhandler = MagicMock()
+    session.sessionhandler.data_out = lambda sess, **kwargs: sess.sent.append(
+        kwargs
+    )
+    return session
+
+
+class TestOutputCoalescing(BaseEvenniaTestCase):
+    def setUp(self):
+        super().setUp()
+        self.clock = Clock()
+        for name, value in (
+            ("_COALESCE_OUTPUT", True),
+            ("_COALESCE_MAX_SIZE", 20),
+            ("reactor", self.clock),
+        ):
+            patcher = patch.object(serversession, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.session = make_session()
+
+    def test_merges_text_until_end_of_tick(self):
+        self.session.data_out(text="one")
+        self.session.data_out(text="two")
+        self.assertEqual(self.session.sent, [])
+        self.clock.advance(0)
+        self.assertEqual(self.session.sent, [{"text": "one\ntwo"}])
+
+    def test_merges_only_same_kwargs_and_options(self):
+        self.session.data_out(text=("one", {"type": "say"}))
+        self.session.data_out(text=("two", {"type": "say"}))
+        self.session.data_out(text=("three", {"type": "pose"}))
+        self.session.data_out(text="four", options={"raw": True})
+        self.session.flush_output()
+        self.assertEqual(
+            self.session.sent,
+            [
+                {"text": ("one\ntwo", {"type": "say"})},
+                {"text": ("three", {"type": "pose"})},
+                {"text": "four", "options": {"raw": True}},
+            ],
+        )
+
+    def test_keeps_order_around_oob_and_prompts(self):
+        self.session.data_out(text="one")
+        self.session.data_out(prompt="HP: 10")
+        self.session.data_out(text="two")
+        self.session.data_out(text="three", options={"send_prompt": True})
+        self.session.data_out(client_options={"screenwidth": 80})
+        self.assertEqual(
+            self.session.sent,
+            [
+                {"text": "one"},
+                {"prompt": "HP: 10"},
+                {"text": "two"},
+                {"text": "three", "options": {"send_prompt": True}},
+                {"client_options": {"screenwidth": 80}},
+            ],
+        )
+
+    def test_sends_once_past_max_size(self):
+        self.session.data_out(text="x" * 12)
+        self.assertEqual(self.session.sent, [])
+        self.session.data_out(text="y" * 12)
+        self.assertEqual(
+            self.session.sent, [{"text": "x" * 12 + "\n" + "y" * 12}]
+        )
+        self.session.data_out(text="z")
+        self.clock.advance(0)
+        self.assertEqual(self.session.sent[1:], [{"text": "z"}])
+        self.assertEqual(self.clock.getDelayedCalls(), [])
+
+    def test_disconnect_sends_output_of_disconnect_hooks(self):
+        def at_disconnect(session, reason=None):
+            session.data_out(text="Goodbye!")
+
+        self.session.data_out(text="one")
+        with patch.object(
+            serversession.BaseServerSession, "at_disconnect", at_disconnect
+        ):
+            self.session.at_disconnect()
+        self.assertEqual(self.session.sent, [{"text": "one\nGoodbye!"}])
+        self.assertEqual(self.clock.getDelayedCalls(), [])
+
+    def test_flushes_every_session_before_stop(self):
+        from evennia.server.sessionhandler import SESSIONS
+
+        other = make_session()
+        self.session.data_out(text="one")
+        other.data_out(text="two")
+        with patch.dict(SESSIONS, {1: self.session, 2: other}, clear=True):
+            serversession.flush_all_output()
+        self.assertEqual(self.session.sent, [{"text": "one"}])
+        self.assertEqual(other.sent, [{"text": "two"}])
+
+
+class TestColorProfiles(BaseEvenniaTestCase):
+    def setUp(self):
+        super().setUp()
+        colors._hex_to_xterm_cached.cache_clear()
+
+    def test_converts_once_for_all_profiles(self):
+        sessions = [
+            make_session(),
+            make_session(TRUECOLOR=True),
+            make_session(XTERM256=False),
+            make_session(NOCOLOR=True),
+        ]
+        webclient = make_session()
+        webclient.protocol_key = "websocket"
+        sessions.append(webclient)
+
+        text = "|#ff0000Fire!|n"
+        for session in sessions:
+            session.data_out(text=(text, {"type": "say"}))
+        stats = colors.color_cache_stats()["hex_to_xterm"]
+        self.assertEqual((stats["misses"], stats["hits"]), (1, 3))
+        self.assertEqual(sessions[3].sent, [{"text": (text, {"type": "say"})}])
+        self.assertEqual(sessions[0].sent[0]["text"][0], "|500Fire!|n")
+
+    def test_skips_conversion_without_colour(self):
+        session = make_session()
+        session.data_out(text="|#ff0000Fire!|n", options={"screenreader": True})
+        self.assertEqual(session.sent[0]["text"], "|#ff0000Fire!|n")
+        self.assertEqual(
+            colors.color_cache_stats()["hex_to_xterm"]["misses"], 0
+        )
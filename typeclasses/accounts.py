@@ -153,7 +153,9 @@ class Account(DefaultAccount):
         logger.send_mudinfo(
             _("|RLogged out: {key} ({sessions})|n").format(
                 key=self.key, sessions=sessions
-            )
+            ),
+            event="logouts",
+            subject=self.key,
         )
 
     def at_post_login(self, session=None, **kwargs):
@@ -191,7 +193,9 @@ class Account(DefaultAccount):
         logger.send_mudinfo(
             ("|GLogged in: {key} ({addr}) ({sessions})|n").format(
                 key=self.key, addr=addr, sessions=sessions_str
-            )
+            ),
+            event="logins",
+            subject=self.key,
         )
 
         if settings.AUTO_PUPPET_ON_LOGIN:
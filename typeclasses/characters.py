@@ -27,6 +27,7 @@ from handlers.traits import TraitHandler
 from prototypes import flasks
 from utils.text import grammarize
 
+from .managers import CharacterManager
 from .objects import Object
 
 # Constants
@@ -60,6 +61,8 @@ class Character(Object, DefaultCharacter):
     at_post_puppet - Echoes "AccountName has entered the game" to the room.
     """
 
+    objects = CharacterManager()
+
     VALID_STATS = {"health", "mana", "stamina"}
 
     def at_object_creation(self):
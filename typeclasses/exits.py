@@ -36,6 +36,9 @@ class Exit(Object, DefaultExit):
         at_failed_traverse(traveller) - called by at_traverse if traversal failed for some reason. Will
                                         not be called if the attribute `err_traverse` is
                                         defined, in which case that will simply be echoed.
+
+    Setting `location` or `destination`, creating or deleting an exit drops the exit index of
+    the room it is in (see `Object.get_exit_to`).
     """
 
     def basetype_setup(self):
@@ -65,4 +68,24 @@ class Exit(Object, DefaultExit):
         if self.location and not self.destination:
             self.destination = self.location
 
-    pass
+        if self.location:
+            self.location.invalidate_exit_index()
+
+    @DefaultExit.location.setter
+    def location(self, location):
+        old_location = self.location
+        DefaultExit.location.fset(self, location)
+        for room in (old_location, self.location):
+            if room:
+                room.invalidate_exit_index()
+
+    @DefaultExit.destination.setter
+    def destination(self, destination):
+        DefaultExit.destination.fset(self, destination)
+        if self.location:
+            self.location.invalidate_exit_index()
+
+    def at_object_delete(self):
+        if self.location:
+            self.location.invalidate_exit_index()
+        return super().at_object_delete()
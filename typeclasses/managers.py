@@ -0,0 +1,68 @@
+"""
+Managers
+
+Custom database managers for the game's typeclasses. A manager is available
+as `Typeclass.objects` and offers queries that only return objects of that
+typeclass (and its children).
+"""
+
+from evennia.objects.manager import ObjectManager
+
+from handlers.quests import QUEST_TAG_CATEGORY, quest_tag
+
+
+class CharacterManager(ObjectManager):
+    """
+    Manager for Characters, adding indexed lookups on quest state.
+
+    Quest state is mirrored into tags by the QuestHandler, so these queries
+    never touch the pickled `quests` attribute.
+    """
+
+    def get_by_quest(self, quest, status=None, objective=None, online=False):
+        """
+        Find characters holding a quest, optionally at a given status.
+
+        Args:
+            quest (str): The quest key, e.g. "Arrival".
+            status (QuestProgress, optional): Only match characters whose quest
+                (or objective, if given) has this status.
+            objective (Enum, optional): The objective `status` applies to.
+            online (bool, optional): Only match characters whose account is
+                connected.
+
+        Returns:
+            QuerySet: The matching characters.
+
+        Examples:
+            Character.objects.get_by_quest("Arrival", QuestProgress.COMPLETED)
+            Character.objects.get_by_quest(
+                "Nautilus", QuestProgress.IN_PROGRESS, NautilusObjective.ESCAPE
+            )
+        """
+        characters = self.get_by_tag(
+            key=quest_tag(quest, status, objective),
+            category=QUEST_TAG_CATEGORY,
+        )
+        if online:
+            characters = characters.filter(db_account__db_is_connected=True)
+        return characters
+
+    def get_quest_eligible(self, quest, online=True):
+        """
+        Find characters that have not yet been given a quest.
+
+        Args:
+            quest (str): The quest key.
+            online (bool, optional): Only match characters whose account is
+                connected. Defaults to True.
+
+        Returns:
+            QuerySet: The characters without the quest.
+        """
+        characters = self.all()
+        if online:
+            characters = characters.filter(db_account__db_is_connected=True)
+        return characters.exclude(
+            id__in=self.get_by_quest(quest).values("id")
+        )
@@ -11,24 +11,172 @@ inheritance.
 
 """
 
+from collections import defaultdict
+
 from django.utils.translation import gettext as _
 from evennia.objects.objects import DefaultObject
 from evennia.prototypes import spawner
 from evennia.utils.funcparser import ACTOR_STANCE_CALLABLES, FuncParser
 from evennia.utils.utils import (
+    iter_to_str,
     lazy_property,
     make_iter,
     to_str,
 )
 
+from handlers.ambient import AMBIENT
 from handlers.appearance.appearance import AppearanceHandler
+from handlers.online import ONLINE
 from handlers.spawns import SpawnHandler
 from server.conf import logger
+from utils.funcparser import CompiledTemplate
 from utils.text import wrap
 
 PARSER = FuncParser(ACTOR_STANCE_CALLABLES)
 
 
+def _parse(text, caller, receiver):
+    """
+    Run the actor-stance PARSER on a string. Strings without any markup or
+    escape characters are returned as-is, since parsing would not change them.
+    Compiled templates only evaluate their callables.
+    """
+    if isinstance(text, CompiledTemplate):
+        return text.render(caller=caller, receiver=receiver)
+    if isinstance(text, str) and "$" not in text and "\\" not in text:
+        return text
+    return PARSER.parse(text, caller=caller, receiver=receiver)
+
+
+def compile_message(text):
+    """
+    Compile a message for `msg` and `msg_contents` once, ahead of time.
+
+    Messages sent over and over, like gestures, can be compiled when their
+    module is imported. Sending them then only evaluates their actor-stance
+    callables for each receiver, without tokenizing the string again.
+
+    Args:
+        text (str): The message, with `$You()`-style calls.
+
+    Returns:
+        CompiledTemplate: The compiled message.
+    """
+    return CompiledTemplate(text, PARSER)
+
+
+COMPASS_DIRECTIONS = (
+    "north",
+    "west",
+    "south",
+    "east",
+    "northeast",
+    "northwest",
+    "southwest",
+    "southeast",
+)
+
+
+def _arrival_direction(exit_name):
+    """Phrase where someone arrives from, given the exit leading back."""
+    if exit_name in COMPASS_DIRECTIONS:
+        return f"the {exit_name}"
+    if exit_name == "up":
+        return "above"
+    if exit_name == "down":
+        return "below"
+    return exit_name
+
+
+def _group_names(objs, looker):
+    """List objects for a looker, counting duplicates: 'Bob and two wolves'."""
+    grouped = defaultdict(list)
+    for obj in objs:
+        grouped[obj.get_display_name(looker)].append(obj)
+    return iter_to_str(
+        objlist[0].get_numbered_name(
+            len(objlist), looker, key=name, return_string=True
+        )
+        for name, objlist in grouped.items()
+    )
+
+
+def _announce_group(location, movers, verb, phrase, move_type):
+    """Send one aggregated movement message to each bystander."""
+    movers = list(movers)
+    verb = verb if len(movers) > 1 else f"{verb}s"
+    for receiver in location.contents:
+        # NPCs and scripted objects react to movement through msg too
+        if receiver in movers:
+            continue
+        names = _group_names(movers, receiver)
+        text = f"{names[0].upper()}{names[1:]} {verb} {phrase}."
+        receiver.msg(text=(text, {"type": move_type}), from_obj=movers[0])
+
+
+def move_group(objs, destination, move_type="move", **kwargs):
+    """
+    Move several objects together, announcing them as one group.
+
+    Bystanders get one departure and one arrival message per group ("Alice,
+    Bob and three wolves leave north.") instead of one per mover, and each
+    mover with an account gets a single look at the destination.
+
+    Args:
+        objs (iterable): The objects to move.
+        destination (Object): Where to move them.
+        move_type (str, optional): The type of move, passed to `move_to`.
+        **kwargs: Passed on to `move_to`.
+
+    Returns:
+        list: The objects that were moved.
+    """
+    sources = defaultdict(list)
+    for obj in objs:
+        source = obj.location
+        if obj.move_to(
+            destination,
+            quiet=True,
+            move_type=move_type,
+            auto_look=False,
+            **kwargs,
+        ):
+            sources[source].append(obj)
+
+    moved = []
+    for source, movers in sources.items():
+        moved.extend(movers)
+        if source:
+            exit_obj = source.get_exit_to(destination)
+            _announce_group(
+                source,
+                movers,
+                "leave",
+                exit_obj.get_display_name(source)
+                if exit_obj
+                else "in a poof of smoke",
+                move_type,
+            )
+        exit_obj = destination.get_exit_to(source)
+        _announce_group(
+            destination,
+            movers,
+            "arrive",
+            "from "
+            + (
+                _arrival_direction(exit_obj.get_display_name(destination))
+                if exit_obj
+                else "somewhere"
+            ),
+            move_type,
+        )
+
+    for obj in moved:
+        if obj.has_account and destination.access(obj, "view"):
+            obj.msg(text=(obj.at_look(destination), {"type": "look"}))
+    return moved
+
+
 class ObjectParent:
     """
     This is a mixin that can be used to override *all* entities inheriting at
@@ -254,6 +402,18 @@ class Object(ObjectParent, DefaultObject):
             f"{self.name} enters the game (Account: {self.account})."
         )
         super().at_post_puppet(**kwargs)
+        ONLINE.add(self)
+        if self.location:
+            AMBIENT.add(self.location)
+
+    def at_post_unpuppet(self, account=None, session=None, **kwargs):
+        # characters are moved to None on logout, so remember where they were
+        location = self.location
+        super().at_post_unpuppet(account=account, session=session, **kwargs)
+        if not self.sessions.count():
+            ONLINE.discard(self)
+        if location:
+            AMBIENT.update(location, exclude=self)
 
     def basetype_setup(self):
         """
@@ -325,6 +485,44 @@ class Object(ObjectParent, DefaultObject):
 
         return description
 
+    def get_exit_to(self, destination):
+        """
+        Get the exit in this location that leads to a destination.
+
+        Exits are indexed by destination on first use, so movement messages
+        don't have to scan the contents on every step. Exits drop the index
+        of their location when they are created, moved, relinked or deleted.
+
+        Args:
+            destination (Object): The destination to look for.
+
+        Returns:
+            Exit or None: The first exit here leading to the destination.
+        """
+        if not destination:
+            return None
+
+        index = self.ndb.exit_index
+        if index is None:
+            index = {}
+            for obj in self.contents:
+                if obj.destination and obj.location is self:
+                    index.setdefault(obj.destination.id, obj)
+            self.ndb.exit_index = index
+        return index.get(destination.id)
+
+    def invalidate_exit_index(self):
+        """Drop the exit index, rebuilding it on the next lookup."""
+        self.ndb.exit_index = None
+
+    def at_post_move(self, source_location, move_type="move", **kwargs):
+        """
+        Called after a move. Characters look around unless `auto_look` is
+        False, as in `move_group`, which sends the looks itself.
+        """
+        if kwargs.pop("auto_look", True):
+            super().at_post_move(source_location, move_type=move_type, **kwargs)
+
     def announce_move_to(
         self,
         source_location,
@@ -355,31 +553,12 @@ class Object(ObjectParent, DefaultObject):
 
         origin = source_location
         destination = self.location
-        exits = [
-            o
-            for o in destination.contents
-            if o.location is destination and o.destination is origin
-        ]
-
-        if exits:
-            exit_name = exits[0].get_display_name(self.location)
-            if exit_name in [
-                "north",
-                "west",
-                "south",
-                "east",
-                "northeast",
-                "northwest",
-                "southwest",
-                "southeast",
-            ]:
-                exit_traversed = f"the {exit_name}"
-            elif exit_name == "up":
-                exit_traversed = "above"
-            elif exit_name == "down":
-                exit_traversed = "below"
-            else:
-                exit_traversed = exit_name
+        exit_obj = destination.get_exit_to(origin)
+
+        if exit_obj:
+            exit_traversed = _arrival_direction(
+                exit_obj.get_display_name(self.location)
+            )
             string = _("{object} arrives from {exit_traversed}.")
         elif origin:
             string = _("{object} arrives from somewhere.")
@@ -390,7 +569,7 @@ class Object(ObjectParent, DefaultObject):
         mapping.update(
             {
                 "object": self,
-                "exit_traversed": exit_traversed if exits else "nowhere",
+                "exit_traversed": exit_traversed if exit_obj else "nowhere",
                 "origin": origin or "nowhere",
                 "destination": destination or "nowhere",
             }
@@ -427,19 +606,15 @@ class Object(ObjectParent, DefaultObject):
 
         string = msg or "{object} leaves {exit_traversed}."
         location = self.location
-        exits = [
-            o
-            for o in location.contents
-            if o.location is location and o.destination is destination
-        ]
+        exit_obj = location.get_exit_to(destination)
 
         mapping = mapping or {}
         mapping.update(
             {
                 "object": self,
                 "exit_traversed": (
-                    exits[0].get_display_name(self.location)
-                    if exits
+                    exit_obj.get_display_name(self.location)
+                    if exit_obj
                     else "in a poof of smoke"
                 ),
             }
@@ -459,7 +634,7 @@ class Object(ObjectParent, DefaultObject):
         Emits something to a session attached to the object.
 
         Keyword Args:
-            text (str or tuple): The message to send. This
+            text (str, CompiledTemplate or tuple): The message to send. This
                 is treated internally like any send-command, so its
                 value can be a tuple if sending multiple arguments to
                 the `text` oob command.
@@ -501,11 +676,11 @@ class Object(ObjectParent, DefaultObject):
             parse_caller = from_obj if from_obj else self
             if isinstance(text, tuple):
                 text = (
-                    PARSER.parse(text[0], caller=parse_caller, receiver=self),
+                    _parse(text[0], parse_caller, self),
                     *text[1:],
                 )
-            elif isinstance(text, str):
-                text = PARSER.parse(text, caller=parse_caller, receiver=self)
+            elif isinstance(text, (str, CompiledTemplate)):
+                text = _parse(text, parse_caller, self)
             else:
                 try:
                     text = to_str(text)
@@ -532,6 +707,119 @@ class Object(ObjectParent, DefaultObject):
             if kwargs.get("text", None):
                 watcher.msg(text=kwargs["text"])
 
+    def msg_contents(
+        self,
+        text=None,
+        exclude=None,
+        from_obj=None,
+        mapping=None,
+        raise_funcparse_errors=False,
+        **kwargs,
+    ):
+        """
+        Emits a message to all objects inside this object.
+
+        Args:
+            text (str, CompiledTemplate or tuple): Message to send. If a tuple,
+                this should be on the valid OOB outmessage form
+                `(message, {kwargs})`, where kwargs are optional data passed to
+                the `text` outputfunc. The message will be parsed for `{key}`
+                formatting and `$You/$you()/$You()`, `$obj(name)`,
+                `$conj(verb)` and `$pron(pronoun, option)` inline function
+                callables. A message compiled with `compile_message` is not
+                parsed again, only its callables are evaluated.
+            exclude (list, optional): A list of objects not to send to.
+            from_obj (Object, optional): An object designated as the
+                "sender" of the message. See `DefaultObject.msg()` for
+                more info. This will be used for `$You/you` if using funcparser
+                inlines in the message.
+            mapping (dict, optional): A mapping of formatting keys
+                `{"key":<object>, "key2":"string",...}` used to replace
+                `{key}` markers and `$you(key)` in the text.
+            raise_funcparse_errors (bool, optional): If set, a failing
+                `$func()` will lead to an outright error.
+
+        Keyword Args:
+            Keyword arguments will be passed on to `obj.msg()` for all
+            messaged objects.
+
+        Notes:
+            Receivers are grouped by perspective: the caller, each mapped
+            object and everyone else. Each group is keyed by the display names
+            its receivers see, so the message is parsed once per group and the
+            result is identical to rendering it for every receiver.
+        """
+        is_outgoing_string = isinstance(text, (str, CompiledTemplate))
+        is_outgoing_tuple = (
+            isinstance(text, tuple)
+            and len(text) > 0
+            and isinstance(text[0], (str, CompiledTemplate))
+        )
+        if not is_outgoing_string and not is_outgoing_tuple:
+            raise ValueError(
+                "Tried to msg_contents with invalid text type "
+                f"'{type(text)}'. Must be str or tuple."
+            )
+
+        outkwargs = (
+            text[1]
+            if is_outgoing_tuple and len(text) > 1 and isinstance(text[1], dict)
+            else {}
+        )
+        text = text if is_outgoing_string else text[0]
+        template = (
+            text
+            if isinstance(text, CompiledTemplate)
+            else CompiledTemplate(text, PARSER)
+        )
+
+        contents = self.contents
+        if exclude:
+            exclude = make_iter(exclude)
+            contents = [obj for obj in contents if obj not in exclude]
+
+        caller = from_obj if from_obj else self
+        mapping = mapping or {}
+        if "you" not in mapping:
+            mapping["you"] = caller
+        rendered = {}
+
+        for receiver in contents:
+            # director-stance names, as seen by this receiver
+            names = {
+                key: (
+                    obj.get_display_name(looker=receiver)
+                    if hasattr(obj, "get_display_name")
+                    else str(obj)
+                )
+                for key, obj in mapping.items()
+            }
+            perspective = (
+                receiver == caller,
+                tuple(key for key, obj in mapping.items() if obj == receiver),
+                caller.get_display_name(looker=receiver)
+                if hasattr(caller, "get_display_name")
+                else str(caller),
+                tuple(names.items()),
+            )
+
+            if (outmessage := rendered.get(perspective)) is None:
+                # actor-stance replacements
+                outmessage = template.render(
+                    raise_errors=raise_funcparse_errors,
+                    return_string=True,
+                    caller=caller,
+                    receiver=receiver,
+                    mapping=mapping,
+                )
+                # director-stance replacements
+                outmessage = outmessage.format_map(names)
+                rendered[perspective] = outmessage
+
+            receiver.msg(
+                text=(outmessage, outkwargs), from_obj=from_obj, **kwargs
+            )
+
     def spawn_clothing(self, clothing):
         for prot in clothing:
             matching_clothes = [
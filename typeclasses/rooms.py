@@ -9,7 +9,9 @@ from evennia.objects.objects import DefaultRoom
 from evennia.utils.utils import lazy_property
 
 from handlers import combat
+from handlers.ambient import AMBIENT
 from handlers.appearance.rooms import RoomAppearanceHandler
+from handlers.online import ONLINE
 
 from .objects import Object
 
@@ -40,7 +42,7 @@ class Room(Object, DefaultRoom):
 
     Room messages
     - Set `room_message_rate > 0` and add a list of `room_messages`. These will be randomly
-      echoed to the room at the given rate.
+      echoed to the room at the given rate, but only while a puppeted character is present.
     """
 
     def at_object_creation(self):
@@ -72,6 +74,31 @@ class Room(Object, DefaultRoom):
     def combat(self):
         return combat.CombatHandler(self, db_attribute_key="combat")
 
+    def at_object_receive(self, moved_obj, source_location, **kwargs):
+        """
+        Called after an object has entered this room.
+        """
+        super().at_object_receive(moved_obj, source_location, **kwargs)
+        if moved_obj.has_account:
+            AMBIENT.add(self)
+            ONLINE.relocate(moved_obj)
+
+    def at_object_leave(self, moved_obj, target_location, **kwargs):
+        """
+        Called just before an object leaves this room.
+        """
+        super().at_object_leave(moved_obj, target_location, **kwargs)
+        if moved_obj.has_account:
+            AMBIENT.update(self, exclude=moved_obj)
+
+    def at_rename(self, oldname, newname):
+        """
+        Called after the room's key has changed.
+        """
+        super().at_rename(oldname, newname)
+        if self.appearance.display_name == oldname:
+            self.appearance.display_name = newname
+
     def add_desc(self, desc, roomstate=None):
         self.appearance.add_desc(desc, roomstate)
 
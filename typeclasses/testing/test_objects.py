@@ -0,0 +1,197 @@
+from unittest.mock import MagicMock, patch
+
+from evennia.utils import create
+from evennia.utils.test_resources import EvenniaTest
+
+from commands.gestures.gestures import _COMPILED_GESTURES, _GESTURES
+from typeclasses.characters import Character
+from typeclasses.exits import Exit
+from typeclasses.objects import PARSER, Object, compile_message, move_group
+from typeclasses.rooms import Room
+
+
+class TestMoveGroup(EvenniaTest):
+    character_typeclass = Character
+    object_typeclass = Object
+    room_typeclass = Room
+    exit_typeclass = Exit
+
+    def setUp(self):
+        super().setUp()
+        self.wolves = [
+            create.create_object(Object, key="wolf", location=self.room1)
+            for _ in range(3)
+        ]
+        self.watcher = create.create_object(
+            Object, key="watcher", location=self.room1
+        )
+        self.guard = create.create_object(
+            Object, key="guard", location=self.room2
+        )
+        for obj in (self.char2, self.watcher, self.guard, *self.wolves):
+            obj.msg = MagicMock()
+
+    def texts(self, obj):
+        return [call.kwargs["text"][0] for call in obj.msg.call_args_list]
+
+    def test_moves_and_announces_group_once(self):
+        moved = move_group(self.wolves, self.room2)
+        self.assertEqual(moved, self.wolves)
+        self.assertTrue(all(wolf.location == self.room2 for wolf in moved))
+        self.assertEqual(self.texts(self.char2), ["Three wolves leave out."])
+
+    def test_announces_to_objects_without_accounts(self):
+        move_group(self.wolves, self.room2)
+        self.assertEqual(self.texts(self.watcher), ["Three wolves leave out."])
+        self.assertEqual(
+            self.texts(self.guard), ["Three wolves arrive from somewhere."]
+        )
+        for wolf in self.wolves:
+            wolf.msg.assert_not_called()
+
+
+class TestMsgContents(EvenniaTest):
+    character_typeclass = Character
+    object_typeclass = Object
+    room_typeclass = Room
+    exit_typeclass = Exit
+
+    def setUp(self):
+        super().setUp()
+        self.char1.msg = MagicMock()
+        self.char2.msg = MagicMock()
+
+    def received(self, obj):
+        return [call.kwargs["text"][0] for call in obj.msg.call_args_list]
+
+    def test_renders_per_perspective(self):
+        self.room1.msg_contents(
+            "$You() $conj(wave) at $you(target).",
+            from_obj=self.char1,
+            mapping={"target": self.char2},
+        )
+        # char1 is a builder, who see #ids after names
+        self.assertEqual(
+            self.received(self.char1),
+            [f"You wave at Char2(#{self.char2.id})."],
+        )
+        self.assertEqual(self.received(self.char2), ["Char waves at you."])
+
+    def test_maps_you_to_the_caller_by_default(self):
+        self.room1.msg_contents("{you} smiles.", from_obj=self.char2)
+        self.room1.msg_contents("{you} echoes.")
+        self.assertEqual(
+            self.received(self.char1),
+            [
+                f"Char2(#{self.char2.id}) smiles.",
+                f"Room(#{self.room1.id}) echoes.",
+            ],
+        )
+
+
+class TestExitIndex(EvenniaTest):
+    character_typeclass = Character
+    object_typeclass = Object
+    room_typeclass = Room
+    exit_typeclass = Exit
+
+    def setUp(self):
+        super().setUp()
+        self.room3 = create.create_object(Room, key="Room3")
+
+    def test_finds_exit_to_destination(self):
+        self.assertEqual(self.room1.get_exit_to(self.room2), self.exit)
+        self.assertIsNone(self.room1.get_exit_to(self.room3))
+        self.assertIsNone(self.room1.get_exit_to(None))
+        self.assertIsNone(self.room2.get_exit_to(self.room1))
+
+    def test_reuses_index_between_lookups(self):
+        self.room1.get_exit_to(self.room2)
+        index = self.room1.ndb.exit_index
+        self.room1.get_exit_to(self.room3)
+        self.assertIs(self.room1.ndb.exit_index, index)
+
+    def test_new_exit_invalidates_index(self):
+        self.room1.get_exit_to(self.room3)
+        north = create.create_object(
+            Exit, key="north", location=self.room1, destination=self.room3
+        )
+        self.assertEqual(self.room1.get_exit_to(self.room3), north)
+
+    def test_relinked_exit_invalidates_index(self):
+        self.room1.get_exit_to(self.room2)
+        self.exit.destination = self.room3
+        self.assertIsNone(self.room1.get_exit_to(self.room2))
+        self.assertEqual(self.room1.get_exit_to(self.room3), self.exit)
+
+    def test_moved_exit_invalidates_both_rooms(self):
+        self.room1.get_exit_to(self.room2)
+        self.room3.get_exit_to(self.room2)
+        self.exit.location = self.room3
+        self.assertIsNone(self.room1.get_exit_to(self.room2))
+        self.assertEqual(self.room3.get_exit_to(self.room2), self.exit)
+
+    def test_deleted_exit_invalidates_index(self):
+        self.room1.get_exit_to(self.room2)
+        self.exit.delete()
+        self.assertIsNone(self.room1.get_exit_to(self.room2))
+
+
+class TestCompileMessage(EvenniaTest):
+    character_typeclass = Character
+    object_typeclass = Object
+    room_typeclass = Room
+    exit_typeclass = Exit
+
+    def setUp(self):
+        super().setUp()
+        self.char1.msg = MagicMock()
+        self.char2.msg = MagicMock()
+
+    def received(self, obj):
+        texts = [call.kwargs["text"] for call in obj.msg.call_args_list]
+        obj.msg.reset_mock()
+        return texts
+
+    def test_compiles_every_gesture(self):
+        for gesture, templates in _COMPILED_GESTURES.items():
+            for gesture_type, template in templates.items():
+                with self.subTest(gesture=gesture, type=gesture_type):
+                    self.assertEqual(
+                        template.string, _GESTURES[gesture][gesture_type]
+                    )
+                    self.assertIsNotNone(template.segments)
+
+    def test_msg_contents_matches_uncompiled_message(self):
+        mapping = {"target": self.char1}
+        for templates in _GESTURES.values():
+            for string in templates.values():
+                with self.subTest(string=string):
+                    for text in (string, compile_message(string)):
+                        self.room1.msg_contents(
+                            text, from_obj=self.char2, mapping=dict(mapping)
+                        )
+                    for obj in (self.char1, self.char2):
+                        plain, compiled = self.received(obj)
+                        self.assertEqual(compiled, plain)
+
+    def test_msg_renders_compiled_message(self):
+        message = compile_message("$You() $conj(nod).")
+        del self.char1.msg
+        with patch.object(self.session, "data_out") as data_out:
+            self.char1.msg(message, from_obj=self.char2, session=self.session)
+            self.char1.msg((message, {"type": "pose"}), session=self.session)
+        self.assertEqual(
+            [call.kwargs["text"] for call in data_out.call_args_list],
+            [
+                f"Char2(#{self.char2.id}) nods.",
+                ("You nod.", {"type": "pose"}),
+            ],
+        )
+
+    def test_compiled_message_skips_parser(self):
+        message = compile_message("$You() $conj(wave).")
+        with patch.object(PARSER, "parse", wraps=PARSER.parse) as parse:
+            self.room1.msg_contents(message, from_obj=self.char1)
+        parse.assert_not_called()
+        self.assertEqual(self.received(self.char2), [("Char waves.", {})])
@@ -1,5 +1,6 @@
 # Courtesy of Inspector Caracal :)
 import re
+from functools import lru_cache
 
 from evennia.utils.ansi import strip_ansi as core_strip_ansi
 
@@ -48,6 +49,72 @@ def strip_ansi(message):
 
 
 # translate hex tags to XTERM tags
+_RE_HEX_TAG = re.compile(r"\|(\[?)#([0-9a-f]{6})", re.I)
+_RE_XTERM_TAG = re.compile(r"\|(\[?)([0-5][0-5][0-5]|\=[a-z])")
+
+# per-channel lookups, so converting a tag doesn't do any arithmetic
+_HUE_XTERM = tuple(str(round(max((n - 45), 0) / 40)) for n in range(256))
+_GREY_XTERM = tuple(
+    "=" + _GREYS[round(max((n - 8), 0) / 10)] for n in range(256)
+)
+_XTERM_HEX = {
+    f"{r}{g}{b}": "#"
+    + "".join(format(int(c) * 40 + 25, "02x") for c in (r, g, b))
+    for r in range(6)
+    for g in range(6)
+    for b in range(6)
+}
+_XTERM_HEX.update(
+    {
+        "=" + grey: "#" + format(i * 10 + 8, "02x") * 3
+        for i, grey in enumerate(_GREYS)
+    }
+)
+
+# whole messages converted, for prompts and descriptions sent over and over
+COLOR_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=4096)
+def _hex_tag_to_xterm(tag):
+    """Convert a lowercase 6-digit hex code to an xterm code."""
+    r, g, b = int(tag[:2], 16), int(tag[2:4], 16), int(tag[4:], 16)
+    if r == g and g == b:
+        # greyscale
+        return _GREY_XTERM[r]
+    return _HUE_XTERM[r] + _HUE_XTERM[g] + _HUE_XTERM[b]
+
+
+def _convert_tags(message, regex, convert):
+    """Replace every tag matched by a regex in one left-to-right pass."""
+    parts = []
+    pos = 0
+    for match in regex.finditer(message):
+        start, end = match.span()
+        bg, tag = match.groups()
+        parts.append(message[pos:start])
+        parts.append("|" + bg + convert(tag))
+        pos = end
+    if not parts:
+        return message
+    parts.append(message[pos:])
+    return "".join(parts)
+
+
+def _hex_to_xterm(message):
+    return _convert_tags(
+        message, _RE_HEX_TAG, lambda tag: _hex_tag_to_xterm(tag.lower())
+    )
+
+
+def _xterm_to_hex(message):
+    return _convert_tags(message, _RE_XTERM_TAG, _XTERM_HEX.__getitem__)
+
+
+_hex_to_xterm_cached = lru_cache(maxsize=COLOR_CACHE_SIZE)(_hex_to_xterm)
+_xterm_to_hex_cached = lru_cache(maxsize=COLOR_CACHE_SIZE)(_xterm_to_hex)
+
+
 def hex_to_xterm(message):
     """
     Converts all hex tags to xterm-format tags.
@@ -58,81 +125,46 @@ def hex_to_xterm(message):
     Returns:
         str: the text with converted tags
     """
-
-    def split_hex(text):
-        return (int(text[i : i + 2], 16) for i in range(0, 6, 2))
-
-    def grey_int(num):
-        return round(max((num - 8), 0) / 10)
-
-    def hue_int(num):
-        return round(max((num - 45), 0) / 40)
-
-    for match in reversed(list(_RE_HEX.finditer(message))):
-        start, end = match.span()
-        tag = match.group(1)
-        r, g, b = split_hex(tag)
-
-        if r == g and g == b:
-            # greyscale
-            i = grey_int(r)
-            message = message[:start] + "|=" + _GREYS[i] + message[end:]
-
-        else:
-            xtag = "|{}{}{}".format(hue_int(r), hue_int(g), hue_int(b))
-            message = message[:start] + xtag + message[end:]
-
-    for match in reversed(list(_RE_HEX_BG.finditer(message))):
-        start, end = match.span()
-        tag = match.group(1)
-        r, g, b = split_hex(tag)
-
-        if r == g and g == b:
-            # greyscale
-            i = grey_int(r)
-            message = message[:start] + "|[=" + _GREYS[i] + message[end:]
-
-        else:
-            xtag = "|[{}{}{}".format(hue_int(r), hue_int(g), hue_int(b))
-            message = message[:start] + xtag + message[end:]
-
-    return message
+    if type(message) is not str:
+        # ANSIStrings compare by their clean text, so can't be cached
+        return _hex_to_xterm(message)
+    if "|" not in message:
+        return message
+    return _hex_to_xterm_cached(message)
 
 
 def xterm_to_hex(message):
-    def hue_hex(text):
-        return format(int(text) * 40 + 25, "02x")
-
-    def grey_hex(text):
-        return format(_GREYS.index(text) * 10 + 8, "02x")
+    """
+    Converts all xterm tags to hex-format tags.
 
-    for match in reversed(list(_RE_XTERM.finditer(message))):
-        start, end = match.span()
-        tag = match.group(1)
-        if tag[0] == "=":
-            # greyscale
-            hex = grey_hex(tag[1])
-            message = message[:start] + "|#" + hex * 3 + message[end:]
+    Args:
+        message (str): the text to parse for tags
 
-        else:
-            r, g, b = tag
-            htag = "|#{}{}{}".format(hue_hex(r), hue_hex(g), hue_hex(b))
-            message = message[:start] + htag + message[end:]
+    Returns:
+        str: the text with converted tags
+    """
+    if type(message) is not str:
+        return _xterm_to_hex(message)
+    if "|" not in message:
+        return message
+    return _xterm_to_hex_cached(message)
 
-    for match in reversed(list(_RE_XTERM_BG.finditer(message))):
-        start, end = match.span()
-        tag = match.group(1)
-        if tag[0] == "=":
-            # greyscale
-            hex = grey_hex(tag[1])
-            message = message[:start] + "|[#" + hex * 3 + message[end:]
 
-        else:
-            r, g, b = tag
-            htag = "|[#{}{}{}".format(hue_hex(r), hue_hex(g), hue_hex(b))
-            message = message[:start] + htag + message[end:]
+def color_cache_stats():
+    """
+    Get statistics about the whole-message conversion caches.
 
-    return message
+    Returns:
+        dict: The hits, misses and size of the hex-to-xterm and
+            xterm-to-hex caches.
+    """
+    return {
+        name: cached.cache_info()._asdict()
+        for name, cached in (
+            ("hex_to_xterm", _hex_to_xterm_cached),
+            ("xterm_to_hex", _xterm_to_hex_cached),
+        )
+    }
 
 
 def rgb_to_hex(rgb):
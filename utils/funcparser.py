@@ -0,0 +1,134 @@
+"""
+Compiled FuncParser templates.
+
+A FuncParser re-tokenizes its input on every `parse` call. Templates that are
+rendered over and over (room descriptions, details, gestures) can instead be
+compiled once into a list of literal and callable segments, so rendering only
+has to evaluate the few `$func()` calls they contain.
+
+Only plain calls are compiled: `$func(arg, arg, ...)` where the function is
+known to the parser and the arguments hold no quotes, escapes, keywords,
+brackets, empty items or nested calls. Any other markup makes the whole
+template fall back to the parser, so the output never differs from
+`parser.parse`.
+"""
+
+import re
+from functools import lru_cache
+
+# Maximum number of distinct compiled templates kept in memory.
+TEMPLATE_CACHE_SIZE = 4096
+
+_RE_CALL = re.compile(r"\$(\w+)\(([^$()\"'\\=]*)\)")
+# the parser keeps commas inside brackets within a single argument
+_BRACKETS = frozenset("[]{}")
+
+
+class CompiledTemplate:
+    """
+    A template pre-split into literal strings and callable segments.
+
+    Attributes:
+        string (str): The original template.
+        parser (FuncParser): The parser providing the callables.
+        segments (list or None): Literal strings and (func, args, raw) tuples,
+            or None if the template must be handed to the parser as-is.
+    """
+
+    __slots__ = ("string", "parser", "segments")
+
+    def __init__(self, string, parser):
+        self.string = string
+        self.parser = parser
+        self.segments = self._compile(string, parser.callables)
+
+    @staticmethod
+    def _compile(string, callables):
+        """Split the string into segments, or return None if unsupported."""
+        if "\\" in string:
+            return None
+
+        segments = []
+        pos = 0
+        for match in _RE_CALL.finditer(string):
+            func = callables.get(match.group(1))
+            if not func:
+                return None
+            if literal := string[pos : match.start()]:
+                segments.append(literal)
+            args = match.group(2)
+            if not _BRACKETS.isdisjoint(args):
+                return None
+            args = tuple(arg.strip() for arg in args.split(",")) if args else ()
+            # the parser drops empty arguments
+            if not all(args):
+                return None
+            segments.append((func, args, match.group(0)))
+            pos = match.end()
+
+        if literal := string[pos:]:
+            segments.append(literal)
+
+        # any leftover markup is more than we know how to compile
+        if any("$" in seg for seg in segments if isinstance(seg, str)):
+            return None
+        return segments
+
+    @property
+    def is_compiled(self):
+        """Whether rendering bypasses the parser entirely."""
+        return self.segments is not None
+
+    def render(self, raise_errors=False, **kwargs):
+        """
+        Render the template.
+
+        Args:
+            raise_errors (bool, optional): Raise the error of a failing call
+                instead of leaving the call unparsed.
+            **kwargs: Reserved kwargs passed to every callable, the same as
+                those given to `FuncParser.parse`.
+
+        Returns:
+            str: The rendered string.
+        """
+        if self.segments is None:
+            return self.parser.parse(
+                self.string, raise_errors=raise_errors, **kwargs
+            )
+
+        kwargs = {
+            **self.parser.default_kwargs,
+            **kwargs,
+            "funcparser": self.parser,
+            "raise_errors": raise_errors,
+        }
+        output = []
+        for segment in self.segments:
+            if isinstance(segment, str):
+                output.append(segment)
+                continue
+            func, args, raw = segment
+            try:
+                output.append(str(func(*args, **kwargs)))
+            except Exception:
+                if raise_errors:
+                    raise
+                # FuncParser leaves failing calls unparsed
+                output.append(raw)
+        return "".join(output)
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_template(string, parser):
+    """
+    Get the compiled form of a template, compiling it on first use.
+
+    Args:
+        string (str): The template to compile.
+        parser (FuncParser): The parser whose callables the template uses.
+
+    Returns:
+        CompiledTemplate: The cached compiled template.
+    """
+    return CompiledTemplate(string, parser)
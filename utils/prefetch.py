@@ -0,0 +1,114 @@
+"""
+Bulk prefetching of attributes and tags.
+
+The first time an object's attribute or tag is read after it is loaded, the
+handler goes to the database, one query per object (or per key, for ones it
+doesn't have). Rendering a crowded room that nobody has looked at since a
+reload then costs a handful of queries per occupant.
+
+`prefetch` loads the attributes and tags of many objects in two queries and
+fills their handler caches, so the reads that follow are served from memory.
+It writes those private caches in the key format Evennia's handlers use, and
+test_prefetch checks that reads still match the handlers' own loading.
+"""
+
+from collections import defaultdict
+
+from evennia.objects.models import ObjectDB
+
+# Handler attributes read while rendering. When an object doesn't have one,
+# the absence is cached too, so asking for it doesn't query.
+PREFETCH_ATTRIBUTES = (
+    "appearance",
+    "clothing",
+    "desc",
+    "equipment",
+    "traits",
+)
+
+# Tag categories looked up while rendering. Once prefetched, they are known
+# to be complete even on objects with no tags in them.
+PREFETCH_TAG_CATEGORIES = (
+    "room_state",
+    "room_x_coordinate",
+    "room_y_coordinate",
+    "room_z_coordinate",
+)
+
+_MODEL = "objectdb"
+
+
+def _fill_attributes(obj, attrs):
+    """Replace an object's attribute cache with the given attributes."""
+    backend = obj.attributes.backend
+    cache = {
+        f"{attr.db_key.lower()}-"
+        f"{attr.db_category.lower() if attr.db_category else None}": attr
+        for attr in attrs
+    }
+    for key in PREFETCH_ATTRIBUTES:
+        cache.setdefault(f"{key}-None", None)
+    backend._cache = cache
+    backend._catcache = {}
+    backend._cache_complete = True
+
+
+def _fill_tags(obj, tags):
+    """Replace an object's tag cache with the given tags."""
+    handler = obj.tags
+    handler._cache = {}
+    handler._catcache = {
+        f"-{category}": True for category in PREFETCH_TAG_CATEGORIES
+    }
+    for tag in tags:
+        category = tag.db_category.lower() if tag.db_category else None
+        handler._cache[f"{tag.db_key.lower()}-{category}"] = tag
+        handler._catcache[f"-{category}"] = True
+    handler._cache_complete = True
+
+
+def prefetch(objs):
+    """
+    Load the attributes and tags of objects in bulk.
+
+    Objects whose caches are already complete are skipped, so calling this
+    on every look is cheap once a room has been seen.
+
+    Args:
+        objs (iterable): The objects to prefetch.
+
+    Returns:
+        int: The number of objects that were prefetched.
+    """
+    pending = {
+        obj.id: obj
+        for obj in objs
+        if not (
+            obj.attributes.backend._cache_complete
+            and obj.tags._cache_complete
+        )
+    }
+    if not pending:
+        return 0
+
+    attrs = defaultdict(list)
+    for conn in ObjectDB.db_attributes.through.objects.filter(
+        objectdb_id__in=pending,
+        attribute__db_model__iexact=_MODEL,
+        attribute__db_attrtype=None,
+    ).select_related("attribute"):
+        attrs[conn.objectdb_id].append(conn.attribute)
+
+    tags = defaultdict(list)
+    for conn in ObjectDB.db_tags.through.objects.filter(
+        objectdb_id__in=pending,
+        tag__db_model=_MODEL,
+        tag__db_tagtype=None,
+    ).select_related("tag"):
+        tags[conn.objectdb_id].append(conn.tag)
+
+    for obj_id, obj in pending.items():
+        _fill_attributes(obj, attrs[obj_id])
+        _fill_tags(obj, tags[obj_id])
+
+    return len(pending)
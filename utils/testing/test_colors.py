@@ -0,0 +1,141 @@
+import random
+import re
+
+from evennia.utils.ansi import ANSIString
+from evennia.utils.test_resources import BaseEvenniaTestCase
+
+from utils.colors import (
+    _hex_to_xterm_cached,
+    _xterm_to_hex_cached,
+    color_cache_stats,
+    hex_to_xterm,
+    xterm_to_hex,
+)
+
+_GREYS = "abcdefghijklmnopqrstuvwxyz"
+
+
+def legacy_hex_to_xterm(message):
+    """The per-match hex_to_xterm, kept as the reference behaviour."""
+
+    def split_hex(text):
+        return (int(text[i : i + 2], 16) for i in range(0, 6, 2))
+
+    def grey_int(num):
+        return round(max((num - 8), 0) / 10)
+
+    def hue_int(num):
+        return round(max((num - 45), 0) / 40)
+
+    for prefix, regex in (
+        ("|", re.compile(r"\|#([0-9a-f]{6})", re.I)),
+        ("|[", re.compile(r"\|\[#([0-9a-f]{6})", re.I)),
+    ):
+        for match in reversed(list(regex.finditer(message))):
+            start, end = match.span()
+            r, g, b = split_hex(match.group(1))
+            if r == g and g == b:
+                xtag = prefix + "=" + _GREYS[grey_int(r)]
+            else:
+                xtag = prefix + f"{hue_int(r)}{hue_int(g)}{hue_int(b)}"
+            message = message[:start] + xtag + message[end:]
+    return message
+
+
+def legacy_xterm_to_hex(message):
+    """The per-match xterm_to_hex, kept as the reference behaviour."""
+
+    def hue_hex(text):
+        return format(int(text) * 40 + 25, "02x")
+
+    def grey_hex(text):
+        return format(_GREYS.index(text) * 10 + 8, "02x")
+
+    for prefix, regex in (
+        ("|#", re.compile(r"\|([0-5][0-5][0-5]|\=[a-z])")),
+        ("|[#", re.compile(r"\|\[([0-5][0-5][0-5]|\=[a-z])")),
+    ):
+        for match in reversed(list(regex.finditer(message))):
+            start, end = match.span()
+            tag = match.group(1)
+            if tag[0] == "=":
+                htag = prefix + grey_hex(tag[1]) * 3
+            else:
+                htag = prefix + "".join(hue_hex(c) for c in tag)
+            message = message[:start] + htag + message[end:]
+    return message
+
+
+def random_message(rng, tag):
+    words = []
+    for _ in range(40):
+        words.append(rng.choice(("|", "|[", "")) + tag(rng) + "word")
+    return " ".join(words)
+
+
+def hex_tag(rng):
+    if rng.random() < 0.3:
+        grey = format(rng.randrange(256), "02x")
+        return "#" + grey * 3
+    return "#" + "".join(rng.choice("0123456789abcdefABCDEF") for _ in range(6))
+
+
+def xterm_tag(rng):
+    if rng.random() < 0.3:
+        return "=" + rng.choice(_GREYS)
+    return "".join(rng.choice("012345") for _ in range(3))
+
+
+class TestColorConversion(BaseEvenniaTestCase):
+    def setUp(self):
+        super().setUp()
+        _hex_to_xterm_cached.cache_clear()
+        _xterm_to_hex_cached.cache_clear()
+
+    def test_converts_hex_tags(self):
+        self.assertEqual(
+            hex_to_xterm("|#FF0000red |[#808080grey |#123456x"),
+            "|500red |[=mgrey |001x",
+        )
+
+    def test_converts_xterm_tags(self):
+        self.assertEqual(
+            xterm_to_hex("|500red |[=mgrey"), "|#e11919red |[#808080grey"
+        )
+
+    def test_matches_legacy_conversion(self):
+        rng = random.Random(40)
+        for _ in range(50):
+            message = random_message(rng, hex_tag)
+            self.assertEqual(
+                hex_to_xterm(message), legacy_hex_to_xterm(message)
+            )
+            message = random_message(rng, xterm_tag)
+            self.assertEqual(
+                xterm_to_hex(message), legacy_xterm_to_hex(message)
+            )
+
+    def test_caches_whole_messages(self):
+        hex_to_xterm("|#ff0000prompt")
+        hex_to_xterm("|#ff0000prompt")
+        xterm_to_hex("|500prompt")
+        stats = color_cache_stats()
+        self.assertEqual(
+            (stats["hex_to_xterm"]["hits"], stats["hex_to_xterm"]["misses"]),
+            (1, 1),
+        )
+        self.assertEqual(stats["xterm_to_hex"]["currsize"], 1)
+
+    def test_skips_cache_for_plain_text(self):
+        self.assertEqual(hex_to_xterm("no colour here"), "no colour here")
+        self.assertEqual(xterm_to_hex("no colour here"), "no colour here")
+        stats = color_cache_stats()
+        self.assertEqual(stats["hex_to_xterm"]["currsize"], 0)
+        self.assertEqual(stats["xterm_to_hex"]["currsize"], 0)
+
+    def test_skips_cache_for_ansistrings(self):
+        # ANSIStrings compare by their clean text, so differently coloured
+        # ones would share a cache entry
+        hex_to_xterm(ANSIString("|#ff0000fox"))
+        hex_to_xterm(ANSIString("|#0000fffox"))
+        self.assertEqual(color_cache_stats()["hex_to_xterm"]["currsize"], 0)
@@ -0,0 +1,88 @@
+import random
+
+from evennia.utils.funcparser import FuncParser
+from evennia.utils.test_resources import BaseEvenniaTestCase
+
+from utils.funcparser import CompiledTemplate
+
+
+def _show(*args, **kwargs):
+    return repr(args)
+
+
+def _fail(*args, **kwargs):
+    raise ValueError("failed")
+
+
+# Pieces of markup combined into random templates, including the argument
+# lists a plain comma split gets wrong.
+TEMPLATE_FRAGMENTS = (
+    "text ",
+    " ",
+    ",",
+    "$show()",
+    "$show( )",
+    "$show(a)",
+    "$show(a, b)",
+    "$show(a,)",
+    "$show(,a)",
+    "$show(a,,b)",
+    "$show(a, [1,2])",
+    "$show({1: 2, 3: 4})",
+    "$show((1, 2))",
+    "$show(1, 2.5, True, None)",
+    "$show(a=1)",
+    "$show('a, b')",
+    "$show($show(a))",
+    "$fail(a)",
+    "$unknown(a)",
+    "$",
+    "\\$show(a)",
+)
+
+
+class TestCompiledTemplate(BaseEvenniaTestCase):
+    def setUp(self):
+        super().setUp()
+        self.parser = FuncParser({"show": _show, "fail": _fail})
+
+    def assertRendersLikeParser(self, template):
+        self.assertEqual(
+            CompiledTemplate(template, self.parser).render(),
+            self.parser.parse(template),
+            repr(template),
+        )
+
+    def test_compiles_plain_calls(self):
+        template = CompiledTemplate("a $show(b, c) d", self.parser)
+        self.assertTrue(template.is_compiled)
+        self.assertEqual(template.render(), "a ('b', 'c') d")
+
+    def test_falls_back_on_args_the_split_gets_wrong(self):
+        for template in (
+            "$show(a,)",
+            "$show(,a)",
+            "$show(a,,b)",
+            "$show( )",
+            "$show(a, [1,2])",
+            "$show({1: 2, 3: 4})",
+        ):
+            self.assertFalse(
+                CompiledTemplate(template, self.parser).is_compiled, template
+            )
+            self.assertRendersLikeParser(template)
+
+    def test_leaves_failing_calls_unparsed(self):
+        self.assertRendersLikeParser("x $fail(a) y")
+        with self.assertRaises(ValueError):
+            CompiledTemplate("$fail(a)", self.parser).render(raise_errors=True)
+
+    def test_matches_parser(self):
+        rng = random.Random(42)
+        for _ in range(2000):
+            self.assertRendersLikeParser(
+                "".join(
+                    rng.choice(TEMPLATE_FRAGMENTS)
+                    for _ in range(rng.randint(0, 6))
+                )
+            )
@@ -0,0 +1,113 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from evennia.utils import create
+from evennia.utils.test_resources import EvenniaTest
+
+from typeclasses.objects import Object
+from utils.prefetch import (
+    PREFETCH_ATTRIBUTES,
+    PREFETCH_TAG_CATEGORIES,
+    prefetch,
+)
+
+
+def read_prefetched(obj):
+    """Read what prefetch covers, which then costs no queries."""
+    return (
+        [obj.attributes.get(key) for key in PREFETCH_ATTRIBUTES],
+        obj.attributes.get("mood", category="feelings"),
+        sorted(obj.attributes.all(), key=lambda attr: attr.id),
+        [
+            obj.tags.get(category=category)
+            for category in PREFETCH_TAG_CATEGORIES
+        ],
+        sorted(obj.tags.all(return_key_and_category=True)),
+    )
+
+
+def read(obj):
+    """Read everything, including keys the object may not have."""
+    return (
+        read_prefetched(obj),
+        obj.attributes.get("mood"),
+        obj.tags.get("shiny"),
+        obj.tags.has("dark", category="room_state"),
+    )
+
+
+class TestPrefetch(EvenniaTest):
+    """
+    Prefetch fills the private caches of Evennia's attribute and tag
+    handlers, so these pin that it matches what the handlers load themselves.
+    """
+
+    object_typeclass = Object
+
+    def setUp(self):
+        super().setUp()
+        self.objs = []
+        for i in range(4):
+            obj = create.create_object(
+                Object, key=f"thing{i}", location=self.room1
+            )
+            obj.attributes.add(
+                "mood", "grim" if i % 2 else "calm", category="feelings"
+            )
+            if i % 2:
+                obj.db.desc = f"Thing {i}."
+                obj.tags.add("dark", category="room_state")
+                obj.tags.add(str(i), category="room_z_coordinate")
+            else:
+                obj.db.mood = "cheery"
+                obj.tags.add("shiny")
+            self.objs.append(obj)
+
+    def reset_caches(self):
+        for obj in self.objs:
+            obj.attributes.reset_cache()
+            obj.tags.reset_cache()
+
+    def count_queries(self, func):
+        with CaptureQueriesContext(connection) as queries:
+            for obj in self.objs:
+                func(obj)
+        return len(queries)
+
+    def test_reads_match_normal_loading(self):
+        self.reset_caches()
+        expected = [read(obj) for obj in self.objs]
+
+        self.reset_caches()
+        self.assertEqual(prefetch(self.objs), len(self.objs))
+        self.assertEqual([read(obj) for obj in self.objs], expected)
+
+    def test_prefetches_in_two_queries(self):
+        self.reset_caches()
+        with CaptureQueriesContext(connection) as queries:
+            prefetch(self.objs)
+        self.assertEqual(len(queries), 2)
+        self.assertEqual(self.count_queries(read_prefetched), 0)
+
+    def test_costs_no_more_than_warm_cache(self):
+        self.reset_caches()
+        self.count_queries(read)
+        warm = self.count_queries(read)
+
+        self.reset_caches()
+        prefetch(self.objs)
+        self.assertLessEqual(self.count_queries(read), warm)
+
+    def test_skips_objects_already_loaded(self):
+        self.reset_caches()
+        prefetch(self.objs)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(prefetch(self.objs), 0)
+        self.assertEqual(len(queries), 0)
+
+    def test_later_writes_are_seen(self):
+        self.reset_caches()
+        prefetch(self.objs)
+        self.objs[0].db.desc = "Changed."
+        self.objs[0].tags.add("dark", category="room_state")
+        self.assertEqual(self.objs[0].attributes.get("desc"), "Changed.")
+        self.assertTrue(self.objs[0].tags.has("dark", category="room_state"))
@@ -0,0 +1,363 @@
+import random
+import re
+import sys
+
+from evennia.utils.ansi import ANSIString
+from evennia.utils.test_resources import BaseEvenniaTestCase, EvenniaTest
+
+from typeclasses.objects import Object
+from utils.text import (
+    GRID_CACHE,
+    WRAP_CACHE,
+    TextCache,
+    extract_color_codes,
+    format_grid,
+    grammarize,
+    numbered_names,
+    numbered_names_stats,
+    reapply_color_codes,
+    wrap,
+)
+
+
+def legacy_grammarize(message):
+    """The regex-per-rule grammarize, kept as the reference behaviour."""
+
+    # Contraction apostrophe correction
+    contractions = {
+        r"\b(cant)\b": "can't",
+        r"\b(couldnt)\b": "couldn't",
+        r"\b(couldve)\b": "could've",
+        r"\b(didnt)\b": "didn't",
+        r"\b(doesnt)\b": "doesn't",
+        r"\b(dont)\b": "don't",
+        r"\b(hadnt)\b": "hadn't",
+        r"\b(hasnt)\b": "hasn't",
+        r"\b(im)\b": "I'm",
+        r"\b(isnt)\b": "isn't",
+        r"\b(itll)\b": "it'll",
+        r"\b(ive)\b": "I've",
+        r"\b(mightve)\b": "might've",
+        r"\b(mustve)\b": "must've",
+        r"\b(shouldnt)\b": "shouldn't",
+        r"\b(shouldve)\b": "should've",
+        r"\b(thats)\b": "that's",
+        r"\b(theres)\b": "there's",
+        r"\b(theyll)\b": "they'll",
+        r"\b(theyre)\b": "they're",
+        r"\b(wasnt)\b": "wasn't",
+        r"\b(weve)\b": "we've",
+        r"\b(wheres)\b": "where's",
+        r"\b(whos)\b": "who's",
+        r"\b(wouldve)\b": "would've",
+    }
+
+    for pattern, replacement in contractions.items():
+        message = re.sub(pattern, replacement, message, flags=re.IGNORECASE)
+
+    # Multiple spaces
+    message = re.sub(r" +", " ", message)
+
+    # Capitalize standalone letter 'i'
+    message = re.sub(r"\bi\b", "I", message)
+
+    # Correcting use of a and an
+    message = re.sub(r"\ba ([aeiou])", r"an \1", message, flags=re.IGNORECASE)
+
+    # Unnecessary space before punctuation
+    message = re.sub(r" ([.,;!?])", r"\1", message)
+
+    # Add period if the message doesn't end with one
+    if not message.endswith(("?", "!", ".", '"', "'")):
+        message += "."
+
+    # Capitalize the beginning of each sentence
+    def capitalize_sentence(t):
+        return t.group(0).capitalize()
+
+    # Regex pattern to match the start of a sentence but not after an ellipsis
+    pattern = r"(^[a-z])|(?<=[.!?]\s)(?<!\.\.\.\s)[a-z]"
+
+    message = re.sub(pattern, capitalize_sentence, message)
+
+    return message
+
+
+# Fragments that exercise every grammarize rule and their interactions.
+GRAMMAR_FRAGMENTS = (
+    "a",
+    "A",
+    "i",
+    "I",
+    "im",
+    "IM",
+    "i'm",
+    "cant",
+    "Dont",
+    "isnt",
+    "ive",
+    "itll",
+    "thats",
+    "whos",
+    "apple",
+    "Egg",
+    "orange",
+    "hello",
+    "the",
+    "x",
+    " ",
+    "  ",
+    ".",
+    ",",
+    "!",
+    "?",
+    ";",
+    "...",
+    "\t",
+    "\n",
+    "'",
+    '"',
+    "é",
+    "İm",
+    "ı",
+)
+
+
+class TestWrap(BaseEvenniaTestCase):
+    def setUp(self):
+        super().setUp()
+        WRAP_CACHE.clear()
+
+    def test_wraps_plain_text(self):
+        self.assertEqual(
+            wrap("The quick brown fox jumps over the lazy dog.", 20),
+            "The quick brown fox \njumps over the lazy \ndog.|n",
+        )
+
+    def test_markup_does_not_count_towards_width(self):
+        self.assertEqual(
+            wrap(
+                "|rThe quick|n brown |#ff8000fox|n jumps over the "
+                "|[#202020lazy|n dog.",
+                20,
+            ),
+            "|rThe quick|n brown |#ff8000fox|n \njumps over the "
+            "|[#202020lazy|n \ndog.|n",
+        )
+
+    def test_hangs_lines_after_pre_text(self):
+        self.assertEqual(
+            wrap(
+                "Hello there, how are you doing today, friend?",
+                30,
+                pre_text='You say, "',
+                hang=2,
+            ),
+            'You say, "Hello there, how \n            are you doing \n'
+            "            today, friend?|n",
+        )
+
+    def test_keeps_manual_line_breaks(self):
+        self.assertEqual(
+            wrap(
+                "First line.|/Second line that is a bit longer.\nThird.",
+                16,
+                indent=2,
+            ),
+            "  First line.\nSecond line \nthat is a bit \nlonger.\nThird.|n",
+        )
+
+    def test_centers_text(self):
+        self.assertEqual(
+            wrap("A centred title", 30, align="c"),
+            "        A centred title|n",
+        )
+
+    def test_wraps_long_coloured_text_line_by_line(self):
+        words = [f"|{i % 6}{i % 5}{i % 4}word|n" for i in range(2000)]
+        lines = wrap(" ".join(words), 40).split("\n")
+        self.assertEqual(len(lines), 250)
+        self.assertEqual(lines[0], " ".join(words[:8]) + " ")
+
+
+class TestTextCache(BaseEvenniaTestCase):
+    def setUp(self):
+        super().setUp()
+        WRAP_CACHE.clear()
+        GRID_CACHE.clear()
+
+    def test_evicts_least_recently_used(self):
+        cache = TextCache(2)
+        cache.set("a", "alpha")
+        cache.set("b", "beta")
+        cache.get("a")
+        cache.set("c", "gamma")
+        self.assertEqual(cache.get("a"), "alpha")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), "gamma")
+
+    def test_tracks_stats_and_memory(self):
+        cache = TextCache(1)
+        cache.get("a")
+        cache.set("a", "alpha")
+        cache.get("a")
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual((stats["size"], stats["maxsize"]), (1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+        nbytes = stats["bytes"]
+        self.assertGreater(nbytes, 0)
+        cache.set("b", "beta")
+        self.assertLess(cache.nbytes, nbytes)
+        self.assertEqual(
+            cache.nbytes, sys.getsizeof("b") + sys.getsizeof("beta")
+        )
+        cache.clear()
+        self.assertEqual(cache.stats()["bytes"], 0)
+        self.assertEqual(cache.stats()["hit_rate"], 0.0)
+
+    def test_wrap_reuses_cached_text(self):
+        text = "The quick brown fox jumps over the lazy dog."
+        self.assertEqual(wrap(text, 20), wrap(text, 20))
+        self.assertEqual(WRAP_CACHE.stats()["hits"], 1)
+        wrap(text, 30)
+        self.assertEqual(WRAP_CACHE.stats()["size"], 2)
+
+    def test_wrap_keys_ansistrings_by_markup(self):
+        # ANSIStrings compare equal by clean text, so must not share entries
+        self.assertEqual(ANSIString("|rfox|n"), ANSIString("|bfox|n"))
+        wrap(ANSIString("|rfox|n"), 20)
+        wrap(ANSIString("|bfox|n"), 20)
+        self.assertEqual(WRAP_CACHE.stats()["size"], 2)
+        self.assertEqual(WRAP_CACHE.stats()["hits"], 0)
+
+    def test_format_grid_reuses_cached_rows(self):
+        elements = ["apple", "pear", "plum", "fig"]
+        rows = format_grid(elements, width=20)
+        rows.append("mutated")
+        self.assertEqual(format_grid(elements, width=20), rows[:-1])
+        self.assertEqual(GRID_CACHE.stats()["hits"], 1)
+        format_grid(elements, width=20, sep=" ")
+        self.assertEqual(GRID_CACHE.stats()["size"], 2)
+        self.assertEqual(format_grid([]), [])
+
+
+class TestGrammarize(BaseEvenniaTestCase):
+    def test_corrects_chat_line(self):
+        self.assertEqual(
+            grammarize("i dont think thats a good idea , do you ?"),
+            "I don't think that's a good idea, do you?",
+        )
+        self.assertEqual(
+            grammarize("im buying a apple.  and a orange"),
+            "I'm buying an apple. And an orange.",
+        )
+
+    def test_does_not_capitalize_after_ellipsis(self):
+        self.assertEqual(grammarize("wait... what"), "Wait... what.")
+
+    def test_matches_legacy_grammarize(self):
+        rng = random.Random(42)
+        for _ in range(20000):
+            message = "".join(
+                rng.choice(GRAMMAR_FRAGMENTS) + rng.choice(("", " ", "  "))
+                for _ in range(rng.randint(0, 12))
+            )
+            self.assertEqual(
+                grammarize(message), legacy_grammarize(message), repr(message)
+            )
+
+
+class TestColorCodes(BaseEvenniaTestCase):
+    def test_extracts_codes_with_offsets(self):
+        self.assertEqual(
+            extract_color_codes("a |rred|n and |#00ff00green|n wolf"),
+            ("a red and green wolf", [(2, "|r"), (10, "|#00ff00")]),
+        )
+
+    def test_extracts_adjacent_codes(self):
+        self.assertEqual(
+            extract_color_codes("|r|#202020|500wolf"),
+            ("wolf", [(0, "|r"), (0, "|#202020"), (0, "|500")]),
+        )
+
+    def test_extracts_nested_codes(self):
+        text = "|rred |bblue|n red|n plain"
+        clean, colors = extract_color_codes(text)
+        self.assertEqual(clean, "red blue red plain")
+        self.assertEqual(colors, [(0, "|r"), (4, "|b")])
+
+    def test_keeps_trailing_pipe(self):
+        self.assertEqual(extract_color_codes("wolf|"), ("wolf|", []))
+
+    def test_reapplies_codes_at_offsets(self):
+        clean, colors = extract_color_codes("|rred|n |#00ff00green")
+        self.assertEqual(
+            reapply_color_codes(clean, colors), "|rred |#00ff00green|n"
+        )
+
+    def test_reapplies_adjacent_codes_after_prefix(self):
+        clean, colors = extract_color_codes("|r|500wolf")
+        self.assertEqual(
+            reapply_color_codes("a " + clean, colors, prefix_length=2),
+            "a |r|500wolf|n",
+        )
+
+    def test_clamps_codes_past_the_end(self):
+        self.assertEqual(
+            reapply_color_codes("wolf", [(2, "|r"), (10, "|b")]),
+            "wo|rlf|b|n",
+        )
+
+    def test_extracts_long_text_in_one_pass(self):
+        clean, colors = extract_color_codes("|rwolf|n " * 10000)
+        self.assertEqual(len(clean), 50000)
+        self.assertEqual(colors[-1], (49995, "|r"))
+        self.assertEqual(
+            reapply_color_codes(clean, colors), "|rwolf " * 10000 + "|n"
+        )
+
+
+class TestNumberedNames(EvenniaTest):
+    object_typeclass = Object
+
+    def setUp(self):
+        super().setUp()
+        numbered_names.cache_clear()
+
+    def test_builds_both_forms(self):
+        self.assertEqual(numbered_names("wolf", 3), ("a wolf", "three wolves"))
+        self.assertEqual(numbered_names("apple", 1), ("an apple", "one apple"))
+        self.assertEqual(
+            numbered_names("sword", 2, no_article=True),
+            ("sword", "two swords"),
+        )
+
+    def test_counts_pairs(self):
+        self.assertEqual(
+            numbered_names("boots", 2), ("boots", "two pairs of boots")
+        )
+
+    def test_keeps_color_codes(self):
+        self.assertEqual(
+            numbered_names("|rred apple", 2),
+            ("a |rred apple|n", "two |rred apples|n"),
+        )
+
+    def test_memoizes_forms(self):
+        numbered_names("wolf", 3)
+        numbered_names("wolf", 3)
+        stats = numbered_names_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_builder_id_suffix_shares_cache_entry(self):
+        # char1 is a builder and sees the #id, char2 doesn't
+        self.assertEqual(
+            self.obj1.get_numbered_name(2, self.char1),
+            (f"an Obj(#{self.obj1.id})", f"two Objs(#{self.obj1.id})"),
+        )
+        self.assertEqual(
+            self.obj1.get_numbered_name(2, self.char2), ("an Obj", "two Objs")
+        )
+        self.assertEqual(numbered_names_stats()["misses"], 1)
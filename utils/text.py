@@ -1,14 +1,25 @@
 import math
 import re
+import sys
+from collections import OrderedDict
+from functools import lru_cache
 
 import inflect
 from django.conf import settings
+from evennia.utils.ansi import ANSIString
 from evennia.utils.utils import display_len, percentile, to_str
 
 from .colors import strip_ansi
 
 _INFLECT = inflect.engine()
 
+# Maximum number of (key, count, no_article) name forms kept in memory.
+NUMBERED_NAME_CACHE_SIZE = 2048
+
+# Maximum number of wrapped texts and formatted grids kept in memory.
+WRAP_CACHE_SIZE = 1024
+GRID_CACHE_SIZE = 256
+
 SINGULARIZE_EXCEPTIONS = [
     "boots",
     "gloves",
@@ -20,6 +31,90 @@ SINGULARIZE_EXCEPTIONS = [
 ]
 
 
+def _sizeof(value):
+    """Approximate the memory held by a cache key or value, in bytes."""
+    size = sys.getsizeof(value)
+    if isinstance(value, (tuple, list)):
+        size += sum(_sizeof(item) for item in value)
+    return size
+
+
+def _cache_key(value):
+    """
+    Make a cache key part for a string. ANSIStrings compare by their clean
+    text, so differently colored ones are keyed by their raw markup.
+    """
+    if isinstance(value, ANSIString):
+        return (ANSIString, value.raw())
+    return value
+
+
+class TextCache:
+    """
+    A bounded LRU cache of rendered text, tracking its own memory usage.
+
+    Args:
+        maxsize (int): The number of entries to keep.
+
+    Attributes:
+        nbytes (int): Approximate bytes held by the cached keys and values.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._data = OrderedDict()
+
+    def get(self, key):
+        """Get a cached value, or None."""
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        """Cache a value, evicting the least recently used if full."""
+        if key in self._data:
+            return
+        self._data[key] = value
+        self.nbytes += _sizeof(key) + _sizeof(value)
+        while len(self._data) > self.maxsize:
+            old_key, old_value = self._data.popitem(last=False)
+            self.nbytes -= _sizeof(old_key) + _sizeof(old_value)
+
+    def clear(self):
+        """Empty the cache and reset its counters."""
+        self._data.clear()
+        self.hits = self.misses = self.nbytes = 0
+
+    def stats(self):
+        """
+        Report the cache's effectiveness and memory usage.
+
+        Returns:
+            dict: hits, misses, size, maxsize, bytes and hit_rate (0.0 - 1.0).
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "bytes": self.nbytes,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+WRAP_CACHE = TextCache(WRAP_CACHE_SIZE)
+GRID_CACHE = TextCache(GRID_CACHE_SIZE)
+
+
 def extract_color_codes(text):
     """
     Extracts color codes and clean text from a string.
@@ -31,28 +126,31 @@ def extract_color_codes(text):
         tuple: (clean_text, list of color positions and codes)
     """
     colors = []
-    clean_text = ""
-    i = 0
-    while i < len(text):
-        if text[i] == "|" and i + 1 < len(text):
-            if text[i + 1] == "n":
-                i += 2
-                continue
-
-            if text[i + 1].isdigit():  # XTERM
-                color_len = 4
-            elif text[i + 1] == "#":  # HEX
-                color_len = 8
-            else:  # ANSI
-                color_len = 2
-
-            colors.append((len(clean_text), text[i : i + color_len]))
-            i += color_len
+    parts = []
+    clean_length = 0
+    pos = 0
+    end = len(text)
+    while (i := text.find("|", pos)) != -1 and i + 1 < end:
+        parts.append(text[pos:i])
+        clean_length += i - pos
+
+        marker = text[i + 1]
+        if marker == "n":
+            pos = i + 2
             continue
 
-        clean_text += text[i]
-        i += 1
-    return clean_text, colors
+        if marker.isdigit():  # XTERM
+            color_len = 4
+        elif marker == "#":  # HEX
+            color_len = 8
+        else:  # ANSI
+            color_len = 2
+
+        colors.append((clean_length, text[i : i + color_len]))
+        pos = i + color_len
+
+    parts.append(text[pos:])
+    return "".join(parts), colors
 
 
 def reapply_color_codes(text, colors, prefix_length=0):
@@ -70,22 +168,22 @@ def reapply_color_codes(text, colors, prefix_length=0):
     if not colors:
         return text
 
-    result = ""
     last_pos = 0
     base_text = text[prefix_length:] if prefix_length else text
-    prefix = text[:prefix_length] if prefix_length else ""
 
     # Add prefix first
-    result = prefix
+    parts = [text[:prefix_length] if prefix_length else ""]
 
     for pos, color in colors:
         # Scale position if text length changed
         scaled_pos = min(pos, len(base_text))
-        result += base_text[last_pos:scaled_pos] + color
+        parts.append(base_text[last_pos:scaled_pos])
+        parts.append(color)
         last_pos = scaled_pos
 
-    result += base_text[last_pos:]
-    return result + "|n"
+    parts.append(base_text[last_pos:])
+    parts.append("|n")
+    return "".join(parts)
 
 
 def extract_id_suffix(text):
@@ -104,67 +202,189 @@ def extract_id_suffix(text):
     return text, ""
 
 
-def grammarize(message):
+@lru_cache(maxsize=NUMBERED_NAME_CACHE_SIZE)
+def numbered_names(key, count, no_article=False):
     """
-    Corrects specific grammatical errors in the input message.
+    Builds the singular and plural forms of a name, preserving color codes.
+
+    Results are memoized, since inflect is slow and the same item names are
+    listed over and over in rooms and inventories.
+
+    Args:
+        key (str): The name, possibly with color codes, without an id suffix.
+        count (int): How many objects the plural form describes.
+        no_article (bool): If True, omit the article in the singular form.
+
+    Returns:
+        tuple: (singular, plural)
     """
+    clean_key, colors = extract_color_codes(key)
+
+    if _INFLECT.singular_noun(clean_key):
+        clean_singular = clean_key
+        prefix = f"{_INFLECT.number_to_words(count)} pairs of "
+        clean_plural = prefix + clean_key
+    else:
+        clean_singular = clean_key if no_article else _INFLECT.an(clean_key)
+        prefix = f"{_INFLECT.number_to_words(count)} "
+        clean_plural = prefix + _INFLECT.plural(clean_key, count)
+
+    singular = reapply_color_codes(
+        clean_singular, colors, len(clean_singular) - len(clean_key)
+    )
+    plural = reapply_color_codes(clean_plural, colors, len(prefix))
+    return singular, plural
 
-    # Contraction apostrophe correction
-    contractions = {
-        r"\b(cant)\b": "can't",
-        r"\b(couldnt)\b": "couldn't",
-        r"\b(couldve)\b": "could've",
-        r"\b(didnt)\b": "didn't",
-        r"\b(doesnt)\b": "doesn't",
-        r"\b(dont)\b": "don't",
-        r"\b(hadnt)\b": "hadn't",
-        r"\b(hasnt)\b": "hasn't",
-        r"\b(im)\b": "I'm",
-        r"\b(isnt)\b": "isn't",
-        r"\b(itll)\b": "it'll",
-        r"\b(ive)\b": "I've",
-        r"\b(mightve)\b": "might've",
-        r"\b(mustve)\b": "must've",
-        r"\b(shouldnt)\b": "shouldn't",
-        r"\b(shouldve)\b": "should've",
-        r"\b(thats)\b": "that's",
-        r"\b(theres)\b": "there's",
-        r"\b(theyll)\b": "they'll",
-        r"\b(theyre)\b": "they're",
-        r"\b(wasnt)\b": "wasn't",
-        r"\b(weve)\b": "we've",
-        r"\b(wheres)\b": "where's",
-        r"\b(whos)\b": "who's",
-        r"\b(wouldve)\b": "would've",
+
+def numbered_names_stats():
+    """
+    Reports how well the numbered_names memo is doing.
+
+    Returns:
+        dict: hits, misses, size, maxsize and hit_rate (0.0 - 1.0).
+    """
+    info = numbered_names.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize,
+        "hit_rate": info.hits / lookups if lookups else 0.0,
     }
 
-    for pattern, replacement in contractions.items():
-        message = re.sub(pattern, replacement, message, flags=re.IGNORECASE)
 
-    # Multiple spaces
-    message = re.sub(r" +", " ", message)
+# Contraction apostrophe correction
+_CONTRACTIONS = {
+    "cant": "can't",
+    "couldnt": "couldn't",
+    "couldve": "could've",
+    "didnt": "didn't",
+    "doesnt": "doesn't",
+    "dont": "don't",
+    "hadnt": "hadn't",
+    "hasnt": "hasn't",
+    "im": "I'm",
+    "isnt": "isn't",
+    "itll": "it'll",
+    "ive": "I've",
+    "mightve": "might've",
+    "mustve": "must've",
+    "shouldnt": "shouldn't",
+    "shouldve": "should've",
+    "thats": "that's",
+    "theres": "there's",
+    "theyll": "they'll",
+    "theyre": "they're",
+    "wasnt": "wasn't",
+    "weve": "we've",
+    "wheres": "where's",
+    "whos": "who's",
+    "wouldve": "would've",
+}
+
+# Every rule of grammarize as one alternation. Whitespace always ends a
+# match, so the text between matches never holds the start of a sentence
+# except at its first character.
+_RE_GRAMMAR = re.compile(
+    # contractions missing their apostrophe
+    r"(?P<contraction>\b(?i:" + "|".join(_CONTRACTIONS) + r")\b)"
+    # standalone letter 'i'
+    r"|(?P<i>\bi\b)"
+    # 'a' before a vowel
+    r"|(?P<article>\b[aA] +(?=(?i:[aeiou])))"
+    # unnecessary space before punctuation
+    r"|(?P<punctuation> +(?=[.,;!?]))"
+    # multiple spaces
+    r"|(?P<spaces> +)"
+    r"|(?P<whitespace>[^\S ])"
+)
+
+
+def _contraction(word):
+    """Get the corrected form of a contraction missing its apostrophe."""
+    if (part := _CONTRACTIONS.get(word.lower())) is not None:
+        return part
+    # characters like the dotted I that only match when ignoring case
+    for contraction, part in _CONTRACTIONS.items():
+        if re.fullmatch(contraction, word, re.IGNORECASE):
+            return part
+
+
+def _starts_sentence(tail):
+    """Check if a lowercase letter written after tail starts a sentence."""
+    if not tail:
+        return True
+    return (
+        len(tail) > 1
+        and tail[-2] in ".!?"
+        and tail[-1].isspace()
+        # not after an ellipsis
+        and tail[-4:-1] != "..."
+    )
 
-    # Capitalize standalone letter 'i'
-    message = re.sub(r"\bi\b", "I", message)
 
-    # Correcting use of a and an
-    message = re.sub(r"\ba ([aeiou])", r"an \1", message, flags=re.IGNORECASE)
+def grammarize(message):
+    """
+    Corrects specific grammatical errors in the input message.
 
-    # Unnecessary space before punctuation
-    message = re.sub(r" ([.,;!?])", r"\1", message)
+    Contractions get their apostrophes, a standalone 'i' is capitalized,
+    'a' becomes 'an' before vowels, runs of spaces and spaces before
+    punctuation are removed, sentences are capitalized and a period is added
+    if the message doesn't end in punctuation. All of it happens in a single
+    scan of the message.
+    """
+    parts = []
+    # the last characters written, to tell where sentences start
+    tail = ""
+    pos = 0
+    # the vowel after a corrected article can't be an article itself
+    vowel = -1
+
+    for match in _RE_GRAMMAR.finditer(message):
+        start = match.start()
+        if start > pos:
+            part = message[pos:start]
+            if "a" <= part[0] <= "z" and _starts_sentence(tail):
+                part = part[0].upper() + part[1:]
+            parts.append(part)
+            tail = (tail + part)[-4:]
+        pos = match.end()
+
+        kind = match.lastgroup
+        if kind == "contraction":
+            part = _contraction(match.group())
+        elif kind == "i":
+            part = "I"
+        elif kind == "article":
+            if start == vowel:
+                part = match.group()[0] + " "
+            else:
+                part = "an "
+                vowel = pos
+        elif kind == "punctuation":
+            continue
+        elif kind == "spaces":
+            part = " "
+        else:
+            part = match.group()
 
-    # Add period if the message doesn't end with one
-    if not message.endswith(("?", "!", ".", '"', "'")):
-        message += "."
+        if "a" <= part[0] <= "z" and _starts_sentence(tail):
+            part = part[0].upper() + part[1:]
+        parts.append(part)
+        tail = (tail + part)[-4:]
 
-    # Capitalize the beginning of each sentence
-    def capitalize_sentence(t):
-        return t.group(0).capitalize()
+    if pos < len(message):
+        part = message[pos:]
+        if "a" <= part[0] <= "z" and _starts_sentence(tail):
+            part = part[0].upper() + part[1:]
+        parts.append(part)
 
-    # Regex pattern to match the start of a sentence but not after an ellipsis
-    pattern = r"(^[a-z])|(?<=[.!?]\s)(?<!\.\.\.\s)[a-z]"
+    message = "".join(parts)
 
-    message = re.sub(pattern, capitalize_sentence, message)
+    # Add period if the message doesn't end with one
+    if not message.endswith(("?", "!", ".", '"', "'")):
+        message += "."
 
     return message
 
@@ -181,72 +401,100 @@ def pluralize(word):
 
 
 def wrap(text, text_width=80, pre_text="", align="l", indent=0, hang=0):
-    # Wrap the text to the terminal width.
+    """
+    Wrap text to the terminal width.
+
+    Results are cached per (text, width, pre_text, align, indent, hang) in
+    WRAP_CACHE, so the same description wrapped for many sessions is only
+    wrapped once.
+    """
     if not text:
         return ""
 
-    text = text.lstrip()
     text_width = text_width if text_width else settings.CLIENT_DEFAULT_WIDTH
+    key = (
+        _cache_key(text),
+        text_width,
+        _cache_key(pre_text),
+        align,
+        indent,
+        hang,
+    )
+    if (wrapped := WRAP_CACHE.get(key)) is None:
+        wrapped = _wrap(text, text_width, pre_text, align, indent, hang)
+        WRAP_CACHE.set(key, wrapped)
+    return wrapped
+
+
+_RE_LINE_BREAK = re.compile(r"\n|\|/")
+_RE_WORD = re.compile(r"((?:\S+\s*)|(?:^\s+))")
+_RE_WORD_CODES = re.compile(
+    r"\|\[?([0-5][0-5][0-5]|\=?[rRyYgGcCbBmMwWxX]|#?[0-9a-f]{6})"
+)
+
+
+def _visible_len(text):
+    """Get the displayed length of text, without its markup."""
+    if "|" in text or "\x1b" in text:
+        return _markup_len(text)
+    return len(text)
+
+
+@lru_cache(maxsize=4096)
+def _markup_len(text):
+    return len(strip_ansi(text))
+
+
+def _wrap(text, text_width, pre_text, align, indent, hang):
+    # Wrap the text to the terminal width. Each word is measured once, and
+    # lines are built as lists, so wrapping is linear in the text's length.
+    # Colour codes are never closed at a line break, so a colour carries on
+    # into the next line as it would without the break.
+    text = text.lstrip()
     final_text = []
+    pre_len = _visible_len(pre_text)
+    line_width = text_width - pre_len
 
     # Cache each manually determined line break
-    text_lines = re.split(r"\n|\|/", text)
-    for text_line in text_lines:
-        line = ""
+    for text_line in _RE_LINE_BREAK.split(text):
+        line = []
         line_list = []
 
         # Determine available characters.
-        available_chars = text_width - len(strip_ansi(pre_text)) - hang
-
-        # Cache each word in the line.
-        word_list = re.findall(r"((?:\S+\s*)|(?:^\s+))", text_line)
+        available_chars = line_width - hang
 
-        for word in word_list:
-            # available_chars += (len(word) - len(strip_ansi(word)))
-            if len(strip_ansi(word)) <= available_chars:
-                line += word
-                available_chars -= len(strip_ansi(word))
+        for word in _RE_WORD.findall(text_line):
+            word_len = _visible_len(word)
+            if word_len <= available_chars:
+                line.append(word)
+                available_chars -= word_len
 
             # Catch words that are too long to fit on a line, for whatever reason.
-            elif len(strip_ansi(word)) > text_width - len(strip_ansi(pre_text)):
-                char_list = re.findall(
-                    # r"(?:\|[0-5]{3}\w)|(?:\|\w{2})|(?:\S)", word
-                    r"\|\[?([0-5][0-5][0-5]|\=?[rRyYgGcCbBmMwWxX]|#?[0-9a-f]{6})",
-                    word,
-                )
-                for char in char_list:
-                    if len(strip_ansi(char)) <= available_chars:
-                        line += char
-                        available_chars -= len(strip_ansi(char))
+            elif word_len > line_width:
+                for char in _RE_WORD_CODES.findall(word):
+                    if len(char) <= available_chars:
+                        line.append(char)
+                        available_chars -= len(char)
                     else:
-                        line += "-"
-                        line_list.append(line)
-                        line = char
-                        available_chars = (
-                            text_width - len(pre_text) - len(strip_ansi(char))
-                        )
+                        line.append("-")
+                        line_list.append("".join(line))
+                        line = [char]
+                        available_chars = text_width - len(pre_text) - len(char)
 
             # If the word doesn't fit, start a new line.
             else:
-                line_list.append(line)
-                line = word
-                available_chars = (
-                    text_width
-                    - len(strip_ansi(pre_text))
-                    - len(strip_ansi(word))
-                )
+                line_list.append("".join(line))
+                line = [word]
+                available_chars = line_width - word_len
         # Add the last line to the list.
-        line_list.append(line)
+        line_list.append("".join(line))
 
         # Justify the text.
-
         for line in line_list:
             if not final_text:
                 line_text = pre_text + justify(line, text_width, align, indent)
             else:
-                line_text = justify(
-                    line, text_width, align, len(strip_ansi(pre_text)), hang
-                )
+                line_text = justify(line, text_width, align, pre_len, hang)
             final_text.append(line_text)
 
     return "\n".join(final_text) + "|n"
@@ -323,7 +571,31 @@ def format_grid(
         list: The grid as a list of ready-formatted rows. We return it
         like this to make it easier to insert decorations between rows, such
         as horizontal bars.
+
+    Notes:
+        Grids are cached in GRID_CACHE per (elements, width, sep, verbatim
+        elements, line prefix).
     """
+    if not elements:
+        return []
+
+    key = (
+        tuple(_cache_key(element) for element in elements),
+        width,
+        sep,
+        tuple(verbatim_elements or ()),
+        _cache_key(line_prefix),
+    )
+    if (rows := GRID_CACHE.get(key)) is None:
+        rows = tuple(
+            _format_grid(elements, width, sep, verbatim_elements, line_prefix)
+        )
+        GRID_CACHE.set(key, rows)
+    return list(rows)
+
+
+def _format_grid(elements, width, sep, verbatim_elements, line_prefix):
+    """Build the rows of a grid, see `format_grid`."""
 
     def _minimal_rows(elements):
         """
@@ -12,6 +12,9 @@ class NautilusStartRoom(XYZRoom):
         super().at_object_creation()
 
     def at_object_receive(self, moved_obj, source_location, move_type="move", **kwargs):
+        super().at_object_receive(
+            moved_obj, source_location, move_type=move_type, **kwargs
+        )
         if not isinstance(moved_obj, characters.Character):
             return
 
@@ -47,6 +50,9 @@ class NautilusInnerHold(XYZRoom):
                 overriding the call (unused by default).
 
         """
+        super().at_object_receive(
+            moved_obj, source_location, move_type=move_type, **kwargs
+        )
 
         if not isinstance(moved_obj, characters.Character):
             return